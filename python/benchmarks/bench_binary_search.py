@@ -0,0 +1,47 @@
+"""
+2分探索のまとめて探索（binary_search_many）のベンチマーク
+
+ソート済みのリストから多数のターゲットを探すとき、
+binary_search をターゲットごとに呼ぶ方法と、binary_search_many で
+ターゲットを並べてから1回の走査で探す方法の実行時間を比較します。
+
+ターゲットの数 m がリストの長さ n に近いほど、指数探索で進む距離が短くなり、
+binary_search_many が有利になります。
+
+実行方法:
+    python benchmarks/bench_binary_search.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from search.binary_search import binary_search, binary_search_many
+
+
+def _measure(func) -> float:
+    """関数の実行時間（秒）を返す"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    n = 1_000_000
+    rng = random.Random(42)
+    data = sorted(rng.randrange(4 * n) for _ in range(n))
+
+    print(f"n = {n}")
+    print(f"{'targets':>10}{'loop':>10}{'many':>10}{'speedup':>10}")
+    for m in (1_000, 100_000, 1_000_000):
+        targets = [rng.randrange(4 * n) for _ in range(m)]
+        loop = _measure(lambda: [binary_search(data, t) for t in targets])
+        many = _measure(lambda: binary_search_many(data, targets))
+        print(f"{m:>10}{loop:>10.3f}{many:>10.3f}{loop / many:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+容量制限付きキャッシュ（BoundedCache）のベンチマーク
+
+偏りのあるアクセス（一部のキーに参照が集中する）を再現し、
+追い出し方針（LRU / LFU）ごとの実行時間とヒット率を比較します。
+参考として、容量制限のない HashTable の実行時間と要素数も表示します。
+
+実行方法:
+    python benchmarks/bench_bounded_cache.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from search.bounded_cache import BoundedCache
+from search.hash_search import HashTable
+
+
+def _measure(func) -> float:
+    """関数の実行時間（秒）を返す"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _run(cache, requests):
+    """キャッシュに無ければ値を作って格納する（遅い処理の結果を覚える使い方）"""
+    for key in requests:
+        if cache.get(key) is None:
+            cache.insert(key, key)
+
+
+def main():
+    n = 1_000_000
+    universe = 200_000
+    capacity = 1_000
+    rng = random.Random(42)
+    # パレート分布で、小さい番号のキーほど頻繁に参照されるようにする
+    requests = [min(int(rng.paretovariate(0.5)) - 1, universe - 1) for _ in range(n)]
+
+    print(f"requests = {n}, distinct keys <= {universe}, capacity = {capacity}")
+    print(f"{'cache':<14}{'time':>8}{'hit rate':>10}{'size':>10}")
+    for policy in ("lru", "lfu"):
+        cache = BoundedCache(capacity, policy=policy)
+        elapsed = _measure(lambda: _run(cache, requests))
+        stats = cache.stats()
+        print(f"{policy:<14}{elapsed:>8.3f}{stats['hit_rate']:>10.3f}{stats['size']:>10}")
+
+    unbounded = HashTable()
+    elapsed = _measure(lambda: _run(unbounded, requests))
+    print(f"{'HashTable':<14}{elapsed:>8.3f}{'-':>10}{len(unbounded):>10}")
+
+
+if __name__ == "__main__":
+    main()
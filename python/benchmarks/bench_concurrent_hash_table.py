@@ -0,0 +1,89 @@
+"""
+スレッドセーフなハッシュテーブルの競合のベンチマーク
+
+1〜32個のスレッドから、読み取り 90%・書き込み 10% の操作を同時に行い、
+次の2つの実行時間（全スレッドの合計のスループット）を比較します。
+- HashTable の全ての呼び出しを1つのグローバルなロックで守る方法
+- ConcurrentHashTable（ストライプごとのロック、ロックを取らない読み取り）
+
+GIL のある CPython では計算そのものは並列に実行されないため、
+差は主にロックの待ち合わせの有無によるものです。
+フリースレッド版の Python（3.13t 以降）では、読み取りも並列に実行されます。
+
+実行方法:
+    python benchmarks/bench_concurrent_hash_table.py
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from search.hash_search import ConcurrentHashTable, HashTable
+
+
+class _GloballyLocked:
+    """HashTable の全ての呼び出しを1つのロックで守るラッパー"""
+
+    def __init__(self):
+        self._table = HashTable()
+        self._lock = threading.Lock()
+
+    def insert(self, key, value):
+        with self._lock:
+            self._table.insert(key, value)
+
+    def search(self, key):
+        with self._lock:
+            return self._table.search(key)
+
+
+def _run(table, threads: int, operations: int, keys: int) -> float:
+    """threads 個のスレッドで合計 operations 回の操作を行い、1秒あたりの操作数を返す"""
+    per_thread = operations // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def work(seed: int):
+        rng = random.Random(seed)
+        plan = [(rng.random() < 0.1, rng.randrange(keys)) for _ in range(per_thread)]
+        insert = table.insert
+        search = table.search
+        barrier.wait()
+        for write, key in plan:
+            if write:
+                insert(key, key)
+            else:
+                search(key)
+
+    workers = [threading.Thread(target=work, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main():
+    keys = 100_000
+    operations = 400_000
+    gil = "disabled" if hasattr(sys, "_is_gil_enabled") and not sys._is_gil_enabled() else "enabled"
+    print(f"{operations} operations (90% read / 10% write), {keys} keys, GIL {gil}")
+    print(f"{'threads':>8}{'global lock ops/s':>20}{'striped ops/s':>16}{'ratio':>8}")
+    for threads in (1, 2, 4, 8, 16, 32):
+        locked = _GloballyLocked()
+        striped = ConcurrentHashTable(stripes=64)
+        for key in range(keys):
+            locked.insert(key, key)
+            striped.insert(key, key)
+        a = _run(locked, threads, operations, keys)
+        b = _run(striped, threads, operations, keys)
+        print(f"{threads:>8}{a:>20,.0f}{b:>16,.0f}{b / a:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+CSR 形式のグラフ（CSRGraph）のベンチマーク
+
+ランダムな有向グラフについて、隣接リスト（Dict[Any, List[Any]]）と
+CSR 形式のメモリ使用量と、BFS / DFS の実行時間を比較します。
+メモリ使用量は tracemalloc で、グラフを作る前後の差を測ります。
+
+実行方法:
+    python benchmarks/bench_csr_graph.py [ノード数] [エッジ数]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graph.bfs import bfs
+from graph.csr_graph import CSRGraph
+from graph.dfs import dfs_iterative
+
+
+def _measure(func) -> float:
+    """関数の実行時間（秒）を返す"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _allocated(build):
+    """build() が返すオブジェクトと、それが確保したメモリのバイト数を返す"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000
+    rng = random.Random(42)
+    sources = [rng.randrange(n) for _ in range(m)]
+    destinations = [rng.randrange(n) for _ in range(m)]
+    # ノードの名前は文字列にする（実際のグラフでは ID や名前をノードにすることが多い）
+    names = [f"user-{i}" for i in range(n)]
+
+    def build_dict():
+        g = {name: [] for name in names}
+        for s, d in zip(sources, destinations):
+            g[names[s]].append(names[d])
+        return g
+
+    graph, dict_bytes = _allocated(build_dict)
+    csr, csr_bytes = _allocated(lambda: CSRGraph.from_adjacency(graph))
+    start = names[0]
+
+    print(f"nodes = {n}, edges = {m}")
+    print(f"{'form':<10}{'memory (MB)':>14}{'bfs (s)':>10}{'dfs (s)':>10}")
+    print(f"{'dict':<10}{dict_bytes / 1e6:>14.1f}"
+          f"{_measure(lambda: bfs(graph, start)):>10.3f}"
+          f"{_measure(lambda: dfs_iterative(graph, start)):>10.3f}")
+    print(f"{'csr':<10}{csr_bytes / 1e6:>14.1f}"
+          f"{_measure(lambda: bfs(csr, start)):>10.3f}"
+          f"{_measure(lambda: dfs_iterative(csr, start)):>10.3f}")
+    print(f"(csr arrays only: {csr.nbytes() / 1e6:.1f} MB; the rest is the node name table)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+再帰を使わない深さ優先探索（dfs_events）を使うアルゴリズムのベンチマーク
+
+- 鎖のようなグラフで、再帰版の dfs_recursive が再帰の上限に達することを確認する
+- dfs_iterative（各ノードを1回だけスタックに積む）の実行時間
+- トポロジカルソートと強連結成分分解（反復版 Tarjan）の実行時間
+
+実行方法:
+    python benchmarks/bench_dfs_events.py [ノード数]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graph.dfs import dfs_iterative, dfs_recursive
+from graph.scc import strongly_connected_components
+from graph.topological_sort import topological_sort
+
+
+def _measure(func) -> float:
+    """関数の実行時間（秒）を返す"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    chain = {i: [i + 1] for i in range(n - 1)}
+    # 番号の小さいノードから大きいノードへの辺だけを持つ DAG
+    dag = {i: [rng.randrange(i + 1, n) for _ in range(3)] if i < n - 1 else [] for i in range(n)}
+    # ランダムな有向グラフ（大きな強連結成分ができる）
+    digraph = {i: [rng.randrange(n) for _ in range(3)] for i in range(n)}
+
+    try:
+        dfs_recursive(chain, 0)
+        print("dfs_recursive on chain: ok")
+    except RecursionError:
+        print(f"dfs_recursive on chain: RecursionError (limit {sys.getrecursionlimit()})")
+
+    print(f"nodes = {n}")
+    print(f"{'operation':<32}{'time':>8}")
+    print(f"{'dfs_iterative (chain)':<32}{_measure(lambda: dfs_iterative(chain, 0)):>8.3f}")
+    print(f"{'dfs_iterative (random digraph)':<32}{_measure(lambda: dfs_iterative(digraph, 0)):>8.3f}")
+    print(f"{'topological_sort (chain)':<32}{_measure(lambda: topological_sort(chain)):>8.3f}")
+    print(f"{'topological_sort (DAG)':<32}{_measure(lambda: topological_sort(dag)):>8.3f}")
+    print(f"{'scc (random digraph)':<32}{_measure(lambda: strongly_connected_components(digraph)):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+方向最適化幅優先探索（direction_optimizing_bfs）のベンチマーク
+
+次数が大きく直径の小さい無向のランダムグラフ（SNS のようなグラフ）について、
+トップダウン型だけの BFS（CSRGraph.bfs）と、方向最適化 BFS の実行時間を比較します。
+エッジを逆向きにしたグラフ（transpose）を作る時間は、別に表示します。
+
+実行方法:
+    python benchmarks/bench_direction_optimizing_bfs.py [ノード数] [平均次数]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graph.csr_graph import CSRGraph
+from graph.direction_optimizing_bfs import direction_optimizing_bfs
+
+
+def _measure(func) -> float:
+    """関数の実行時間（秒）を返す"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    degree = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    rng = random.Random(42)
+
+    adjacency = [[] for _ in range(n)]
+    for u in range(n):
+        for _ in range(degree // 2):
+            v = rng.randrange(n)
+            adjacency[u].append(v)
+            adjacency[v].append(u)
+
+    # ノードの名前に番号をそのまま使う（名前の対応表を持たない）グラフにする
+    offsets = [0]
+    targets = []
+    for neighbors in adjacency:
+        targets.extend(neighbors)
+        offsets.append(len(targets))
+    graph = CSRGraph(offsets, targets)
+    del adjacency, targets
+
+    print(f"nodes = {n}, edges = {graph.edge_count}")
+    print(f"{'method':<22}{'time':>8}")
+    print(f"{'transpose':<22}{_measure(graph.transpose):>8.3f}")
+    top_down = _measure(lambda: graph.bfs(0))
+    optimized = _measure(lambda: direction_optimizing_bfs(graph, 0))
+    print(f"{'top-down bfs':<22}{top_down:>8.3f}")
+    print(f"{'direction-optimizing':<22}{optimized:>8.3f}")
+    print(f"speedup: {top_down / optimized:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
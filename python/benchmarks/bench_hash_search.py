@@ -0,0 +1,66 @@
+"""
+ハッシュテーブルのまとめて操作（insert_many / get_many / delete_many）のベンチマーク
+
+多数のキーと値のペアについて、insert / search / delete を1件ずつ呼ぶ方法と、
+まとめて操作するメソッドを呼ぶ方法の実行時間を比較します。
+参考として、組み込みの dict の実行時間も表示します。
+
+実行方法:
+    python benchmarks/bench_hash_search.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from search.hash_search import HashTable
+
+
+def _measure(func) -> float:
+    """関数の実行時間（秒）を返す"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    n = 1_000_000
+    rng = random.Random(42)
+    keys = [f"key-{rng.getrandbits(48)}" for _ in range(n)]
+    pairs = [(k, i) for i, k in enumerate(keys)]
+
+    one = HashTable()
+    many = HashTable()
+    builtin = {}
+
+    def insert_one():
+        for k, v in pairs:
+            one.insert(k, v)
+
+    def search_one():
+        for k in keys:
+            one.search(k)
+
+    def delete_one():
+        for k in keys:
+            one.delete(k)
+
+    rows = [
+        ("insert", _measure(insert_one), _measure(lambda: many.insert_many(pairs)),
+         _measure(lambda: builtin.update(pairs))),
+        ("search", _measure(search_one), _measure(lambda: many.get_many(keys)),
+         _measure(lambda: [builtin.get(k) for k in keys])),
+        ("delete", _measure(delete_one), _measure(lambda: many.delete_many(keys)),
+         _measure(lambda: [builtin.pop(k, None) for k in keys])),
+    ]
+    print(f"n = {n}")
+    print(f"{'operation':<10}{'one-by-one':>12}{'bulk':>10}{'speedup':>10}{'dict':>10}")
+    for name, single, bulk, reference in rows:
+        print(f"{name:<10}{single:>12.3f}{bulk:>10.3f}{single / bulk:>10.2f}{reference:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+線形探索の高速パスと複数ターゲットの探索のベンチマーク
+
+- linear_search: Python のループ（enumerate）と、list.index / NumPy による高速パス
+- find_any: ターゲットごとに linear_search を呼ぶ方法と、set を使って1回だけ走査する方法
+の実行時間を比較します。
+
+実行方法:
+    python benchmarks/bench_linear_search.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from search.linear_search import find_any, linear_search
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _measure(func) -> float:
+    """関数の実行時間（秒）を返す"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _loop_search(data, target):
+    """高速パスを使わない、元の enumerate によるループ"""
+    for i, value in enumerate(data):
+        if value == target:
+            return i
+    return -1
+
+
+def main():
+    n = 10_000_000
+    data = list(range(n))
+    target = n - 1
+
+    print(f"linear_search: n = {n}, target at the end")
+    print(f"{'method':<16}{'time':>10}")
+    print(f"{'enumerate loop':<16}{_measure(lambda: _loop_search(data, target)):>10.3f}")
+    print(f"{'list.index':<16}{_measure(lambda: linear_search(data, target)):>10.3f}")
+    if np is not None:
+        arr = np.arange(n)
+        print(f"{'numpy':<16}{_measure(lambda: linear_search(arr, target)):>10.3f}")
+
+    m = 100
+    data = list(range(100_000))
+    targets = [-i for i in range(1, m + 1)]
+    print()
+    print(f"find_any: n = {len(data)}, {m} targets (all missing)")
+    print(f"{'method':<16}{'time':>10}")
+    print(f"{'per target':<16}{_measure(lambda: [linear_search(data, t) for t in targets]):>10.3f}")
+    print(f"{'find_any':<16}{_measure(lambda: find_any(data, targets)):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
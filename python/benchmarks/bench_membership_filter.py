@@ -0,0 +1,67 @@
+"""
+所属判定フィルタ（ブルームフィルタ / カッコウフィルタ）のベンチマーク
+
+ほとんどが見つからない探索について、フィルタで先に確認する場合と
+確認しない場合の実行時間を比較します。
+- linear_search: リストの全要素の走査をフィルタで省ける
+- HashTable.search: 見つからないキーの探査をフィルタで打ち切れる
+  （ただし HashTable の探査はもともと短いため、フィルタのハッシュ計算の方が
+  高くつく場合もある）
+
+実行方法:
+    python benchmarks/bench_membership_filter.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from search.hash_search import HashTable
+from search.linear_search import linear_search
+from search.membership_filter import BloomFilter, CuckooFilter
+
+
+def _measure(func) -> float:
+    """関数の実行時間（秒）を返す"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(42)
+
+    # linear_search: 1万要素のリストに対して、9割が見つからない探索
+    n = 10_000
+    data = [f"key-{rng.getrandbits(48)}" for _ in range(n)]
+    queries = [rng.choice(data) if i % 10 == 0 else f"miss-{i}" for i in range(2_000)]
+    print(f"linear_search: n = {n}, queries = {len(queries)} (90% misses)")
+    print(f"{'filter':<10}{'time':>10}")
+    print(f"{'none':<10}{_measure(lambda: [linear_search(data, q) for q in queries]):>10.3f}")
+    for name, f in (("bloom", BloomFilter(n)), ("cuckoo", CuckooFilter(n))):
+        f.update(data)
+        elapsed = _measure(lambda: [linear_search(data, q, prefilter=f) for q in queries])
+        print(f"{name:<10}{elapsed:>10.3f}")
+
+    # HashTable.search: 100万要素に対して、9割が見つからない探索
+    n = 1_000_000
+    keys = [f"key-{rng.getrandbits(48)}" for _ in range(n)]
+    queries = [rng.choice(keys) if i % 10 == 0 else f"miss-{i}" for i in range(n)]
+    print()
+    print(f"HashTable.search: n = {n}, queries = {len(queries)} (90% misses)")
+    print(f"{'filter':<10}{'time':>10}{'bytes':>12}")
+    for name, f in (("none", None), ("bloom", BloomFilter(n)), ("cuckoo", CuckooFilter(n))):
+        ht = HashTable()
+        ht.insert_many((k, i) for i, k in enumerate(keys))
+        if f is not None:
+            ht.attach_filter(f)
+        size = len(f.to_bytes()) if f is not None else 0
+        elapsed = _measure(lambda: [ht.search(q) for q in queries])
+        print(f"{name:<10}{elapsed:>10.3f}{size:>12}")
+
+
+if __name__ == "__main__":
+    main()
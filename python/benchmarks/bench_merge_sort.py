@@ -0,0 +1,63 @@
+"""
+マージソートのベンチマーク（メモリ使用量）
+
+再帰版の merge_sort とボトムアップ版の merge_sort_bottom_up について、
+tracemalloc で計測したピークメモリと実行時間を比較します。
+
+ボトムアップ版は作業用バッファを1つだけ確保するため、
+ピークメモリは入力とほぼ同じ大きさ（入力と合わせて約2n）に収まります。
+
+実行方法:
+    python benchmarks/bench_merge_sort.py
+"""
+
+import array
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from sort.merge_sort import merge_sort, merge_sort_bottom_up
+
+
+def _measure(sorter, make):
+    """ソートの実行時間（秒）と、追加で確保されたピークメモリ（バイト）を返す"""
+    # tracemalloc は実行時間に大きく影響するため、時間とメモリは別々に測る
+    data = make()
+    start = time.perf_counter()
+    sorter(data)
+    elapsed = time.perf_counter() - start
+
+    data = make()
+    tracemalloc.start()
+    sorter(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    n = 100_000
+    rng = random.Random(42)
+    values = [rng.randint(0, 1 << 30) for _ in range(n)]
+
+    # 入力そのものの大きさ（リストが保持するポインタ配列）の目安
+    input_bytes = sys.getsizeof(values)
+
+    cases = [
+        ("merge_sort (list)", merge_sort, lambda: list(values)),
+        ("bottom_up (list)", merge_sort_bottom_up, lambda: list(values)),
+        ("bottom_up (array)", merge_sort_bottom_up, lambda: array.array('q', values)),
+    ]
+    print(f"n = {n}, input list size = {input_bytes / 1e6:.1f} MB")
+    print(f"{'case':<20}{'seconds':>10}{'peak MB':>10}{'peak/input':>12}")
+    for name, sorter, make in cases:
+        elapsed, peak = _measure(sorter, make)
+        print(f"{name:<20}{elapsed:>10.3f}{peak / 1e6:>10.1f}{peak / input_bytes:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
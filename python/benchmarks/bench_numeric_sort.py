@@ -0,0 +1,68 @@
+"""
+数値配列の高速化（NumPy へのディスパッチ）のベンチマーク
+
+同じ値を list と numpy.ndarray / array.array で渡し、
+純粋な Python の実装と NumPy のベクトル化された実装の実行時間を比較します。
+
+実行方法:
+    python benchmarks/bench_numeric_sort.py
+"""
+
+import array
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import numpy as np
+
+from search.binary_search import binary_search
+from sort.heap_sort import heap_sort
+from sort.quick_sort import quick_sort
+from sort.tim_sort import tim_sort
+
+
+def _measure(func, make) -> float:
+    """入力を作り直してから関数を実行し、実行時間（秒）を返す"""
+    data = make()
+    start = time.perf_counter()
+    func(data)
+    return time.perf_counter() - start
+
+
+def main():
+    n = 200_000
+    rng = random.Random(42)
+    values = [rng.randint(-(1 << 40), 1 << 40) for _ in range(n)]
+    ordered = sorted(values)
+    targets = [rng.choice(values) for _ in range(10_000)]
+
+    def search_all(data):
+        for t in targets:
+            binary_search(data, t)
+
+    makers = {
+        "list": lambda: list(values),
+        "ndarray": lambda: np.array(values, dtype=np.int64),
+        "array.array": lambda: array.array('q', values),
+    }
+    print(f"n = {n}")
+    print(f"{'function':<16}" + "".join(f"{name:>14}" for name in makers))
+    for func in (quick_sort, heap_sort, tim_sort):
+        times = [_measure(func, make) for make in makers.values()]
+        print(f"{func.__name__:<16}" + "".join(f"{t:>14.3f}" for t in times))
+
+    search_makers = [
+        lambda: list(ordered),
+        lambda: np.array(ordered, dtype=np.int64),
+        lambda: array.array('q', ordered),
+    ]
+    times = [_measure(search_all, make) for make in search_makers]
+    print(f"{'binary_search*':<16}" + "".join(f"{t:>14.3f}" for t in times))
+    print(f"* {len(targets)} lookups")
+
+
+if __name__ == "__main__":
+    main()
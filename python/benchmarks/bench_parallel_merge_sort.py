@@ -0,0 +1,39 @@
+"""
+並列マージソートのベンチマーク（スケーリング）
+
+ワーカー数を 1, 2, 4, 8, 16 と変えながら parallel_merge_sort の実行時間を測定し、
+ワーカー1つの場合に対する速度向上率を表示します。
+
+実行方法:
+    python benchmarks/bench_parallel_merge_sort.py [要素数]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from sort.parallel_merge_sort import parallel_merge_sort
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    data = [rng.randint(0, 1 << 40) for _ in range(n)]
+
+    print(f"n = {n}, cpu_count = {os.cpu_count()}")
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}")
+    baseline = None
+    for workers in (1, 2, 4, 8, 16):
+        start = time.perf_counter()
+        parallel_merge_sort(data, workers=workers)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = elapsed
+        print(f"{workers:>8}{elapsed:>10.3f}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
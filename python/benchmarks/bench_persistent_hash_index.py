@@ -0,0 +1,77 @@
+"""
+永続ハッシュインデックスの起動時間（コールドスタート）のベンチマーク
+
+新しいプロセスを起動して最初の検索ができるようになるまでの時間を、次の2つで比較します。
+- 起動のたびにタブ区切りのファイルを読み込み、HashTable を作り直す方法
+- build_hash_index で作成済みのファイルを PersistentHashIndex（mmap）で開く方法
+
+どちらもプロセスの起動時間（Python インタプリタの起動）を含みます。
+ファイルは直前に作成しているため、OS のページキャッシュには載った状態です。
+
+実行方法:
+    python benchmarks/bench_persistent_hash_index.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+sys.path.append(SRC)
+
+from search.persistent_hash_index import build_hash_index
+
+# 各方式で、新しいプロセスが実行するコード（1000件を検索して終了する）
+_REBUILD = """
+import sys
+sys.path.insert(0, {src!r})
+from search.hash_search import HashTable
+table = HashTable()
+with open({tsv!r}, encoding="utf-8") as f:
+    table.insert_many(line.rstrip("\\n").split("\\t", 1) for line in f)
+for i in range(0, {n}, {n} // 1000):
+    table.search(f"key-{{i}}")
+"""
+
+_MMAP = """
+import sys
+sys.path.insert(0, {src!r})
+from search.persistent_hash_index import PersistentHashIndex
+index = PersistentHashIndex({index!r})
+for i in range(0, {n}, {n} // 1000):
+    index.search(f"key-{{i}}")
+"""
+
+
+def _run(code: str) -> float:
+    """新しいプロセスでコードを実行し、終了までの時間（秒）を返す"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'keys':>10}{'build (s)':>12}{'index MB':>10}{'rebuild (s)':>13}{'mmap (s)':>10}{'speedup':>10}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for n in (100_000, 1_000_000):
+            tsv = os.path.join(work_dir, "pairs.tsv")
+            index = os.path.join(work_dir, "index.bin")
+            with open(tsv, "w", encoding="utf-8") as f:
+                for i in range(n):
+                    f.write(f"key-{i}\tvalue-{i * 7}\n")
+
+            start = time.perf_counter()
+            with open(tsv, encoding="utf-8") as f:
+                build_hash_index(index, (line.rstrip("\n").split("\t", 1) for line in f))
+            build = time.perf_counter() - start
+
+            rebuild = _run(_REBUILD.format(src=SRC, tsv=tsv, n=n))
+            mapped = _run(_MMAP.format(src=SRC, index=index, n=n))
+            size = os.path.getsize(index) / 1e6
+            print(f"{n:>10}{build:>12.2f}{size:>10.1f}{rebuild:>13.2f}{mapped:>10.2f}{rebuild / mapped:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+クイックソートのベンチマーク
+
+ソート済み・逆順・重複だらけ・ランダムの4種類の入力について、
+要素数を2倍ずつ増やしながら quick_sort（イントロソート）の実行時間を測定します。
+
+n log n で増加していれば、要素数が2倍になったときの時間比はおよそ2強になります。
+O(n²) に劣化している場合は、時間比がおよそ4になります。
+
+実行方法:
+    python benchmarks/bench_quick_sort.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from sort.quick_sort import quick_sort
+
+
+def _make_inputs(n: int):
+    """ベンチマーク用の入力データを種類ごとに作成する"""
+    rng = random.Random(42)
+    return {
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "duplicates": [rng.randint(0, 9) for _ in range(n)],
+        "random": [rng.random() for _ in range(n)],
+    }
+
+
+def _measure(data) -> float:
+    """1回のソートにかかった時間（秒）を返す"""
+    start = time.perf_counter()
+    quick_sort(data)
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [10_000, 20_000, 40_000, 80_000]
+    previous = {}
+    print(f"{'input':<12}{'n':>10}{'seconds':>12}{'ratio':>8}")
+    for n in sizes:
+        for name, data in _make_inputs(n).items():
+            elapsed = _measure(data)
+            # 直前の要素数との時間比（n log n なら約2、n² なら約4）
+            ratio = elapsed / previous[name] if name in previous else float("nan")
+            previous[name] = elapsed
+            print(f"{name:<12}{n:>10}{elapsed:>12.4f}{ratio:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+選択アルゴリズムのベンチマーク
+
+n 件の中から上位 100 件を求める処理について、
+merge_sort で全体をソートしてからスライスする方法と、
+select_kth / partial_sort / top_k を比較します。
+
+実行方法:
+    python benchmarks/bench_selection.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from sort.merge_sort import merge_sort
+from sort.selection import partial_sort, select_kth, top_k
+
+
+def _measure(func) -> float:
+    """関数の実行時間（秒）を返す"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    n = 200_000
+    k = 100
+    rng = random.Random(42)
+    data = [rng.random() for _ in range(n)]
+
+    cases = [
+        ("merge_sort + slice", lambda: merge_sort(data, reverse=True)[:k]),
+        ("select_kth", lambda: select_kth(data[:], n - k)),
+        ("partial_sort", lambda: partial_sort([-v for v in data], k)[:k]),
+        ("top_k", lambda: top_k(data, k)),
+    ]
+    print(f"n = {n}, k = {k}")
+    print(f"{'method':<22}{'seconds':>10}")
+    for name, func in cases:
+        print(f"{name:<22}{_measure(func):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
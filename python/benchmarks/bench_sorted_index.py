@@ -0,0 +1,57 @@
+"""
+Eytzinger 配置の探索インデックス（SortedIndex）のベンチマーク
+
+同じソート済みデータに対してランダムなターゲットを繰り返し探すとき、
+リストに対する binary_search と SortedIndex.search の実行時間を比較します。
+
+データの大きさはコマンドライン引数で指定できます（既定は 1M と 10M）。
+100M 件では Python の int のリストだけで数 GB のメモリを使うため、
+十分なメモリがある環境でのみ指定してください。
+
+実行方法:
+    python benchmarks/bench_sorted_index.py
+    python benchmarks/bench_sorted_index.py 1000000 10000000 100000000
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from search.binary_search import binary_search
+from search.sorted_index import SortedIndex
+
+
+def _measure(func) -> float:
+    """関数の実行時間（秒）を返す"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000]
+    queries = 200_000
+    rng = random.Random(42)
+
+    print(f"{queries} lookups per size")
+    print(f"{'n':>12}{'build':>10}{'binary':>10}{'index':>10}{'speedup':>10}")
+    for n in sizes:
+        # 偶数だけのデータにして、約半分のターゲットが見つからないようにする
+        data = list(range(0, 2 * n, 2))
+        targets = [rng.randrange(2 * n) for _ in range(queries)]
+
+        start = time.perf_counter()
+        index = SortedIndex(data)
+        build = time.perf_counter() - start
+
+        binary = _measure(lambda: [binary_search(data, t) for t in targets])
+        eytzinger = _measure(lambda: index.search_many(targets))
+        print(f"{n:>12}{build:>10.2f}{binary:>10.3f}{eytzinger:>10.3f}{binary / eytzinger:>10.2f}")
+        del data, index
+
+
+if __name__ == "__main__":
+    main()
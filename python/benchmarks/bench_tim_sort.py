@@ -0,0 +1,81 @@
+"""
+ティムソートのベンチマーク
+
+ソート済みの塊を連結したデータ・ほぼソート済みのデータ・ランダムなデータについて、
+merge_sort と tim_sort の比較回数と実行時間を比較します。
+
+ほぼソート済みのデータでは、tim_sort の比較回数は n に近い値になります。
+
+実行方法:
+    python benchmarks/bench_tim_sort.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from sort.merge_sort import merge_sort
+from sort.tim_sort import tim_sort
+
+
+class _Counted:
+    """比較回数を数えるためのラッパー"""
+
+    comparisons = 0
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        _Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        _Counted.comparisons += 1
+        return self.value <= other.value
+
+
+def _make_inputs(n: int):
+    """ベンチマーク用の入力データを種類ごとに作成する"""
+    rng = random.Random(42)
+    chunks = []
+    for _ in range(8):
+        chunks.extend(sorted(rng.random() for _ in range(n // 8)))
+    nearly = list(range(n))
+    for _ in range(n // 100):
+        i = rng.randrange(n)
+        j = rng.randrange(n)
+        nearly[i], nearly[j] = nearly[j], nearly[i]
+    return {
+        "8 sorted chunks": chunks,
+        "nearly sorted": nearly,
+        "random": [rng.random() for _ in range(n)],
+    }
+
+
+def _measure(sorter, values):
+    """比較回数と実行時間（秒）を返す"""
+    data = [_Counted(v) for v in values]
+    _Counted.comparisons = 0
+    start = time.perf_counter()
+    sorter(data)
+    return _Counted.comparisons, time.perf_counter() - start
+
+
+def main():
+    n = 100_000
+    print(f"n = {n}")
+    print(f"{'input':<18}{'sorter':<12}{'compares':>12}{'per n':>8}{'seconds':>10}")
+    for name, values in _make_inputs(n).items():
+        for sorter in (merge_sort, tim_sort):
+            compares, elapsed = _measure(sorter, values)
+            print(f"{name:<18}{sorter.__name__:<12}{compares:>12}{compares / n:>8.2f}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,20 @@
 
 このモジュールは、グラフや木構造を探索するための幅優先探索アルゴリズムを
 実装しています。キューを使用してレベル順に探索を行います。
+- bfs: 訪問順のノードリストを求める
+- bfs_distances / bfs_parents: 各ノードまでの距離（辺の数）や、最短経路の木の親を求める
+- shortest_path / bidirectional_shortest_path: 2つのノードの間の最短経路を求める
+- multi_source_bfs: 複数の開始ノードのうち、最も近いものからの距離を求める
+- iter_bfs: 訪問したノードを1つずつ返すジェネレータ（途中で打ち切れる）
 """
 
-from typing import Dict, List, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 from collections import deque
 
+from graph.csr_graph import CSRGraph
 
-def bfs(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
+
+def bfs(graph: Union[Dict[Any, List[Any]], CSRGraph], start: Any) -> List[Any]:
     """
     幅優先探索（BFS: Breadth-First Search）
     
@@ -30,13 +37,18 @@ def bfs(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
     時間計算量: O(V + E) - Vはノード数、Eはエッジ数
     空間計算量: O(V) - 訪問済みセット + キュー
     
+    CSRGraph を渡した場合は、CSR 形式の配列の上で探索します（CSRGraph.bfs）。
+    
     Args:
-        graph: 隣接リスト表現のグラフ {node: [neighbors]}
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
         start: 開始ノード
         
     Returns:
         訪問順のノードリスト
     """
+    if isinstance(graph, CSRGraph):
+        return graph.bfs(start)
+    
     # 訪問済みノードを記録するセット
     # set を使用することで、O(1) で訪問済みかどうかを確認できる
     visited = set()
@@ -75,3 +87,283 @@ def bfs(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
                     queue.append(neighbor)
                     
     return result
+
+
+# 隣接リストのグラフ、または CSRGraph
+Graph = Union[Dict[Any, List[Any]], CSRGraph]
+
+# _bfs_tree で「目的のノードを指定しない」ことを表す目印（None もノードとして使えるようにする）
+_NO_TARGET = object()
+
+
+def _neighbors_of(graph: Graph) -> Callable[[Any], Iterable[Any]]:
+    """ノードの隣接ノードを返す関数を返す（隣接リストに無いノードは隣接ノードなし）"""
+    if isinstance(graph, CSRGraph):
+        return graph.neighbors
+    return lambda node: graph.get(node, ())
+
+
+def _bfs_tree(
+    graph: Graph,
+    sources: Iterable[Any],
+    target: Any = _NO_TARGET,
+) -> Tuple[Dict[Any, Any], Dict[Any, int]]:
+    """
+    bfs と同じキューの処理で、各ノードの親と距離を1回の探索で求める
+
+    Args:
+        graph: 隣接リスト表現のグラフ、または CSRGraph
+        sources: 開始ノード（複数可、全て距離 0）
+        target: 見つけた時点で探索を打ち切るノード（省略した場合は全て探索する）
+
+    Returns:
+        Tuple[Dict[Any, Any], Dict[Any, int]]: (親の辞書, 距離の辞書)
+            開始ノードの親は None
+    """
+    neighbors_of = _neighbors_of(graph)
+    # 親の辞書が訪問済みのセットを兼ねる
+    parent: Dict[Any, Any] = {}
+    distance: Dict[Any, int] = {}
+    queue = deque()
+    for source in sources:
+        if source not in parent:
+            parent[source] = None
+            distance[source] = 0
+            queue.append(source)
+    if target is not _NO_TARGET and target in parent:
+        return parent, distance
+
+    while queue:
+        node = queue.popleft()
+        d = distance[node] + 1
+        for neighbor in neighbors_of(node):
+            if neighbor not in parent:
+                parent[neighbor] = node
+                distance[neighbor] = d
+                # 目的のノードは見つけた時点で最短距離が確定するので、
+                # キューから取り出すのを待たずに打ち切る
+                if target is not _NO_TARGET and neighbor == target:
+                    return parent, distance
+                queue.append(neighbor)
+    return parent, distance
+
+
+def _path_to(parent: Dict[Any, Any], node: Any) -> List[Any]:
+    """親をたどって、開始ノードから node までの経路を返す"""
+    path = [node]
+    while parent[node] is not None:
+        node = parent[node]
+        path.append(node)
+    path.reverse()
+    return path
+
+
+def bfs_distances(graph: Graph, start: Any) -> Dict[Any, int]:
+    """
+    開始ノードから到達できる各ノードまでの最短距離（辺の数）を求めます。
+
+    時間計算量: O(V + E)
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+        start: 開始ノード
+
+    Returns:
+        Dict[Any, int]: {ノード: 距離}（到達できないノードは含まない）
+    """
+    return _bfs_tree(graph, [start])[1]
+
+
+def bfs_parents(graph: Graph, start: Any) -> Dict[Any, Any]:
+    """
+    幅優先探索の木（最短経路の木）での、各ノードの親を求めます。
+
+    親をたどると、開始ノードからそのノードへの最短経路が（逆順に）得られます。
+
+    時間計算量: O(V + E)
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+        start: 開始ノード
+
+    Returns:
+        Dict[Any, Any]: {ノード: 親}（開始ノードの親は None、到達できないノードは含まない）
+    """
+    return _bfs_tree(graph, [start])[0]
+
+
+def shortest_path(graph: Graph, source: Any, target: Any) -> Optional[List[Any]]:
+    """
+    2つのノードの間の最短経路（辺の数が最小の経路）を求めます。
+
+    target を見つけた時点で探索を打ち切るため、target が近くにあれば
+    グラフ全体を探索せずに済みます。
+
+    時間計算量: O(V + E)（target が見つかった時点で終了）
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+        source: 開始ノード
+        target: 目的のノード
+
+    Returns:
+        Optional[List[Any]]: source から target までのノードのリスト
+            （両端を含む）、到達できない場合は None
+    """
+    parent, _ = _bfs_tree(graph, [source], target)
+    if target not in parent:
+        return None
+    return _path_to(parent, target)
+
+
+def bidirectional_shortest_path(
+    graph: Graph,
+    source: Any,
+    target: Any,
+    reverse_graph: Optional[Graph] = None,
+) -> Optional[List[Any]]:
+    """
+    両方向からの幅優先探索で、2つのノードの間の最短経路を求めます。
+
+    source から前向きに、target から後ろ向きに、それぞれ1階層ずつ交互に探索し、
+    2つの探索が出会ったら経路をつなげます。片方向の探索が距離 d まで広げる
+    必要があるのに対し、両方向ならそれぞれ d / 2 まで広げれば済むため、
+    分岐の多いグラフでは訪問するノードが大幅に減ります（b^d → 2b^(d/2)）。
+    各階層では、フロンティアの小さい方を広げます。
+
+    後ろ向きの探索には、エッジを逆向きにしたグラフが必要です。
+    reverse_graph を省略した場合は、graph が無向グラフ（全てのエッジが
+    両方向にある）であるものとして、graph をそのまま使います。
+
+    時間計算量: O(V + E)（最悪の場合）
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+        source: 開始ノード
+        target: 目的のノード
+        reverse_graph: エッジを逆向きにしたグラフ（有向グラフの場合に指定する）
+
+    Returns:
+        Optional[List[Any]]: source から target までのノードのリスト
+            （両端を含む）、到達できない場合は None
+    """
+    if source == target:
+        return [source]
+    forward_neighbors = _neighbors_of(graph)
+    backward_neighbors = _neighbors_of(reverse_graph if reverse_graph is not None else graph)
+
+    # 前向きの探索の親と、後ろ向きの探索の「次のノード」（target 側への親）
+    forward = {source: None}
+    backward = {target: None}
+    forward_frontier = [source]
+    backward_frontier = [target]
+
+    while forward_frontier and backward_frontier:
+        # フロンティアの小さい方を1階層広げる
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, visited, other, neighbors_of = forward_frontier, forward, backward, forward_neighbors
+        else:
+            frontier, visited, other, neighbors_of = backward_frontier, backward, forward, backward_neighbors
+
+        next_frontier = []
+        meeting = None
+        for node in frontier:
+            for neighbor in neighbors_of(node):
+                if neighbor in visited:
+                    continue
+                visited[neighbor] = node
+                if neighbor in other:
+                    meeting = neighbor
+                    break
+                next_frontier.append(neighbor)
+            if meeting is not None:
+                break
+
+        if meeting is not None:
+            # source → meeting の経路と、meeting → target の経路をつなげる
+            path = _path_to(forward, meeting)
+            node = backward[meeting]
+            while node is not None:
+                path.append(node)
+                node = backward[node]
+            return path
+
+        if visited is forward:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+    return None
+
+
+def multi_source_bfs(graph: Graph, sources: Iterable[Any]) -> Dict[Any, int]:
+    """
+    複数の開始ノードから同時に幅優先探索を行い、各ノードについて
+    最も近い開始ノードからの距離を求めます。
+
+    開始ノードごとに BFS を繰り返す（O(k(V + E))）代わりに、全ての開始ノードを
+    距離 0 としてキューに入れてから1回だけ探索します（O(V + E)）。
+    「最寄りの施設までの距離」などを求めるのに使います。
+
+    時間計算量: O(V + E)
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+        sources: 開始ノードの集まり
+
+    Returns:
+        Dict[Any, int]: {ノード: 最も近い開始ノードからの距離}
+            （どの開始ノードからも到達できないノードは含まない）
+    """
+    return _bfs_tree(graph, sources)[1]
+
+
+def iter_bfs(
+    graph: Graph,
+    start: Any,
+    max_depth: Optional[int] = None,
+    neighbor_filter: Optional[Callable[[Any, Any], bool]] = None,
+    details: bool = False,
+) -> Iterator[Any]:
+    """
+    幅優先探索で訪問したノードを、1つずつ返すジェネレータ
+
+    bfs は全てのノードを訪問してからリストを返すため、「条件に合う最初のノードを
+    見つけたい」場合でもグラフ全体を探索し、O(V) のリストを作ります。
+    このジェネレータはキューから取り出したノードをその場で返し、呼び出し側が
+    次のノードを求めるまで続きを探索しません。途中で break すれば、
+    残りの探索のコストはかかりません。
+
+    ノードは bfs と同じ順序で返します。
+
+    時間計算量: O(V + E)（途中で打ち切った場合は、それまでに訪問した分だけ）
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+        start: 開始ノード
+        max_depth: この深さ（辺の数）までのノードだけを訪問する（None の場合は制限なし）
+        neighbor_filter: (ノード, 隣接ノード) を受け取り、その辺をたどる場合に
+            True を返す関数（None の場合は全ての辺をたどる）
+        details: True の場合、ノードの代わりに (ノード, 深さ, 親) を返す
+            （開始ノードの親は None）
+
+    Yields:
+        訪問順のノード（details が True の場合は (ノード, 深さ, 親)）
+    """
+    neighbors_of = _neighbors_of(graph)
+    visited = {start}
+    # キューの要素は (ノード, 深さ, 親)
+    queue = deque([(start, 0, None)])
+    while queue:
+        node, depth, parent = queue.popleft()
+        yield (node, depth, parent) if details else node
+
+        # 深さの上限に達したノードからは先へ進まない
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for neighbor in neighbors_of(node):
+            if neighbor in visited:
+                continue
+            if neighbor_filter is not None and not neighbor_filter(node, neighbor):
+                continue
+            visited.add(neighbor)
+            queue.append((neighbor, depth + 1, node))
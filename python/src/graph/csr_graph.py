@@ -0,0 +1,354 @@
+"""
+CSR（Compressed Sparse Row）形式のグラフモジュール
+
+このモジュールは、グラフの隣接関係を2つの整数の配列（offsets / targets）に
+詰めて格納する CSR 形式のグラフと、その上での幅優先探索・深さ優先探索を
+実装しています。graph.bfs.bfs や graph.dfs.dfs_* に CSRGraph を渡すと、
+このモジュールの探索が使われます。
+"""
+
+import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# 32ビットの型コード 'i' で格納できるノード番号の上限
+_INT32_LIMIT = 1 << 31
+
+
+def _index_typecode(n: int) -> str:
+    """0〜n-1 の整数を格納できる、最も小さい array の型コードを返す"""
+    return 'i' if n <= _INT32_LIMIT else 'q'
+
+
+class CSRGraph:
+    """
+    CSR（Compressed Sparse Row）形式の有向グラフ
+
+    隣接リストを Dict[Any, List[Any]] で表すと、ノードやエッジの1つ1つが
+    Python のオブジェクト（int なら28バイト以上、リストの要素は8バイトの参照）になり、
+    大きなグラフでは数GBのメモリを使います。探索でも、1歩ごとに
+    dict の検索と set への追加が必要です。
+
+    CSR 形式では、ノードを 0〜n-1 の番号に置き換え（インターン化）、
+    隣接関係を2つの配列に詰めて格納します。
+    - targets: 全てのエッジの行き先の番号を、出発するノードの番号順に並べた配列
+    - offsets: ノード i から出るエッジは targets[offsets[i]:offsets[i + 1]]
+    どちらも array.array（ノード番号は32ビット整数）なので、エッジ1本あたり
+    4バイトしか使いません。NumPy を使う場合は np.asarray(graph.targets) で
+    コピーせずに ndarray として扱えます。
+
+    探索では、訪問済みの印を bytearray（ノード1つあたり1バイト）で管理し、
+    ノードの番号で直接読み書きします（ハッシュの計算が不要）。
+
+    ノードの名前（元の隣接リストのキー）と番号の対応は _ids / _nodes に保持し、
+    node_id() / node_names() で変換します。
+    番号そのものをノードとして使う場合（nodes=None）は、対応表を持ちません。
+
+    時間計算量:
+    - 構築: O(V + E)
+    - bfs / dfs: O(V + E)
+    空間計算量: O(V + E)（配列の部分は 8V + 4E バイト程度）
+
+    Attributes:
+        offsets (array.array): 各ノードのエッジの開始位置（長さは ノード数 + 1）
+        targets (array.array): エッジの行き先のノード番号
+    """
+
+    def __init__(self, offsets: Sequence[int], targets: Sequence[int], nodes: Optional[Sequence[Any]] = None):
+        """
+        CSR 形式の配列からグラフを作成します。
+
+        Args:
+            offsets (Sequence[int]): 各ノードのエッジの開始位置（長さは ノード数 + 1）
+            targets (Sequence[int]): エッジの行き先のノード番号
+            nodes (Optional[Sequence[Any]]): 番号 i のノードの名前
+                （None の場合は番号 0〜n-1 をそのままノードとして使う）
+
+        Raises:
+            ValueError: 配列の長さや値が CSR 形式として正しくない場合
+        """
+        n = len(offsets) - 1
+        if n < 0 or offsets[0] != 0 or offsets[-1] != len(targets):
+            raise ValueError("offsets must start at 0 and end at len(targets)")
+        if nodes is not None and len(nodes) != n:
+            raise ValueError("nodes must have one name per node")
+        self.offsets = offsets if isinstance(offsets, array.array) else array.array('q', offsets)
+        typecode = _index_typecode(n)
+        self.targets = targets if isinstance(targets, array.array) else array.array(typecode, targets)
+        if nodes is None:
+            self._nodes = None
+            self._ids = None
+        else:
+            self._nodes = list(nodes)
+            self._ids = {node: i for i, node in enumerate(self._nodes)}
+        # transpose() の結果（グラフは変更されないので、1回作ったら使い回す）
+        self._transposed = None
+
+    @classmethod
+    def from_adjacency(cls, graph: Dict[Any, List[Any]]) -> "CSRGraph":
+        """
+        隣接リスト（graph.bfs.bfs などと同じ形式）から CSR 形式のグラフを作成します。
+
+        隣接リストのキーに無く、隣接ノードとしてだけ現れるノードも、
+        エッジを持たないノードとして含めます。
+
+        Args:
+            graph (Dict[Any, List[Any]]): 隣接リスト表現のグラフ {node: [neighbors]}
+
+        Returns:
+            CSRGraph: 同じグラフの CSR 形式
+        """
+        # ノードに番号を振る（キーの順、次に隣接ノードとしてだけ現れるノードの順）
+        ids: Dict[Any, int] = {}
+        for node in graph:
+            ids.setdefault(node, len(ids))
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                ids.setdefault(neighbor, len(ids))
+        n = len(ids)
+
+        offsets = array.array('q', [0]) * (n + 1)
+        targets = array.array(_index_typecode(n))
+        # キーの番号は 0 から順に振ったので、キーの順に並べればノードの番号順になる
+        for i, neighbors in enumerate(graph.values()):
+            targets.extend([ids[neighbor] for neighbor in neighbors])
+            offsets[i + 1] = len(targets)
+        # エッジを持たないノード（隣接ノードとしてだけ現れるノード）
+        for i in range(len(graph) + 1, n + 1):
+            offsets[i] = len(targets)
+
+        return cls._from_parts(offsets, targets, ids)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[Any, Any]]) -> "CSRGraph":
+        """
+        エッジ (出発するノード, 行き先のノード) の並びから CSR 形式のグラフを作成します。
+
+        隣接リストの dict を作らずに済むため、巨大なグラフをファイルなどから
+        読み込む場合に使います。同じノードから出るエッジは、edges での順序を保ちます。
+
+        Args:
+            edges (Iterable[Tuple[Any, Any]]): エッジの並び
+
+        Returns:
+            CSRGraph: CSR 形式のグラフ
+        """
+        ids: Dict[Any, int] = {}
+        sources = array.array('q')
+        destinations = array.array('q')
+        for source, destination in edges:
+            sources.append(ids.setdefault(source, len(ids)))
+            destinations.append(ids.setdefault(destination, len(ids)))
+        n = len(ids)
+
+        # 計数ソートで、エッジを出発するノードの番号順に並べる（安定）
+        offsets = array.array('q', [0]) * (n + 1)
+        for source in sources:
+            offsets[source + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        positions = offsets[:-1]
+        targets = array.array(_index_typecode(n), [0]) * len(sources)
+        for source, destination in zip(sources, destinations):
+            targets[positions[source]] = destination
+            positions[source] += 1
+
+        return cls._from_parts(offsets, targets, ids)
+
+    @classmethod
+    def _from_parts(cls, offsets: array.array, targets: array.array, ids: Dict[Any, int]) -> "CSRGraph":
+        """構築済みの配列と、ノードの名前から番号への対応表からグラフを作る"""
+        csr = cls.__new__(cls)
+        csr.offsets = offsets
+        csr.targets = targets
+        csr._ids = ids
+        csr._nodes = list(ids)
+        csr._transposed = None
+        return csr
+
+    def __len__(self) -> int:
+        # ノードの数
+        return len(self.offsets) - 1
+
+    def __contains__(self, node: Any) -> bool:
+        return self.node_id(node) >= 0
+
+    @property
+    def edge_count(self) -> int:
+        """エッジの数"""
+        return len(self.targets)
+
+    def nbytes(self) -> int:
+        """offsets と targets の配列が使うバイト数を返す（ノードの名前の対応表は含まない）"""
+        return (len(self.offsets) * self.offsets.itemsize
+                + len(self.targets) * self.targets.itemsize)
+
+    def node_id(self, node: Any) -> int:
+        """
+        ノードの番号を返します。
+
+        direction_optimizing_bfs が返す深さ・親の配列は、この番号で引きます。
+
+        Args:
+            node (Any): ノード
+
+        Returns:
+            int: ノードの番号（グラフに無い場合は -1）
+        """
+        if self._ids is not None:
+            return self._ids.get(node, -1)
+        if type(node) is int and 0 <= node < len(self):
+            return node
+        return -1
+
+    def node_names(self, ids: List[int]) -> List[Any]:
+        """
+        ノードの番号のリストを、ノードの名前のリストに変換します。
+
+        Args:
+            ids (List[int]): ノードの番号のリスト
+
+        Returns:
+            List[Any]: ノードの名前のリスト（nodes=None のグラフでは ids をそのまま返す）
+        """
+        if self._nodes is None:
+            return ids
+        nodes = self._nodes
+        return [nodes[i] for i in ids]
+
+    def neighbors(self, node: Any) -> List[Any]:
+        """
+        ノードの隣接ノードを返します。
+
+        Args:
+            node (Any): ノード
+
+        Returns:
+            List[Any]: 隣接ノードのリスト（グラフに無いノードの場合は空のリスト）
+        """
+        i = self.node_id(node)
+        if i < 0:
+            return []
+        return self.node_names(self.targets[self.offsets[i]:self.offsets[i + 1]].tolist())
+
+    def to_adjacency(self) -> Dict[Any, List[Any]]:
+        """隣接リスト（Dict[Any, List[Any]]）の形式に戻します。"""
+        names = self.node_names(list(range(len(self))))
+        return {names[i]: self.neighbors(names[i]) for i in range(len(self))}
+
+    def transpose(self) -> "CSRGraph":
+        """
+        全てのエッジの向きを逆にしたグラフを返します（ノードの番号と名前は同じ）。
+
+        ノード i の隣接ノードが、i に入ってくるエッジの出発ノードになります。
+        結果は覚えておき、2回目以降はそれを返します。
+
+        Returns:
+            CSRGraph: エッジの向きを逆にしたグラフ
+        """
+        if self._transposed is not None:
+            return self._transposed
+        n = len(self)
+        offsets = self.offsets
+        targets = self.targets
+
+        # 計数ソートで、エッジを行き先のノードの番号順に並べ直す
+        reversed_offsets = array.array('q', [0]) * (n + 1)
+        for v in targets:
+            reversed_offsets[v + 1] += 1
+        for i in range(n):
+            reversed_offsets[i + 1] += reversed_offsets[i]
+        positions = reversed_offsets[:-1]
+        reversed_targets = array.array(targets.typecode, [0]) * len(targets)
+        for u in range(n):
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                reversed_targets[positions[v]] = u
+                positions[v] += 1
+
+        transposed = CSRGraph.__new__(CSRGraph)
+        transposed.offsets = reversed_offsets
+        transposed.targets = reversed_targets
+        transposed._ids = self._ids
+        transposed._nodes = self._nodes
+        transposed._transposed = self
+        self._transposed = transposed
+        return transposed
+
+    def bfs(self, start: Any) -> List[Any]:
+        """
+        幅優先探索を行い、訪問順のノードリストを返します（graph.bfs.bfs と同じ結果）。
+
+        キューには deque の代わりに訪問順のリストそのものを使い、
+        先頭から読み進める位置（head）だけを動かします。
+        各ノードの隣接ノードは、targets のスライスとして C のレベルでまとめて取り出します。
+
+        Args:
+            start (Any): 開始ノード
+
+        Returns:
+            List[Any]: 訪問順のノードリスト
+        """
+        s = self.node_id(start)
+        if s < 0:
+            # 隣接リスト版と同じく、グラフに無い開始ノードは自身だけを訪問する
+            return [start]
+        offsets = self.offsets
+        targets = self.targets
+        visited = bytearray(len(self))
+        visited[s] = 1
+        order = [s]
+        append = order.append
+        head = 0
+        while head < len(order):
+            u = order[head]
+            head += 1
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if not visited[v]:
+                    visited[v] = 1
+                    append(v)
+        return self.node_names(order)
+
+    def dfs(self, start: Any) -> List[Any]:
+        """
+        深さ優先探索を行い、訪問順のノードリストを返します
+        （graph.dfs.dfs_recursive と同じ結果）。
+
+        再帰を使わず、スタックには (ノード, 次に調べるエッジの位置) を積みます。
+        各ノードはスタックに1回しか積まれないため、スタックの大きさは
+        探索の深さまでで済み、再帰の上限にも達しません。
+
+        Args:
+            start (Any): 開始ノード
+
+        Returns:
+            List[Any]: 訪問順のノードリスト
+        """
+        s = self.node_id(start)
+        if s < 0:
+            return [start]
+        offsets = self.offsets
+        targets = self.targets
+        visited = bytearray(len(self))
+        visited[s] = 1
+        order = [s]
+        stack = [s]
+        positions = [offsets[s]]
+        while stack:
+            u = stack[-1]
+            i = positions[-1]
+            end = offsets[u + 1]
+            # 訪問済みの隣接ノードを読み飛ばす
+            while i < end and visited[targets[i]]:
+                i += 1
+            if i == end:
+                # 全ての隣接ノードを調べ終えたので、1つ前のノードに戻る
+                stack.pop()
+                positions.pop()
+                continue
+            v = targets[i]
+            positions[-1] = i + 1
+            visited[v] = 1
+            order.append(v)
+            stack.append(v)
+            positions.append(offsets[v])
+        return self.node_names(order)
@@ -3,12 +3,19 @@
 
 このモジュールは、グラフや木構造を探索するための深さ優先探索アルゴリズムを
 再帰版と反復版の両方で実装しています。
+訪問したノードを1つずつ返すジェネレータ版（iter_dfs）と、
+発見・完了の時刻や辺の種類をイベントとして返すジェネレータ（dfs_events）もあります。
+dfs_events はトポロジカルソート（graph.topological_sort）や
+強連結成分分解（graph.scc）の土台になっています。
 """
 
-from typing import Dict, List, Set, Any
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Any, Union
 
+from graph.bfs import Graph, _neighbors_of
+from graph.csr_graph import CSRGraph
 
-def dfs_recursive(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
+
+def dfs_recursive(graph: Union[Dict[Any, List[Any]], CSRGraph], start: Any) -> List[Any]:
     """
     再帰を用いた深さ優先探索（DFS: Depth-First Search）
     
@@ -27,13 +34,18 @@ def dfs_recursive(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
     時間計算量: O(V + E) - Vはノード数、Eはエッジ数
     空間計算量: O(V) - 訪問済みセット + 再帰のスタック
     
+    CSRGraph を渡した場合は、CSR 形式の配列の上で探索します（CSRGraph.dfs）。
+    
     Args:
-        graph: 隣接リスト表現のグラフ {node: [neighbors]}
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
         start: 開始ノード
         
     Returns:
         訪問順のノードリスト
     """
+    if isinstance(graph, CSRGraph):
+        return graph.dfs(start)
+    
     # 訪問済みノードを記録するセット
     # set を使用することで、O(1) で訪問済みかどうかを確認できる
     visited = set()
@@ -66,59 +78,230 @@ def dfs_recursive(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
     return result
 
 
-def dfs_iterative(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
+def dfs_iterative(graph: Union[Dict[Any, List[Any]], CSRGraph], start: Any) -> List[Any]:
     """
     スタックを用いた深さ優先探索（反復版）
     
     再帰を使わず、明示的なスタックを使用してDFSを実現します。
-    再帰版と同じ結果を得るために、隣接ノードを逆順でスタックに追加します。
+    スタックには (ノード, そのノードの隣接ノードのイテレータ) を積み、
+    再帰版の「呼び出し元に戻ったら、次の隣接ノードから続ける」動きを再現します。
+    そのため、再帰版と同じ順序でノードを訪問します。
     
     再帰版との違い:
-    - スタックオーバーフローのリスクがない
+    - スタックオーバーフロー（再帰の上限）のリスクがない
     - デバッグがしやすい
     - 状態を明示的に管理できる
     
+    各ノードはスタックに1回しか積まれません。隣接ノードを全てスタックに積んでから
+    取り出すときに訪問済みかを確認する方法では、同じノードが何度も積まれ、
+    スタックの大きさが O(E) になることがあります。
+    
     時間計算量: O(V + E) - Vはノード数、Eはエッジ数
-    空間計算量: O(V) - 訪問済みセット + スタック
+    空間計算量: O(V) - 訪問済みセット + スタック（探索の深さまで）
+    
+    CSRGraph を渡した場合は、CSR 形式の配列の上で探索します（CSRGraph.dfs）。
     
     Args:
-        graph: 隣接リスト表現のグラフ {node: [neighbors]}
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
         start: 開始ノード
         
     Returns:
         訪問順のノードリスト
     """
+    if isinstance(graph, CSRGraph):
+        return graph.dfs(start)
+    
     # 訪問済みノードを記録するセット
-    visited = set()
+    visited = {start}
     
     # 訪問順序を記録するリスト
-    result = []
+    result = [start]
     
-    # 探索するノードを管理するスタック
-    # 開始ノードをスタックに追加
-    stack = [start]
+    # 探索中のノードを管理するスタック
+    # 各要素は (ノード, まだ調べていない隣接ノードのイテレータ)
+    stack = [(start, iter(graph.get(start, ())))]
     
     # スタックが空になるまで探索を続ける
     while stack:
-        # スタックの末尾からノードを取り出す（LIFO: 後入れ先出し）
-        # Pythonのリストの pop() は末尾から要素を取り出す
-        node = stack.pop()
-        
-        # まだ訪問していないノードの場合のみ処理
-        if node not in visited:
-            # 訪問済みとしてマーク
-            visited.add(node)
-            # 訪問順序に追加
-            result.append(node)
-            
-            # 隣接ノードが存在する場合
-            # スタックはLIFO（後入れ先出し）なので、
-            # 再帰版と同じ訪問順序にするために隣接リストを逆順に追加
-            # 例: [A, B, C] を逆順に追加 → Aが最初にpopされる
-            if node in graph:
-                for neighbor in reversed(graph[node]):
-                    # まだ訪問していないノードのみスタックに追加
-                    if neighbor not in visited:
-                        stack.append(neighbor)
+        # スタックの末尾（最も深いノード）の、次の隣接ノードを調べる
+        node, neighbors = stack[-1]
+        for neighbor in neighbors:
+            # まだ訪問していないノードが見つかったら、そこへ進む
+            if neighbor not in visited:
+                visited.add(neighbor)
+                result.append(neighbor)
+                # 残りの隣接ノードはイテレータに残したまま、1段深く進む
+                stack.append((neighbor, iter(graph.get(neighbor, ()))))
+                break
+        else:
+            # 全ての隣接ノードを調べ終えたら、スタックから取り除いて1段戻る
+            stack.pop()
                         
     return result
+
+
+def iter_dfs(
+    graph: Graph,
+    start: Any,
+    max_depth: Optional[int] = None,
+    neighbor_filter: Optional[Callable[[Any, Any], bool]] = None,
+    details: bool = False,
+) -> Iterator[Any]:
+    """
+    深さ優先探索で訪問したノードを、1つずつ返すジェネレータ
+
+    訪問したノードをその場で返し、呼び出し側が次のノードを求めるまで
+    続きを探索しません。途中で break すれば、残りの探索のコストはかかりません。
+
+    ノードは dfs_recursive と同じ順序で返します。再帰は使わず、スタックには
+    (ノード, 深さ, 隣接ノードのイテレータ) を積みます。max_depth が None の場合、
+    各ノードはスタックに1回しか積まれないため、スタックの大きさは探索の深さまでで済みます。
+
+    max_depth を指定した場合は、開始ノードから max_depth 本以下の辺でたどれる
+    全てのノードを返します。深さ優先探索では、近いノードにも遠回りの枝から先に
+    たどり着くことがあります（例: A → B → C と A → C がある場合、C には深さ2で
+    先に到達する）。そのため、ノードごとに到達した最も浅い深さを覚えておき、
+    より浅い深さで再び到達したノードは、その深さからもう一度先へ進みます
+    （反復深化と同じ考え方）。各ノードを返すのは最初に到達したときの1回だけです。
+
+    時間計算量: O(V + E)（途中で打ち切った場合は、それまでに訪問した分だけ）
+        max_depth を指定した場合は、浅い深さで到達し直したノードを調べ直すため、
+        最悪で O(max_depth × (V + E))
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+        start: 開始ノード
+        max_depth: 開始ノードからこの深さ（辺の数）以内にあるノードだけを訪問する
+            （None の場合は制限なし）
+        neighbor_filter: (ノード, 隣接ノード) を受け取り、その辺をたどる場合に
+            True を返す関数（None の場合は全ての辺をたどる）
+        details: True の場合、ノードの代わりに (ノード, 深さ, 親) を返す
+            （深さと親は最初に到達したときの探索の経路でのもの。開始ノードの親は None）
+
+    Yields:
+        訪問順のノード（details が True の場合は (ノード, 深さ, 親)）
+    """
+    neighbors_of = _neighbors_of(graph)
+    # 到達したノードと、その最も浅い深さ
+    reached = {start: 0}
+    yield (start, 0, None) if details else start
+    stack = [(start, 0, iter(neighbors_of(start)))]
+    while stack:
+        node, depth, neighbors = stack[-1]
+        # 深さの上限に達したノードからは先へ進まない
+        if max_depth is not None and depth >= max_depth:
+            stack.pop()
+            continue
+        for neighbor in neighbors:
+            seen = reached.get(neighbor)
+            # 到達済みのノードは飛ばす（深さに上限がある場合は、より浅く到達し直したときだけ進む）
+            if seen is not None and (max_depth is None or seen <= depth + 1):
+                continue
+            if neighbor_filter is not None and not neighbor_filter(node, neighbor):
+                continue
+            reached[neighbor] = depth + 1
+            if seen is None:
+                yield (neighbor, depth + 1, node) if details else neighbor
+            # 隣接ノードへ進む（このノードの残りの隣接ノードは、戻ってきてから調べる）
+            stack.append((neighbor, depth + 1, iter(neighbors_of(neighbor))))
+            break
+        else:
+            # 全ての隣接ノードを調べ終えたので、1つ前のノードに戻る
+            stack.pop()
+
+
+class DFSEvent(NamedTuple):
+    """
+    dfs_events が返すイベント
+
+    kind の種類:
+    - "discover": node を発見した（neighbor は親、開始ノードの場合は None）
+    - "finish":   node の全ての隣接ノードを調べ終えた（neighbor は親）
+    - "tree":     木の辺 node → neighbor（neighbor をこの辺で発見した）
+    - "back":     後退辺 node → neighbor（neighbor は node の祖先。閉路がある）
+    - "forward":  前進辺 node → neighbor（neighbor は発見済みの node の子孫）
+    - "cross":    横断辺 node → neighbor（それ以外。別の枝や別の木のノードへの辺）
+
+    time は "discover" / "finish" の時刻（0 から数えて、イベントごとに1ずつ増える）で、
+    辺のイベントでは None です。
+    """
+
+    kind: str
+    node: Any
+    neighbor: Any
+    time: Optional[int]
+
+
+def _all_nodes(graph: Graph) -> List[Any]:
+    """グラフの全てのノードを返す（隣接リストの場合は、キーに無い隣接ノードは含めない）"""
+    if isinstance(graph, CSRGraph):
+        return graph.node_names(list(range(len(graph))))
+    return list(graph)
+
+
+def dfs_events(graph: Graph, sources: Optional[Iterable[Any]] = None) -> Iterator[DFSEvent]:
+    """
+    深さ優先探索の過程を、イベントの並びとして返すジェネレータ
+
+    ノードの発見（行きがけ）・完了（帰りがけ）と、たどった全ての辺の種類
+    （木の辺・後退辺・前進辺・横断辺）を、起きた順に DFSEvent として返します。
+    発見と完了の時刻は、1つの時計で数えます（括弧の構造になる）。
+
+    辺の種類は、辺 u → v を調べた時点の v の状態で決まります。
+    - v が未発見: 木の辺
+    - v が発見済みで未完了（探索中のスタックにある）: 後退辺
+    - v が完了済みで、u より後に発見された: 前進辺
+    - v が完了済みで、u より前に発見された: 横断辺
+
+    dfs_iterative と同じく、スタックには (ノード, 隣接ノードのイテレータ) を
+    1ノードにつき1回だけ積むため、数百万ノードの鎖のようなグラフでも
+    再帰の上限に達せず、スタックの大きさは探索の深さまでで済みます。
+
+    時間計算量: O(V + E)
+    空間計算量: O(V)
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+        sources: 探索を始めるノードの並び（順に、未発見のものから探索を始める）
+            None の場合はグラフの全てのノードから始める（深さ優先探索の森）
+
+    Yields:
+        DFSEvent: 探索のイベント
+    """
+    neighbors_of = _neighbors_of(graph)
+    if sources is None:
+        sources = _all_nodes(graph)
+
+    # 発見した時刻と、完了したノード
+    discovered: Dict[Any, int] = {}
+    finished: Set[Any] = set()
+    time = 0
+    for root in sources:
+        if root in discovered:
+            continue
+        discovered[root] = time
+        yield DFSEvent("discover", root, None, time)
+        time += 1
+        stack = [(root, iter(neighbors_of(root)))]
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in discovered:
+                    yield DFSEvent("tree", node, neighbor, None)
+                    discovered[neighbor] = time
+                    yield DFSEvent("discover", neighbor, node, time)
+                    time += 1
+                    stack.append((neighbor, iter(neighbors_of(neighbor))))
+                    break
+                if neighbor not in finished:
+                    kind = "back"
+                elif discovered[node] < discovered[neighbor]:
+                    kind = "forward"
+                else:
+                    kind = "cross"
+                yield DFSEvent(kind, node, neighbor, None)
+            else:
+                stack.pop()
+                finished.add(node)
+                yield DFSEvent("finish", node, stack[-1][0] if stack else None, time)
+                time += 1
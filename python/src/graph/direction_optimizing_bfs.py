@@ -0,0 +1,146 @@
+"""
+方向最適化幅優先探索（Direction-Optimizing BFS）モジュール
+
+このモジュールは、フロンティア（今の階層のノード）の大きさに応じて
+トップダウン型とボトムアップ型の探索を切り替える、レベル同期型の
+幅優先探索（Beamer らの手法）を実装しています。
+"""
+
+import array
+from typing import Any, List, Tuple
+
+from graph.csr_graph import CSRGraph
+
+
+# トップダウン → ボトムアップに切り替える閾値
+# フロンティアから出るエッジの数が、未訪問のノードに入るエッジの数の 1/ALPHA を超えたら切り替える
+_ALPHA = 14
+
+# ボトムアップ → トップダウンに戻す閾値
+# フロンティアのノード数が、全ノード数の 1/BETA を下回ったら戻す
+_BETA = 24
+
+
+def direction_optimizing_bfs(
+    graph: CSRGraph,
+    start: Any,
+    alpha: float = _ALPHA,
+    beta: float = _BETA,
+) -> Tuple[List[Any], array.array, array.array]:
+    """
+    方向最適化幅優先探索（Direction-Optimizing BFS）
+
+    通常の BFS（トップダウン型）は、フロンティアの各ノードから出る全てのエッジを調べ、
+    未訪問のノードを次のフロンティアに加えます。SNS のような次数が大きく直径の小さい
+    グラフでは、中盤の階層でフロンティアがグラフの大部分を占め、
+    調べるエッジのほとんどが既に訪問済みのノードへのエッジになります。
+
+    ボトムアップ型では、逆に未訪問の各ノードについて、入ってくるエッジの出発ノードが
+    フロンティアにあるかを調べます。親が1つ見つかった時点でそのノードの調査を
+    打ち切れるため、フロンティアが大きい階層では調べるエッジの数が大きく減ります。
+
+    階層ごとに、次の基準（Beamer のヒューリスティック）でどちらの型を使うか決めます。
+    - m_f（フロンティアから出るエッジの数）> m_u（未訪問のノードに入るエッジの数）/ alpha
+      になったら、ボトムアップ型に切り替える
+    - n_f（フロンティアのノード数）< n（全ノード数）/ beta になったら、
+      トップダウン型に戻す
+
+    訪問するノードの集合と各ノードの深さは graph.bfs.bfs と同じですが、
+    ボトムアップ型で探索した階層では、同じ階層の中の順序（と親）が異なる場合があります。
+
+    グラフは CSRGraph で渡します。隣接リスト（dict）から CSRGraph を作る
+    CSRGraph.from_adjacency と、ボトムアップ型で使う transpose() は、どちらも
+    Python のループで全てのエッジを処理します（10万ノード・200万エッジで、
+    dict のまま graph.bfs.bfs を呼ぶ時間の約5倍）。呼び出しのたびに変換すると
+    探索の高速化が打ち消されるため、変換は1回だけ行い、同じ CSRGraph を
+    使い回してください。transpose() の結果は CSRGraph に保存されるので、
+    2回目以降の呼び出しでは作り直しません。
+
+    時間計算量: O(V + E)（ボトムアップ型の階層では、調べるエッジの数が大幅に減る）
+    空間計算量: O(V + E)（初回の呼び出しで、エッジを逆向きにしたグラフを作る）
+
+    Args:
+        graph (CSRGraph): 探索するグラフ
+        start: 開始ノード
+        alpha (float): トップダウン → ボトムアップに切り替える閾値
+        beta (float): ボトムアップ → トップダウンに戻す閾値
+
+    Returns:
+        Tuple[List[Any], array.array, array.array]: (訪問順のノードリスト, 深さ, 親)
+            深さと親は graph.node_id() の番号で引く配列
+            （到達しなかったノードは -1、開始ノードの親は開始ノード自身の番号。
+            親の番号は graph.node_names() で名前に戻せる）
+
+    Raises:
+        TypeError: graph が CSRGraph でない場合
+    """
+    if not isinstance(graph, CSRGraph):
+        raise TypeError(
+            "direction_optimizing_bfs requires a CSRGraph; convert once with "
+            "CSRGraph.from_adjacency(graph) and reuse it across calls"
+        )
+
+    n = len(graph)
+    s = graph.node_id(start)
+    depth = array.array('q', [-1]) * n
+    parent = array.array('q', [-1]) * n
+    if s < 0:
+        return [start], depth, parent
+
+    offsets = graph.offsets
+    targets = graph.targets
+    reverse = graph.transpose()
+    in_offsets = reverse.offsets
+    in_targets = reverse.targets
+
+    depth[s] = 0
+    parent[s] = s
+    order = [s]
+    frontier = [s]
+    # 未訪問のノードに入るエッジの数（ボトムアップ型で調べる可能性のあるエッジの数）
+    unexplored_edges = len(targets) - (in_offsets[s + 1] - in_offsets[s])
+    # ボトムアップ型で調べる、未訪問のノードのリスト（トップダウン型の間は None）
+    unvisited = None
+    level = 0
+
+    while frontier:
+        level += 1
+        if unvisited is None:
+            frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+            if frontier_edges > unexplored_edges / alpha:
+                unvisited = [v for v in range(n) if depth[v] < 0]
+        elif len(frontier) < n / beta:
+            unvisited = None
+
+        next_frontier = []
+        if unvisited is None:
+            # トップダウン型: フロンティアから出るエッジを全て調べる
+            for u in frontier:
+                for v in targets[offsets[u]:offsets[u + 1]]:
+                    if depth[v] < 0:
+                        depth[v] = level
+                        parent[v] = u
+                        next_frontier.append(v)
+        else:
+            # ボトムアップ型: 未訪問の各ノードについて、フロンティアにある親を1つ探す
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+            remaining = []
+            for v in unvisited:
+                for u in in_targets[in_offsets[v]:in_offsets[v + 1]]:
+                    if in_frontier[u]:
+                        depth[v] = level
+                        parent[v] = u
+                        next_frontier.append(v)
+                        break
+                else:
+                    remaining.append(v)
+            unvisited = remaining
+
+        for v in next_frontier:
+            unexplored_edges -= in_offsets[v + 1] - in_offsets[v]
+        order.extend(next_frontier)
+        frontier = next_frontier
+
+    return graph.node_names(order), depth, parent
@@ -0,0 +1,77 @@
+"""
+強連結成分分解モジュール
+
+このモジュールは、深さ優先探索のイベント（graph.dfs.dfs_events）を使って、
+有向グラフの強連結成分を求める Tarjan のアルゴリズムを、再帰を使わずに実装しています。
+"""
+
+from typing import Any, Dict, List, Set
+
+from graph.bfs import Graph
+from graph.dfs import dfs_events
+
+
+def strongly_connected_components(graph: Graph) -> List[List[Any]]:
+    """
+    Tarjan のアルゴリズムで、有向グラフの強連結成分を求めます。
+
+    強連結成分とは、互いに行き来できるノードの極大な集まりです。
+
+    アルゴリズムの概要:
+    - 各ノードに発見の時刻（index）と、そのノードの部分木から後退辺・横断辺で
+      たどれる、まだ成分が決まっていないノードの index の最小値（low）を持たせる
+    - 発見したノードは、成分が決まるまで専用のスタックに積んでおく
+    - ノードの完了時に low == index なら、そのノードが成分の根であり、
+      スタックのそのノードより上にあるノードが1つの成分になる
+    - 完了したノードの low を、親の low に反映する
+
+    再帰版の Tarjan は深いグラフで再帰の上限に達するため、ここでは
+    dfs_events のイベント（発見・辺・完了）に合わせて index と low を更新します。
+    数百万ノードのグラフでも、スタックの大きさは探索の深さまでで済みます。
+
+    成分は、縮約したグラフ（成分を1つのノードとみなしたグラフ）の
+    トポロジカル順序の逆順（行き先の成分が先）に返します。
+
+    時間計算量: O(V + E)
+    空間計算量: O(V)
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+
+    Returns:
+        List[List[Any]]: 強連結成分のリスト（各成分はノードのリスト）
+    """
+    index: Dict[Any, int] = {}
+    low: Dict[Any, int] = {}
+    # 成分が決まっていないノードのスタックと、そのノードの集合
+    stack: List[Any] = []
+    on_stack: Set[Any] = set()
+    components: List[List[Any]] = []
+
+    for event in dfs_events(graph):
+        kind = event.kind
+        node = event.node
+        if kind == "discover":
+            index[node] = low[node] = event.time
+            stack.append(node)
+            on_stack.add(node)
+        elif kind == "back" or kind == "cross":
+            # 成分が決まっていないノードへの辺だけが low を下げる
+            neighbor = event.neighbor
+            if neighbor in on_stack and index[neighbor] < low[node]:
+                low[node] = index[neighbor]
+        elif kind == "finish":
+            if low[node] == index[node]:
+                # node が成分の根: スタックの node より上のノードが1つの成分
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+            parent = event.neighbor
+            if parent is not None and low[node] < low[parent]:
+                low[parent] = low[node]
+    return components
@@ -0,0 +1,87 @@
+"""
+トポロジカルソートと閉路検出モジュール
+
+このモジュールは、深さ優先探索のイベント（graph.dfs.dfs_events）を使って、
+有向グラフのトポロジカルソートと閉路の検出を実装しています。
+"""
+
+from typing import Any, Dict, List, Optional
+
+from graph.bfs import Graph
+from graph.dfs import dfs_events
+
+
+def topological_sort(graph: Graph) -> List[Any]:
+    """
+    有向グラフのノードを、全ての辺 u → v で u が v より前になるように並べます。
+
+    深さ優先探索でノードが完了した順（帰りがけ順）は、辺 u → v について
+    v が u より先に完了する（後退辺が無い場合）ため、その逆順が
+    トポロジカル順序になります。
+    後退辺が見つかった場合は閉路があり、トポロジカル順序は存在しません。
+
+    時間計算量: O(V + E)
+    空間計算量: O(V)
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+
+    Returns:
+        List[Any]: トポロジカル順序に並べたノードのリスト
+
+    Raises:
+        ValueError: グラフに閉路がある場合
+    """
+    order = []
+    for event in dfs_events(graph):
+        if event.kind == "finish":
+            order.append(event.node)
+        elif event.kind == "back":
+            raise ValueError(f"graph has a cycle through edge {event.node!r} -> {event.neighbor!r}")
+    order.reverse()
+    return order
+
+
+def find_cycle(graph: Graph) -> Optional[List[Any]]:
+    """
+    有向グラフの閉路を1つ探します。
+
+    深さ優先探索で探索中のノードの経路（開始ノードから今のノードまで）を覚えておき、
+    後退辺 u → v が見つかったら、経路の v から u までの部分が閉路になります。
+
+    時間計算量: O(V + E)（閉路が見つかった時点で終了）
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+
+    Returns:
+        Optional[List[Any]]: 閉路のノードのリスト [v, ..., u]
+            （最後のノード u から最初のノード v への辺で閉じる）、閉路が無い場合は None
+    """
+    # 探索中の経路と、経路でのノードの位置
+    path: List[Any] = []
+    position: Dict[Any, int] = {}
+    for event in dfs_events(graph):
+        kind = event.kind
+        if kind == "discover":
+            position[event.node] = len(path)
+            path.append(event.node)
+        elif kind == "finish":
+            path.pop()
+            del position[event.node]
+        elif kind == "back":
+            return path[position[event.neighbor]:]
+    return None
+
+
+def has_cycle(graph: Graph) -> bool:
+    """
+    有向グラフに閉路があるかどうかを判定します。
+
+    Args:
+        graph: 隣接リスト表現のグラフ {node: [neighbors]}、または CSRGraph
+
+    Returns:
+        bool: 閉路（自己ループを含む）がある場合は True
+    """
+    return any(event.kind == "back" for event in dfs_events(graph))
@@ -3,9 +3,22 @@
 
 このモジュールは、ソート済みリストを対象とした効率的な探索アルゴリズム
 である2分探索を実装しています。
+- binary_search: ターゲットのインデックスを1つ求める
+- lower_bound / upper_bound / equal_range: 重複を考慮した境界を求める
+  （標準ライブラリの bisect.bisect_left / bisect_right と同じ意味）
+- binary_search_many: 多数のターゲットをまとめて探索する
 """
 
-from typing import List, Any
+import numbers
+from typing import List, Any, Iterable, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy がない環境では純粋な Python の実装を使う
+    np = None
+
+from sort.gallop_utils import gallop_left
+from sort.numeric_utils import as_numeric_array
 
 
 def binary_search(data: List[int], target: int) -> int:
@@ -27,6 +40,10 @@ def binary_search(data: List[int], target: int) -> int:
     
     注意: この関数はリストがソート済みであることを前提としています。
           ソートされていないリストで使用すると正しい結果が得られません。
+
+    NumPy の配列や array.array などの数値バッファに数値を探す場合は、
+    コピーせずに np.searchsorted で探索します。
+    （ターゲットが複数ある場合は、その中で最も左のインデックスを返します）
     
     Args:
         data (List[int]): ソート済みの探索対象リスト（昇順）
@@ -35,6 +52,12 @@ def binary_search(data: List[int], target: int) -> int:
     Returns:
         int: 見つかった場合はそのインデックス、見つからない場合は -1
     """
+    # 数値バッファは np.searchsorted で「ターゲット以上の最初の位置」を求める
+    arr = as_numeric_array(data)
+    if arr is not None and isinstance(target, numbers.Real):
+        index = int(np.searchsorted(arr, target))
+        return index if index < len(arr) and arr[index] == target else -1
+
     # 探索範囲の左端と右端のインデックスを初期化
     # 最初はリスト全体が探索範囲
     left = 0
@@ -62,3 +85,156 @@ def binary_search(data: List[int], target: int) -> int:
             
     # 探索範囲がなくなってもターゲットが見つからなかった場合は -1 を返す
     return -1
+
+
+def lower_bound(data: Sequence[Any], target: Any, low: int = 0, high: Optional[int] = None) -> int:
+    """
+    ソート済みのリストで、target 以上の最初の要素のインデックスを返します。
+    （bisect.bisect_left と同じ）
+
+    target と等しい要素が複数ある場合は、その中で最も左のインデックスになります。
+    target を挿入してもソート順が崩れない、最も左の位置とも言えます。
+
+    時間計算量: O(log n)
+    空間計算量: O(1)
+
+    Args:
+        data (Sequence[Any]): ソート済みの探索対象リスト（昇順）
+        target (Any): 探索する値
+        low (int): 探索範囲の開始インデックス
+        high (Optional[int]): 探索範囲の終了インデックス（この位置を含まない。None の場合は末尾）
+
+    Returns:
+        int: data[low:i] が全て target 未満、data[i:high] が全て target 以上となる i
+    """
+    if high is None:
+        high = len(data)
+
+    # 探索範囲 [low, high) を半分ずつ絞り込む
+    # 不変条件: data[:low] は target 未満、data[high:] は target 以上
+    while low < high:
+        mid = (low + high) // 2
+        if data[mid] < target:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+def upper_bound(data: Sequence[Any], target: Any, low: int = 0, high: Optional[int] = None) -> int:
+    """
+    ソート済みのリストで、target より大きい最初の要素のインデックスを返します。
+    （bisect.bisect_right と同じ）
+
+    target と等しい要素が複数ある場合は、その中で最も右の要素の次のインデックスになります。
+
+    時間計算量: O(log n)
+    空間計算量: O(1)
+
+    Args:
+        data (Sequence[Any]): ソート済みの探索対象リスト（昇順）
+        target (Any): 探索する値
+        low (int): 探索範囲の開始インデックス
+        high (Optional[int]): 探索範囲の終了インデックス（この位置を含まない。None の場合は末尾）
+
+    Returns:
+        int: data[low:i] が全て target 以下、data[i:high] が全て target より大きくなる i
+    """
+    if high is None:
+        high = len(data)
+
+    # 不変条件: data[:low] は target 以下、data[high:] は target より大きい
+    while low < high:
+        mid = (low + high) // 2
+        if target < data[mid]:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+def equal_range(data: Sequence[Any], target: Any) -> Tuple[int, int]:
+    """
+    ソート済みのリストで、target と等しい要素が並ぶ範囲を返します。
+
+    data[start:end] が target と等しい要素の全てになります。
+    見つからない場合は start == end（target を挿入すべき位置）になります。
+
+    時間計算量: O(log n)
+    空間計算量: O(1)
+
+    Args:
+        data (Sequence[Any]): ソート済みの探索対象リスト（昇順）
+        target (Any): 探索する値
+
+    Returns:
+        Tuple[int, int]: (start, end) - lower_bound と upper_bound の組
+    """
+    start = lower_bound(data, target)
+    # 右端は start 以降にしかないので、探索範囲を狭めて求める
+    return start, upper_bound(data, target, start)
+
+
+def binary_search_many(data: Sequence[Any], targets: Iterable[Any]) -> List[int]:
+    """
+    ソート済みのリストから、複数のターゲットをまとめて探索します。
+
+    ターゲットごとに binary_search を呼ぶ代わりに、ターゲットを昇順に並べてから
+    リストを左から右へ1回だけ走査します。前のターゲットの位置より左には
+    次のターゲットは無いため、前の位置から指数探索（ギャロッピング）で
+    次の位置を求めます（sort.gallop_utils.gallop_left）。
+
+    アルゴリズムの手順:
+    1. ターゲットのインデックスを、ターゲットの値の昇順に並べる
+    2. 現在位置 pos = 0 から始める
+    3. 小さいターゲットから順に、pos から指数探索で lower_bound を求めて pos を進める
+    4. pos の要素がターゲットと等しければ見つかった位置、そうでなければ -1 を記録する
+    5. 結果を元のターゲットの順序で返す
+
+    NumPy の配列などの数値バッファに数値のターゲットを探す場合は、
+    np.searchsorted でまとめて探索します。
+
+    targets はジェネレータなどの任意のイテラブルでも構いません。
+    シーケンス（リスト・タプルなど）や NumPy の配列でない場合は、
+    最初にリストにしてから探索します（1回だけ走査する）。
+
+    時間計算量: O(m log m + m log(n / m)) - m はターゲットの数
+    空間計算量: O(m)
+
+    Args:
+        data (Sequence[Any]): ソート済みの探索対象リスト（昇順）
+        targets (Iterable[Any]): 探索する値のイテラブル（順序は任意）
+
+    Returns:
+        List[int]: 各ターゲットについて、見つかった場合は最も左のインデックス、
+            見つからない場合は -1（targets と同じ順序）
+    """
+    # 位置で参照できないイテラブル（ジェネレータなど）は、先にリストにする
+    if not isinstance(targets, Sequence) and not (np is not None and isinstance(targets, np.ndarray)):
+        targets = list(targets)
+
+    arr = as_numeric_array(data)
+    if arr is not None:
+        queries = np.asarray(targets)
+        if queries.ndim == 1 and queries.dtype.kind in "iuf":
+            positions = np.searchsorted(arr, queries)
+            # 末尾を越えた位置（全要素より大きいターゲット）は見つからなかったものとする
+            found = positions < len(arr)
+            found[found] = arr[positions[found]] == queries[found]
+            return np.where(found, positions, -1).tolist()
+
+    n = len(data)
+    results = [-1] * len(targets)
+
+    # ステップ1: ターゲットの値の昇順に、ターゲットのインデックスを並べる
+    order = sorted(range(len(targets)), key=targets.__getitem__)
+
+    # ステップ2-4: リストを左から右へ1回だけ走査する
+    pos = 0
+    for i in order:
+        target = targets[i]
+        if pos < n:
+            pos += gallop_left(target, data, pos, n - pos, 0)
+        if pos < n and data[pos] == target:
+            results[i] = pos
+    return results
@@ -0,0 +1,449 @@
+"""
+容量制限付きキャッシュモジュール
+
+このモジュールは、HashTable を拡張し、格納する要素数に上限を設けた
+キャッシュを実装しています。上限に達したら、追い出し方針
+（LRU / LFU）に従って要素を追い出します。有効期限（TTL）も指定できます。
+"""
+
+import time
+from collections.abc import ItemsView, Mapping, ValuesView
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from search.hash_search import HashTable
+
+
+class _Node:
+    """
+    キャッシュの要素
+
+    連結リストのつながり（prev / next）を要素自身に持たせる「侵入型」の
+    双方向連結リストにすることで、HashTable で見つけた要素を O(1) で
+    リストから外したり、末尾に移したりできます。
+    """
+
+    __slots__ = ("key", "value", "prev", "next", "freq", "bucket", "expires", "timer")
+
+    def __init__(self, key: Any = None, value: Any = None):
+        self.key = key
+        self.value = value
+        self.prev: Optional["_Node"] = None
+        self.next: Optional["_Node"] = None
+        # 参照された回数と、同じ回数の要素をまとめたリスト（LFU で使う）
+        self.freq = 1
+        self.bucket: Optional["_Node"] = None
+        # 有効期限の時刻と、有効期限順のリストでの位置（TTL を使う場合）
+        self.expires = 0.0
+        self.timer: Optional["_Node"] = None
+
+
+class _NodeList:
+    """
+    番兵（sentinel）を使った侵入型の双方向連結リスト
+
+    先頭が最も古い要素、末尾が最も新しい要素です。
+    追加・削除・先頭の取り出しは全て O(1) です。
+    """
+
+    __slots__ = ("head", "count")
+
+    def __init__(self):
+        # 番兵は先頭の前と末尾の次を兼ねる（空のリストでは自分自身を指す）
+        self.head = _Node()
+        self.head.prev = self.head
+        self.head.next = self.head
+        self.count = 0
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+    def append(self, node: _Node):
+        """末尾に追加する"""
+        self.insert_after(self.head.prev, node)
+
+    def insert_after(self, anchor: _Node, node: _Node):
+        """anchor（リストの要素または番兵）の直後に追加する"""
+        node.prev = anchor
+        node.next = anchor.next
+        anchor.next.prev = node
+        anchor.next = node
+        self.count += 1
+
+    def remove(self, node: _Node):
+        """リストから外す"""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+        self.count -= 1
+
+    def first(self) -> _Node:
+        """先頭（最も古い）の要素を返す"""
+        return self.head.next
+
+
+class _LRUPolicy:
+    """
+    LRU（Least Recently Used）: 最も長く使われていない要素を追い出す
+
+    使われた要素をリストの末尾に移すため、先頭が最も長く使われていない要素になります。
+    """
+
+    def __init__(self):
+        self._order = _NodeList()
+
+    def add(self, node: _Node):
+        self._order.append(node)
+
+    def touch(self, node: _Node):
+        self._order.remove(node)
+        self._order.append(node)
+
+    def remove(self, node: _Node):
+        self._order.remove(node)
+
+    def victim(self) -> _Node:
+        return self._order.first()
+
+
+class _LFUPolicy:
+    """
+    LFU（Least Frequently Used）: 参照された回数が最も少ない要素を追い出す
+
+    参照回数が同じ要素を1つのリスト（バケット）にまとめ、バケットどうしを
+    参照回数の小さい順に双方向連結リストでつなぎます（O(1) LFU）。
+    - 参照された要素は、今のバケットから次のバケット（回数 + 1）へ移る
+      （次のバケットが無ければ、今のバケットの直後に作る）
+    - 空になったバケットはすぐにリストから外す
+    そのため、先頭のバケットが常に最小の参照回数のバケットになり、
+    要素を削除した後でも、追い出す要素を探し直さずに O(1) で求められます。
+    参照回数が同じ要素の中では、最も長く使われていない要素を追い出します。
+
+    バケットは key に参照回数、value に要素のリストを持つ _Node で表します。
+    """
+
+    def __init__(self):
+        self._buckets = _NodeList()
+
+    def add(self, node: _Node):
+        node.freq = 1
+        self._move(node, self._buckets.head)
+
+    def touch(self, node: _Node):
+        bucket = node.bucket
+        bucket.value.remove(node)
+        node.freq += 1
+        # 今のバケットをリストに残したまま、その直後のバケットへ移してから、
+        # 空になった今のバケットを外す
+        self._move(node, bucket)
+        if not bucket.value:
+            self._buckets.remove(bucket)
+
+    def remove(self, node: _Node):
+        bucket = node.bucket
+        bucket.value.remove(node)
+        node.bucket = None
+        if not bucket.value:
+            self._buckets.remove(bucket)
+
+    def victim(self) -> _Node:
+        return self._buckets.first().value.first()
+
+    def _move(self, node: _Node, anchor: _Node):
+        """要素を、anchor（バケットまたは番兵）の直後にある node.freq のバケットに入れる"""
+        bucket = anchor.next
+        if bucket is self._buckets.head or bucket.key != node.freq:
+            bucket = _Node(node.freq, _NodeList())
+            self._buckets.insert_after(anchor, bucket)
+        bucket.value.append(node)
+        node.bucket = bucket
+
+
+# 追い出し方針の名前と、その実装のクラス
+_POLICIES = {
+    "lru": _LRUPolicy,
+    "lfu": _LFUPolicy,
+}
+
+
+class BoundedCache(HashTable):
+    """
+    容量制限付きのキャッシュ（HashTable の拡張）
+
+    遅い処理の結果を覚えておくキャッシュとして HashTable を使うと、
+    要素が増え続けてメモリを使い切ってしまいます。
+    このクラスは格納する要素数を capacity 以下に保ち、上限を超えたら
+    追い出し方針に従って要素を1つ追い出します。
+
+    追い出し方針（policy）:
+    - "lru": 最も長く使われていない要素を追い出す
+    - "lfu": 参照された回数が最も少ない要素を追い出す
+
+    ttl（秒）を指定すると、格納（または更新）してから ttl 秒が過ぎた要素は
+    期限切れとして扱い、見つからなかったものとします。
+    期限切れの要素は、参照されたとき・新しい要素を格納するとき・
+    len() やイテレーションのときに取り除きます（len() や for key in cache に
+    期限切れの要素は現れない）。
+
+    HashTable の値として要素（_Node）を格納し、要素どうしを
+    侵入型の双方向連結リストでつなぐことで、get / put / delete は全て O(1) です。
+
+    ヒット・ミス・追い出し・期限切れの回数を数え、stats() で返します。
+
+    時間計算量:
+    - get / put / delete: 平均 O(1)
+
+    Attributes:
+        capacity (int): 格納する要素数の上限
+        policy (str): 追い出し方針の名前
+        ttl (Optional[float]): 有効期限（秒）。None の場合は期限なし
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        policy: str = "lru",
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        キャッシュを初期化します。
+
+        Args:
+            capacity (int): 格納する要素数の上限（1以上）
+            policy (str): 追い出し方針（"lru" または "lfu"）
+            ttl (Optional[float]): 有効期限（秒）。None の場合は期限なし
+            clock (Callable[[], float]): 現在時刻（秒）を返す関数
+
+        Raises:
+            ValueError: capacity が1未満、policy が不明、または ttl が0以下の場合
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if policy not in _POLICIES:
+            raise ValueError(f"unknown policy: {policy!r} (expected one of {sorted(_POLICIES)})")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        # 上限まで格納しても拡張が起きない大きさで、テーブルを確保しておく
+        super().__init__(capacity * 2)
+        self.capacity = capacity
+        self.policy = policy
+        self.ttl = ttl
+        self._clock = clock
+        self._policy = _POLICIES[policy]()
+        # 有効期限の早い順（格納・更新した順）に並べたリスト
+        self._timers = _NodeList()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _lookup(self, key: Any) -> Optional[_Node]:
+        """キーの要素を返す（無い場合や期限切れの場合は None）"""
+        i = self._find(key, hash(key))
+        if i < 0:
+            return None
+        node = self._values[i]
+        if self.ttl is not None and node.expires <= self._clock():
+            self._expirations += 1
+            self._unlink(node)
+            super().delete(key)
+            return None
+        return node
+
+    def _unlink(self, node: _Node):
+        """要素を追い出し方針と有効期限のリストから外す"""
+        self._policy.remove(node)
+        if node.timer is not None:
+            self._timers.remove(node.timer)
+            node.timer = None
+
+    def _start_timer(self, node: _Node, now: float):
+        """要素の有効期限を設定し、有効期限のリストの末尾に置く"""
+        node.expires = now + self.ttl
+        if node.timer is None:
+            # 要素は追い出し方針のリストにつながっているため、有効期限のリストには
+            # 要素を key に持つ別のノードをつなぐ
+            node.timer = _Node(node)
+        else:
+            self._timers.remove(node.timer)
+        self._timers.append(node.timer)
+
+    def _purge(self):
+        """有効期限を使う場合、期限切れの要素を今の時刻で取り除く"""
+        if self.ttl is not None:
+            self._purge_expired(self._clock())
+
+    def _purge_expired(self, now: float):
+        """期限切れの要素を、有効期限の早い順に取り除く"""
+        timers = self._timers
+        while timers and timers.first().key.expires <= now:
+            node = timers.first().key
+            self._expirations += 1
+            self._unlink(node)
+            super().delete(node.key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        キーに対応する値を返し、その要素を「使われた」ものとして記録します。
+
+        Args:
+            key (Any): 検索するキー
+            default (Any): 見つからない場合に返す値
+
+        Returns:
+            Any: 見つかった場合は値、見つからない（または期限切れの）場合は default
+        """
+        node = self._lookup(key)
+        if node is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._policy.touch(node)
+        return node.value
+
+    def put(self, key: Any, value: Any):
+        """
+        キーと値のペアを格納します。
+        同じキーが既に存在する場合は、値を更新して「使われた」ものとして記録します。
+        要素数が capacity を超える場合は、追い出し方針に従って1つ追い出します。
+
+        Args:
+            key (Any): 格納するキー
+            value (Any): 格納する値
+        """
+        now = self._clock() if self.ttl is not None else 0.0
+        if self.ttl is not None:
+            self._purge_expired(now)
+
+        node = self._lookup(key)
+        if node is not None:
+            node.value = value
+            self._policy.touch(node)
+        else:
+            if super().__len__() >= self.capacity:
+                victim = self._policy.victim()
+                self._evictions += 1
+                self._unlink(victim)
+                super().delete(victim.key)
+            node = _Node(key, value)
+            self._policy.add(node)
+            super().insert(key, node)
+        if self.ttl is not None:
+            self._start_timer(node, now)
+
+    def insert(self, key: Any, value: Any):
+        """put() と同じです（HashTable と同じ名前で使えるようにする）。"""
+        self.put(key, value)
+
+    def search(self, key: Any) -> Optional[Any]:
+        """get() と同じです（見つからない場合は None）。"""
+        return self.get(key)
+
+    def delete(self, key: Any) -> bool:
+        """
+        指定されたキーに対応する要素を削除します。
+
+        Args:
+            key (Any): 削除するキー
+
+        Returns:
+            bool: 削除に成功した場合は True、キーが存在しない場合は False
+        """
+        i = self._find(key, hash(key))
+        if i < 0:
+            return False
+        self._unlink(self._values[i])
+        return super().delete(key)
+
+    def __getitem__(self, key: Any) -> Any:
+        node = self._lookup(key)
+        if node is None:
+            self._misses += 1
+            raise KeyError(key)
+        self._hits += 1
+        self._policy.touch(node)
+        return node.value
+
+    def __contains__(self, key: Any) -> bool:
+        # 存在の確認だけでは「使われた」とみなさず、ヒット・ミスも数えない
+        i = self._find(key, hash(key))
+        return i >= 0 and (self.ttl is None or self._values[i].expires > self._clock())
+
+    def __len__(self) -> int:
+        # 期限切れの要素は数えない
+        self._purge()
+        return super().__len__()
+
+    def __iter__(self) -> Iterator[Any]:
+        # 期限切れの要素を取り除いてから、残りのキーを返す
+        self._purge()
+        return super().__iter__()
+
+    def items(self) -> ItemsView:
+        return _BoundedCacheItemsView(self)
+
+    def values(self) -> ValuesView:
+        return _BoundedCacheValuesView(self)
+
+    def clear(self):
+        """全ての要素を削除します（統計は残す）。"""
+        super().clear()
+        self._policy = _POLICIES[self.policy]()
+        self._timers = _NodeList()
+
+    def insert_many(self, items: Union[Mapping, Iterable[Tuple[Any, Any]]]):
+        """複数のペアを順に put() します。"""
+        pairs = items.items() if isinstance(items, Mapping) else items
+        for key, value in pairs:
+            self.put(key, value)
+
+    def get_many(self, keys: Iterable[Any], default: Any = None) -> List[Any]:
+        """複数のキーを順に get() し、値のリストを返します。"""
+        return [self.get(key, default) for key in keys]
+
+    def delete_many(self, keys: Iterable[Any]) -> int:
+        """複数のキーを順に delete() し、削除した要素の数を返します。"""
+        return sum(1 for key in keys if self.delete(key))
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        キャッシュの統計を返します。
+
+        Returns:
+            Dict[str, Union[int, float]]:
+                - hits: 見つかった回数
+                - misses: 見つからなかった回数
+                - hit_rate: hits / (hits + misses)（まだ参照がない場合は 0.0）
+                - evictions: 容量の上限で追い出した回数
+                - expirations: 期限切れで取り除いた回数
+                - size: 現在の要素数
+                - capacity: 要素数の上限
+        """
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "size": len(self),
+            "capacity": self.capacity,
+        }
+
+
+class _BoundedCacheItemsView(ItemsView):
+    """BoundedCache の items() が返すビュー（参照の記録やヒットの計数をしない）"""
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        self._mapping._purge()
+        for key, node in HashTable.items(self._mapping):
+            yield key, node.value
+
+
+class _BoundedCacheValuesView(ValuesView):
+    """BoundedCache の values() が返すビュー（参照の記録やヒットの計数をしない）"""
+
+    def __iter__(self) -> Iterator[Any]:
+        self._mapping._purge()
+        for _, node in HashTable.items(self._mapping):
+            yield node.value
@@ -0,0 +1,74 @@
+"""
+指数探索（エクスポネンシャルサーチ）モジュール
+
+このモジュールは、長さが分からない（または非常に大きい）ソート済みの
+データを対象に、探索範囲を指数的に広げてから2分探索を行う
+指数探索を実装しています。
+"""
+
+from typing import Any, Sequence
+
+
+def exponential_search(data: Sequence[Any], target: Any) -> int:
+    """
+    指数探索を用いてソート済みのデータからターゲットを探します。
+
+    まず 1, 2, 4, 8, ... 番目の要素を順に調べてターゲットを含む範囲を見つけ、
+    その範囲の中で2分探索を行います。
+    データの長さ（len）を使わず、インデックスでのアクセス（data[i]）だけで探索するため、
+    末尾を越えたアクセスで IndexError を送出するデータであれば、長さの分からない
+    ストリームや、要求されたときに読み込む遅延読み込みのデータにも使えます。
+
+    ターゲットが先頭近くにある場合は、その位置 i に対して O(log i) で見つかります。
+
+    アルゴリズムの手順:
+    1. bound = 1 から始め、data[bound - 1] がターゲット以上になるか、
+       末尾を越える（IndexError）まで bound を2倍にする
+    2. ターゲットは data[bound // 2 : bound] の範囲にあるので、2分探索する
+       （末尾を越えた位置は、ターゲットより大きい値があるものとみなす）
+
+    時間計算量: O(log i) - i はターゲットの位置
+    空間計算量: O(1)
+
+    Args:
+        data (Sequence[Any]): ソート済みの探索対象（昇順）
+            （__getitem__ で0以上のインデックスを受け付け、末尾を越えたら IndexError を送出するもの）
+        target (Any): 探索する値
+
+    Returns:
+        int: 見つかった場合はそのインデックス（複数ある場合は最も左）、見つからない場合は -1
+    """
+    # ステップ1: ターゲットを含む範囲 [low, high) を指数的に広げて探す
+    # 不変条件: data[:low] は全てターゲット未満
+    low = 0
+    high = 1
+    while True:
+        try:
+            value = data[high - 1]
+        except IndexError:
+            break
+        if not value < target:
+            break
+        low = high
+        high *= 2
+
+    # ステップ2: 範囲 [low, high) で、ターゲット以上の最初の位置を2分探索で求める
+    while low < high:
+        mid = (low + high) // 2
+        try:
+            value = data[mid]
+        except IndexError:
+            # 末尾を越えた位置は、ターゲットより大きいものとみなす
+            high = mid
+            continue
+        if value < target:
+            low = mid + 1
+        else:
+            high = mid
+
+    try:
+        if data[low] == target:
+            return low
+    except IndexError:
+        pass
+    return -1
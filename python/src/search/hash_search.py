@@ -1,138 +1,732 @@
 """
-連鎖法（Chaining）を用いたハッシュテーブルの実装モジュール
+オープンアドレス法（Open Addressing）を用いたハッシュテーブルの実装モジュール
 
-このモジュールは、ハッシュの衝突を連鎖法で解決するハッシュテーブルを
-実装しています。平均O(1)の時間計算量でデータの操作が可能です。
+このモジュールは、ハッシュの衝突をオープンアドレス法（線形探査）で解決する
+ハッシュテーブルを実装しています。平均O(1)の時間計算量でデータの操作が可能です。
+また、複数のスレッドから同時に使えるロックストライピング版
+（ConcurrentHashTable）も実装しています。
 """
 
-from typing import Any, List, Optional, Tuple
+import array
+import threading
+from collections.abc import ItemsView, Iterable, Iterator, Mapping, MutableMapping
+from typing import Any, List, Optional, Tuple, Union
 
 
-class HashTable:
+# 空のスロットと、削除済みのスロット（墓標 / tombstone）を表す目印
+# キーとして None も使えるように、専用のオブジェクトで表す
+_EMPTY = object()
+_DELETED = object()
+
+# テーブルのサイズの最小値（サイズは常に2のべき乗）
+_MIN_SIZE = 8
+
+# 使用中のスロット（墓標を含む）の割合がこの値を超えたら、テーブルを拡張する
+_MAX_LOAD_FACTOR = 2 / 3
+
+# 要素数の割合がこの値を下回ったら、テーブルを縮小する
+_MIN_LOAD_FACTOR = 1 / 8
+
+# フィボナッチハッシュの定数（2^64 / 黄金比。ハッシュ値の全てのビットを上位ビットに混ぜる）
+# HashTable のスロットの選択と、ConcurrentHashTable のストライプの選択に使う
+_FIBONACCI_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+# ConcurrentHashTable の get() などで「見つからなかった」ことを表す目印
+_MISSING = object()
+
+
+def _home_slot(h: int, mask: int) -> int:
+    """
+    ハッシュ値から、探査を始めるスロットのインデックスを求める
+
+    hash() の値をそのままマスクすると、下位ビットが揃ったキー（i << 20 や
+    i * 10**6 など）が全て同じ位置から探査を始め、長い探査列ができてしまう
+    （挿入のコストが要素数の2乗に比例する）。ここではフィボナッチハッシュの定数を
+    掛けて全てのビットを上位ビットに混ぜ、上位32ビットを下位に折り返してからマスクする。
+    上位ビットをそのまま使わないのは、ConcurrentHashTable がストライプの選択に
+    最上位のビットを使い、同じストライプのキーでは最上位のビットが揃うため。
+    """
+    m = (h & _MASK64) * _FIBONACCI_MULTIPLIER & _MASK64
+    return (m ^ (m >> 32)) & mask
+
+
+class HashTable(MutableMapping):
     """
-    連鎖法（Chaining）を用いたハッシュテーブルの実装
-    
+    オープンアドレス法（線形探査）を用いたハッシュテーブルの実装
+
     ハッシュテーブルは、キーと値のペアを格納するデータ構造で、
     平均的な場合O(1)の時間計算量でデータの挿入、検索、削除が可能です。
-    
-    連鎖法とは、ハッシュの衝突（異なるキーが同じハッシュ値を持つこと）を
-    解決するための手法の一つです。同じハッシュ値を持つ要素は、
-    リストで連結して格納します。
-    
+
+    オープンアドレス法とは、ハッシュの衝突（異なるキーが同じハッシュ値を持つこと）を
+    解決するための手法の一つです。格納しようとしたスロットが使われていた場合は、
+    次のスロット、その次のスロット... と空いているスロットを探して格納します
+    （線形探査）。連鎖法のようにバケットごとのリストを作らないため、
+    メモリの使用量が少なく、探索で読むスロットがメモリ上で隣り合います。
+
     ハッシュテーブルの構造:
-    - テーブル（リスト）: 固定サイズのリスト
-    - バケット（bucket）: テーブルの各スロットに格納されるリスト
-    - ハッシュ関数: キーをテーブルのインデックスに変換する関数
-    
+    - 3つの並列な配列: ハッシュ値・キー・値を、同じインデックスのスロットに格納する
+      - ハッシュ値は array.array（64ビット整数）に詰めて格納する
+    - ハッシュ値のキャッシュ: キーを比較する前にハッシュ値を比較し、
+      異なるキーに対する（遅いかもしれない）__eq__ の呼び出しを省く
+    - 探査の開始位置: ハッシュ値をフィボナッチハッシュで混ぜてから決める
+      （下位ビットが揃ったキーでも、テーブル全体に散らばる）
+    - 墓標（tombstone）: 削除したスロットに置く目印。探索はここで止まらずに先へ進む
+    - リサイズ: 使用中のスロットの割合（負荷率）が 2/3 を超えたら拡張し、
+      要素数の割合が 1/8 を下回ったら縮小する
+
+    collections.abc.MutableMapping を実装しているため、dict と同じように
+    ht[key]・ht[key] = value・del ht[key]・key in ht・len(ht)・
+    for key in ht・ht.items() などが使えます。
+    search() は見つからない場合と値が None の場合を区別できないため、
+    区別が必要な場合は in や ht[key]（見つからない場合は KeyError）を使います。
+
+    多数のペアをまとめて扱う場合は insert_many / get_many / delete_many を使うと、
+    テーブルの拡張を1回にまとめ、メソッド呼び出しのコストも省けます。
+
+    見つからない探索が多い場合は、attach_filter() でブルームフィルタなどを
+    取り付けると、スロットを読む前に探索を打ち切れます。
+
     時間計算量:
-    - 平均: O(1) - ハッシュの衝突が少ない場合
-    - 最悪: O(n) - 全てのキーが同じバケットに格納された場合
-    
+    - 平均: O(1) - 負荷率が一定以下に保たれるため
+    - 最悪: O(n) - 全てのキーのハッシュ値が衝突した場合
+    - リサイズ: O(n) だが、挿入・削除1回あたりの償却計算量は O(1)
+
     Attributes:
-        size (int): テーブルのサイズ（バケットの数）
-        table (List[List[Tuple[Any, Any]]]): ハッシュテーブルの本体
+        size (int): テーブルのサイズ（スロットの数、常に2のべき乗）
     """
-    
+
     def __init__(self, size: int = 10):
         """
-        ハッシュテーブルを指定されたサイズで初期化します。
-        
+        ハッシュテーブルを初期化します。
+
+        Args:
+            size (int): テーブルの初期サイズの目安、デフォルトは10
+                （8以上の2のべき乗に切り上げる。要素が増減すると自動的に変わる）
+        """
+        # 見つからない探索を打ち切るための所属判定フィルタ（attach_filter で取り付ける）
+        self._filter = None
+        self._allocate(_table_size(size))
+
+    def _allocate(self, size: int):
+        """
+        指定したサイズの空のテーブルを確保します。
+
         Args:
-            size (int): テーブルのサイズ（バケットの数）、デフォルトは10
+            size (int): テーブルのサイズ（2のべき乗）
         """
-        # テーブルのサイズを保存
         self.size = size
-        
-        # テーブルを初期化
-        # 各バケットは空のリストとして初期化される
-        # リスト内包表記で各要素に独立した空リストを作成
-        self.table: List[List[Tuple[Any, Any]]] = [[] for _ in range(size)]
-
-    def _hash(self, key: Any) -> int:
-        """
-        キーからハッシュ値（テーブルのインデックス）を計算します。
-        
-        Pythonの組み込みhash()関数を使用し、テーブルサイズで割った余りを
-        ハッシュ値とします。
-        
+        # インデックスの計算に使うマスク（size が2のべき乗なので % size と同じ）
+        self._mask = size - 1
+        self._hashes = array.array('q', [0]) * size
+        self._keys: List[Any] = [_EMPTY] * size
+        self._values: List[Any] = [None] * size
+        # 要素の数と、墓標を含む使用中のスロットの数
+        self._used = 0
+        self._filled = 0
+
+    def _find(self, key: Any, h: int) -> int:
+        """
+        キーが格納されているスロットのインデックスを返します。
+
         Args:
-            key (Any): ハッシュ化するキー
-            
+            key (Any): 探すキー
+            h (int): キーのハッシュ値
+
         Returns:
-            int: 0からsize-1の範囲のハッシュ値
+            int: キーのスロットのインデックス（見つからない場合は -1）
+        """
+        f = self._filter
+        if f is not None and key not in f:
+            # フィルタが「含まれていない」と判定したら、スロットを読まずに打ち切る
+            return -1
+        hashes = self._hashes
+        keys = self._keys
+        mask = self._mask
+        i = _home_slot(h, mask)
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                # 空のスロットに達したら、キーは格納されていない
+                return -1
+            # ハッシュ値が一致した場合だけキーを比較する
+            # （同一のオブジェクトなら __eq__ も呼ばない）
+            if k is not _DELETED and hashes[i] == h and (k is key or k == key):
+                return i
+            # 次のスロットへ進む（線形探査）
+            i = (i + 1) & mask
+
+    def _resize(self, size: int):
         """
-        # Pythonの組み込みhash()関数を使用してハッシュ値を計算
-        # テーブルサイズで割った余りを取ることで、インデックスの範囲内に収める
-        return hash(key) % self.size
+        テーブルを指定したサイズで作り直し、全ての要素を再配置します。
+        （墓標はこのときに全て取り除かれる）
+
+        Args:
+            size (int): 新しいテーブルのサイズ（2のべき乗）
+        """
+        old_hashes = self._hashes
+        old_keys = self._keys
+        old_values = self._values
+        self._allocate(size)
+
+        hashes = self._hashes
+        keys = self._keys
+        values = self._values
+        mask = self._mask
+        for j, k in enumerate(old_keys):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            # キャッシュしたハッシュ値を使うため、hash() を呼び直さない
+            h = old_hashes[j]
+            i = _home_slot(h, mask)
+            while keys[i] is not _EMPTY:
+                i = (i + 1) & mask
+            hashes[i] = h
+            keys[i] = k
+            values[i] = old_values[j]
+            self._used += 1
+        self._filled = self._used
 
     def insert(self, key: Any, value: Any):
         """
         キーと値のペアをハッシュテーブルに挿入します。
         同じキーが既に存在する場合は、値を更新します。
-        
+
         Args:
             key (Any): 挿入するキー
             value (Any): 挿入する値
         """
-        # キーのハッシュ値を計算し、対応するバケットを取得
-        index = self._hash(key)
-        bucket = self.table[index]
-        
-        # バケット内で同じキーを持つ要素を探す
-        # enumerate でインデックスとタプル (key, value) を同時に取得
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
+        h = hash(key)
+        hashes = self._hashes
+        keys = self._keys
+        mask = self._mask
+        i = _home_slot(h, mask)
+
+        # キーを探しながら、最初に見つかった墓標の位置を覚えておく
+        tombstone = -1
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                break
+            if k is _DELETED:
+                if tombstone < 0:
+                    tombstone = i
+            elif hashes[i] == h and (k is key or k == key):
                 # 既存のキーが見つかった場合、値を更新して終了
-                bucket[i] = (key, value)
+                self._values[i] = value
+                return
+            i = (i + 1) & mask
+
+        if tombstone >= 0:
+            # 墓標のスロットを再利用する（使用中のスロットの数は変わらない）
+            i = tombstone
+        else:
+            # 空のスロットを使う前に、負荷率が上限を超えるなら拡張する
+            if (self._filled + 1) > self.size * _MAX_LOAD_FACTOR:
+                self._resize(_table_size((self._used + 1) * 2))
+                # サブクラスが insert を上書きしていても、この実装で挿入し直す
+                HashTable.insert(self, key, value)
                 return
-        
-        # 同じキーが存在しない場合、新しい要素をバケットの末尾に追加
-        bucket.append((key, value))
+            self._filled += 1
+
+        hashes[i] = h
+        keys[i] = key
+        self._values[i] = value
+        self._used += 1
+        if self._filter is not None:
+            self._filter_add(key)
 
     def search(self, key: Any) -> Optional[Any]:
         """
         指定されたキーに対応する値を検索します。
-        
+
         Args:
             key (Any): 検索するキー
-            
+
         Returns:
             Optional[Any]: 見つかった場合は値、見つからない場合は None
         """
-        # キーのハッシュ値を計算し、対応するバケットを取得
-        index = self._hash(key)
-        bucket = self.table[index]
-        
-        # バケット内で同じキーを持つ要素を探す
-        for k, v in bucket:
-            if k == key:
-                # キーが見つかった場合、対応する値を返す
-                return v
-        
-        # キーが見つからなかった場合は None を返す
-        return None
+        i = self._find(key, hash(key))
+        if i < 0:
+            return None
+        return self._values[i]
 
     def delete(self, key: Any) -> bool:
         """
         指定されたキーに対応する要素を削除します。
-        
+
+        削除したスロットは空にせず墓標を置きます。空にしてしまうと、
+        そのスロットを通り過ぎて格納された他のキーの探索がそこで止まってしまうためです。
+
         Args:
             key (Any): 削除するキー
-            
+
         Returns:
             bool: 削除に成功した場合は True、キーが存在しない場合は False
         """
-        # キーのハッシュ値を計算し、対応するバケットを取得
-        index = self._hash(key)
-        bucket = self.table[index]
-        
-        # バケット内で同じキーを持つ要素を探す
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                # キーが見つかった場合、その要素をリストから削除
-                # del でインデックス i の要素を削除
-                del bucket[i]
+        i = self._find(key, hash(key))
+        if i < 0:
+            return False
+
+        self._keys[i] = _DELETED
+        self._values[i] = None
+        self._used -= 1
+        if self._filter is not None:
+            self._filter.discard(key)
+        self._shrink_if_sparse()
+        return True
+
+    def _shrink_if_sparse(self):
+        """要素が大きく減っていたら、テーブルを縮小する（墓標もまとめて取り除かれる）"""
+        if self.size > _MIN_SIZE and self._used < self.size * _MIN_LOAD_FACTOR:
+            self._resize(_table_size(self._used * 2))
+
+    def __getitem__(self, key: Any) -> Any:
+        i = self._find(key, hash(key))
+        if i < 0:
+            raise KeyError(key)
+        return self._values[i]
+
+    def __setitem__(self, key: Any, value: Any):
+        self.insert(key, value)
+
+    def __delitem__(self, key: Any):
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key, hash(key)) >= 0
+
+    def __len__(self) -> int:
+        # 要素の数は挿入・削除のたびに数えているので、O(1) で返せる
+        return self._used
+
+    def __iter__(self) -> Iterator[Any]:
+        # スロットの順にキーを返す（挿入した順ではない）
+        for k in self._keys:
+            if k is not _EMPTY and k is not _DELETED:
+                yield k
+
+    def items(self) -> ItemsView:
+        return _HashTableItemsView(self)
+
+    def clear(self):
+        """全ての要素を削除し、テーブルを最小のサイズに戻します。"""
+        self._allocate(_MIN_SIZE)
+        if self._filter is not None:
+            self._filter = self._filter._with_capacity(self._filter.capacity)
+
+    def attach_filter(self, membership_filter: Any):
+        """
+        所属判定フィルタを取り付けます。
+
+        フィルタを取り付けると、search / in / ht[key] / delete / get_many は
+        まずフィルタでキーを確認し、「含まれていない」と判定されたら
+        スロットを読まずに打ち切ります。見つからない探索が多く、
+        探査が長くなる場合やキーの比較（__eq__）が遅い場合に効果があります。
+        一方で、全ての探索と挿入にフィルタのハッシュ計算が加わります。
+
+        フィルタには今あるキーを全て追加し、以後の挿入・削除にも追従させます。
+        要素数がフィルタの容量を超えたら、2倍の容量のフィルタを作り直します
+        （ブルームフィルタでは、削除したキーのビットもこのときに消える）。
+
+        Args:
+            membership_filter (Any): 空の BloomFilter または CuckooFilter
+                （search.membership_filter を参照）
+
+        Raises:
+            ValueError: フィルタが空でない場合
+        """
+        if len(membership_filter) > 0:
+            raise ValueError("membership filter must be empty")
+        if membership_filter.capacity < self._used:
+            membership_filter = membership_filter._with_capacity(self._used * 2)
+        self._filter = self._build_filter(membership_filter)
+
+    def detach_filter(self) -> Any:
+        """
+        取り付けた所属判定フィルタを取り外して返します。
+
+        Returns:
+            Any: 取り付けていたフィルタ（取り付けていない場合は None）
+        """
+        membership_filter = self._filter
+        self._filter = None
+        return membership_filter
+
+    def _build_filter(self, membership_filter: Any) -> Any:
+        """空のフィルタに全てのキーを追加して返す（満杯になったら容量を2倍にしてやり直す）"""
+        for key in self:
+            if not membership_filter.add(key):
+                return self._build_filter(membership_filter._with_capacity(membership_filter.capacity * 2))
+        return membership_filter
+
+    def _filter_add(self, key: Any):
+        """挿入したキーをフィルタに追加する"""
+        f = self._filter
+        if len(f) < f.capacity and f.add(key):
+            return
+        # 容量を超えた（またはカッコウフィルタが満杯になった）ら、全てのキーから作り直す
+        # （キーは既にテーブルに格納されているので、新しいフィルタにも含まれる）
+        self._filter = self._build_filter(f._with_capacity(self._used * 2))
+
+    def insert_many(self, items: Union[Mapping, Iterable[Tuple[Any, Any]]]):
+        """
+        複数のキーと値のペアをまとめて挿入します。
+        同じキーが既に存在する場合は、値を更新します。
+
+        insert() を繰り返し呼ぶ場合と比べて、次の点が速くなります。
+        - 最初に全てのペアが収まるサイズまでテーブルを1回だけ拡張するため、
+          途中で何度も再配置（リハッシュ）が起きない
+        - ループの中でメソッドを呼ばず、スロットの探査を直接行う
+
+        Args:
+            items (Union[Mapping, Iterable[Tuple[Any, Any]]]):
+                挿入するペア（辞書、または (キー, 値) のイテラブル）
+        """
+        pairs = list(items.items()) if isinstance(items, Mapping) else list(items)
+
+        # 全てのペアが新しいキーでも負荷率の上限を超えないよう、先に拡張しておく
+        if self._filled + len(pairs) > self.size * _MAX_LOAD_FACTOR:
+            self._resize(_table_size((self._used + len(pairs)) * 2))
+
+        hashes = self._hashes
+        keys = self._keys
+        values = self._values
+        mask = self._mask
+        for key, value in pairs:
+            h = hash(key)
+            i = _home_slot(h, mask)
+            tombstone = -1
+            while True:
+                k = keys[i]
+                if k is _EMPTY:
+                    break
+                if k is _DELETED:
+                    if tombstone < 0:
+                        tombstone = i
+                elif hashes[i] == h and (k is key or k == key):
+                    break
+                i = (i + 1) & mask
+
+            if k is not _EMPTY:
+                # 既存のキーの値を更新する
+                values[i] = value
+                continue
+            if tombstone >= 0:
+                i = tombstone
+            else:
+                self._filled += 1
+            hashes[i] = h
+            keys[i] = key
+            values[i] = value
+            self._used += 1
+            if self._filter is not None:
+                self._filter_add(key)
+
+    def get_many(self, keys: Iterable[Any], default: Any = None) -> List[Any]:
+        """
+        複数のキーに対応する値をまとめて検索します。
+
+        Args:
+            keys (Iterable[Any]): 検索するキー
+            default (Any): キーが見つからない場合の値
+
+        Returns:
+            List[Any]: 各キーに対応する値（keys と同じ順序）
+        """
+        hashes = self._hashes
+        slots = self._keys
+        values = self._values
+        mask = self._mask
+        f = self._filter
+        result = []
+        append = result.append
+        for key in keys:
+            if f is not None and key not in f:
+                append(default)
+                continue
+            h = hash(key)
+            i = _home_slot(h, mask)
+            while True:
+                k = slots[i]
+                if k is _EMPTY:
+                    append(default)
+                    break
+                if k is not _DELETED and hashes[i] == h and (k is key or k == key):
+                    append(values[i])
+                    break
+                i = (i + 1) & mask
+        return result
+
+    def delete_many(self, keys: Iterable[Any]) -> int:
+        """
+        複数のキーに対応する要素をまとめて削除します。
+
+        テーブルの縮小は、全て削除し終えてから1回だけ行います。
+
+        Args:
+            keys (Iterable[Any]): 削除するキー（存在しないキーは無視する）
+
+        Returns:
+            int: 削除した要素の数
+        """
+        slots = self._keys
+        values = self._values
+        deleted = 0
+        for key in keys:
+            i = self._find(key, hash(key))
+            if i >= 0:
+                slots[i] = _DELETED
+                values[i] = None
+                deleted += 1
+                if self._filter is not None:
+                    self._filter.discard(key)
+        self._used -= deleted
+        self._shrink_if_sparse()
+        return deleted
+
+
+class _HashTableItemsView(ItemsView):
+    """
+    HashTable の items() が返すビュー
+
+    標準の ItemsView はキーごとに ht[key] で値を引き直すため、
+    スロットを直接たどってキーと値の組を返します。
+    """
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        table = self._mapping
+        for k, v in zip(table._keys, table._values):
+            if k is not _EMPTY and k is not _DELETED:
+                yield k, v
+
+
+class ConcurrentHashTable(MutableMapping):
+    """
+    ロックストライピングを用いた、スレッドセーフなハッシュテーブル
+
+    テーブル全体を1つのロックで守ると、読み取りも含めて全ての操作が
+    1つずつしか実行できなくなります。このクラスでは、キーを複数の
+    ストライプ（独立した HashTable）に振り分け、ストライプごとにロックを持ちます。
+    異なるストライプのキーに対する書き込みは、互いに待たずに実行できます。
+
+    読み取り（search / in / ht[key]）はロックを取りません（楽観的な読み取り）。
+    - 各ストライプは版番号（バージョン）を持ち、書き込みの前後で1ずつ増やす
+      （書き込み中は奇数になる。シーケンスロックと同じ仕組み）
+    - 読み取りは、読む前と読んだ後の版番号が同じ偶数であれば、その結果を使う
+    - 版番号が変わっていた場合は、そのストライプのロックを取って読み直す
+
+    ストライプの拡張・縮小は、新しい HashTable に要素をコピーしてから
+    参照を1回の代入で差し替えます（コピーオンライト）。
+    読み取り中のスレッドは古いテーブルを最後まで矛盾なく読めます。
+    また、拡張はそのストライプだけで行われるため、他のストライプへの
+    読み書きは止まりません。
+
+    GIL のある CPython でも、GIL のないフリースレッド版（3.13 以降）でも、
+    リストの要素や属性の読み書きは1回ずつ不可分に行われるため、
+    この仕組みで読み取りの一貫性が保たれます。
+
+    時間計算量:
+    - search / insert / delete: 平均 O(1)
+    - len: O(ストライプ数)
+
+    Attributes:
+        stripes (int): ストライプの数（2のべき乗）
+    """
+
+    def __init__(self, size: int = 10, stripes: int = 16):
+        """
+        ハッシュテーブルを初期化します。
+
+        Args:
+            size (int): テーブル全体の初期サイズの目安
+            stripes (int): ストライプ（ロック）の数の目安
+                （1以上の2のべき乗に切り上げる）
+
+        Raises:
+            ValueError: stripes が1未満の場合
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        count = 1
+        while count < stripes:
+            count <<= 1
+        self.stripes = count
+        self._stripe_bits = count.bit_length() - 1
+
+        self._tables = [HashTable(size // count) for _ in range(count)]
+        self._locks = [threading.Lock() for _ in range(count)]
+        # ストライプごとの版番号（書き込み中は奇数）
+        self._versions = [0] * count
+
+    def _stripe(self, h: int) -> int:
+        """
+        ハッシュ値からストライプの番号を求めます。
+
+        ストライプの中の HashTable は、フィボナッチハッシュで混ぜた値の
+        下位32ビットと上位32ビットを折り返してスロットを選ぶため、
+        ストライプは混ぜた値の最上位のビットで選びます。
+        ハッシュ値の下位ビットで選ぶと、下位ビットが揃ったキー（i << 20 など）が
+        1つのストライプに集まってしまいます。
+        """
+        if self._stripe_bits == 0:
+            return 0
+        return ((h & _MASK64) * _FIBONACCI_MULTIPLIER & _MASK64) >> (64 - self._stripe_bits)
+
+    def _read(self, key: Any) -> Any:
+        """
+        キーに対応する値を読み取ります（見つからない場合は _MISSING）。
+
+        まずロックを取らずに読み、その間に書き込みがあった場合だけ
+        ロックを取って読み直します。
+        """
+        h = hash(key)
+        s = self._stripe(h)
+        versions = self._versions
+        version = versions[s]
+        if not version & 1:
+            table = self._tables[s]
+            i = table._find(key, h)
+            value = table._values[i] if i >= 0 else _MISSING
+            # 読んでいる間に書き込みがなければ、その結果は一貫している
+            if versions[s] == version:
+                return value
+
+        with self._locks[s]:
+            table = self._tables[s]
+            i = table._find(key, h)
+            return table._values[i] if i >= 0 else _MISSING
+
+    def insert(self, key: Any, value: Any):
+        """
+        キーと値のペアを挿入します。
+        同じキーが既に存在する場合は、値を更新します。
+
+        Args:
+            key (Any): 挿入するキー
+            value (Any): 挿入する値
+        """
+        h = hash(key)
+        s = self._stripe(h)
+        with self._locks[s]:
+            table = self._tables[s]
+            if table._filled + 1 > table.size * _MAX_LOAD_FACTOR:
+                # その場で拡張すると読み取り中のスレッドが壊れた状態を見るため、
+                # 大きなテーブルにコピーしてから差し替える
+                table = _copy_table(table, (len(table) + 1) * 2)
+                table.insert(key, value)
+                self._publish(s, table)
+                return
+            self._versions[s] += 1
+            try:
+                table.insert(key, value)
+            finally:
+                self._versions[s] += 1
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        指定されたキーに対応する値を検索します（ロックを取らない）。
+
+        Args:
+            key (Any): 検索するキー
+
+        Returns:
+            Optional[Any]: 見つかった場合は値、見つからない場合は None
+        """
+        value = self._read(key)
+        return None if value is _MISSING else value
+
+    def delete(self, key: Any) -> bool:
+        """
+        指定されたキーに対応する要素を削除します。
+
+        Args:
+            key (Any): 削除するキー
+
+        Returns:
+            bool: 削除に成功した場合は True、キーが存在しない場合は False
+        """
+        h = hash(key)
+        s = self._stripe(h)
+        with self._locks[s]:
+            table = self._tables[s]
+            if key not in table:
+                return False
+            remaining = len(table) - 1
+            if table.size > _MIN_SIZE and remaining < table.size * _MIN_LOAD_FACTOR:
+                # 縮小も拡張と同じく、コピーしてから差し替える
+                table = _copy_table(table, remaining * 2)
+                table.delete(key)
+                self._publish(s, table)
                 return True
-        
-        # キーが見つからなかった場合は False を返す
-        return False
+            self._versions[s] += 1
+            try:
+                table.delete(key)
+            finally:
+                self._versions[s] += 1
+            return True
+
+    def _publish(self, s: int, table: HashTable):
+        """ストライプ s のテーブルを、新しいテーブルに差し替える（ロックを取った状態で呼ぶ）"""
+        self._versions[s] += 1
+        self._tables[s] = table
+        self._versions[s] += 1
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._read(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any):
+        self.insert(key, value)
+
+    def __delitem__(self, key: Any):
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._read(key) is not _MISSING
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables)
+
+    def __iter__(self) -> Iterator[Any]:
+        # ストライプごとに、ロックを取ってキーの一覧を写してから返す
+        for s in range(self.stripes):
+            with self._locks[s]:
+                keys = list(self._tables[s])
+            yield from keys
+
+
+def _copy_table(table: HashTable, size: int) -> HashTable:
+    """
+    table の全ての要素を、指定したサイズの目安の新しい HashTable にコピーする
+
+    Args:
+        table (HashTable): コピー元のテーブル（変更しない）
+        size (int): 新しいテーブルのサイズの目安
+
+    Returns:
+        HashTable: 新しいテーブル
+    """
+    copied = HashTable(size)
+    copied.insert_many(table.items())
+    return copied
+
+
+def _table_size(n: int) -> int:
+    """
+    n 以上で最小の2のべき乗を返す（ただし _MIN_SIZE 以上）
+
+    Args:
+        n (int): 必要なスロットの数
+
+    Returns:
+        int: テーブルのサイズ
+    """
+    size = _MIN_SIZE
+    while size < n:
+        size <<= 1
+    return size
@@ -0,0 +1,84 @@
+"""
+補間探索（インターポレーションサーチ）モジュール
+
+このモジュールは、値がほぼ一様に分布したソート済みリストを対象に、
+値の大きさから探索位置を推定する補間探索を実装しています。
+"""
+
+from typing import List, Union
+
+from search.binary_search import lower_bound
+
+
+# 探索範囲を半分以下に絞れなかった推定（悪い推定）がこの回数に達したら、
+# 残りの範囲を2分探索に切り替える
+_MAX_BAD_PROBES = 3
+
+Number = Union[int, float]
+
+
+def interpolation_search(data: List[Number], target: Number) -> int:
+    """
+    補間探索を用いてソート済みのリストからターゲットを探します。
+
+    2分探索が常に範囲の中央を調べるのに対し、補間探索は範囲の両端の値から
+    ターゲットがありそうな位置を直線で推定して調べます。
+    辞書で「さ」行の単語を引くとき、真ん中ではなく後ろの方から開くのと同じ考え方です。
+    タイムスタンプや連番のように値がほぼ一様に分布している場合、
+    比較の回数は O(log log n) になります。
+
+    値の分布が偏っていると推定が外れ続け、最悪 O(n) になってしまうため、
+    推定で範囲を半分以下に絞れなかった回数が一定数に達したら、
+    残りの範囲を2分探索に切り替えます（最悪でも O(log n)）。
+
+    アルゴリズムの手順:
+    1. 範囲の両端の値から、ターゲットの位置を推定する
+       pos = low + (target - data[low]) * (high - low) / (data[high] - data[low])
+    2. 推定した位置の要素とターゲットを比較し、一致すれば探索終了
+    3. 比較の結果に応じて、範囲を推定位置の左側または右側に絞る
+    4. 悪い推定が続いた場合は、残りの範囲を2分探索する
+
+    時間計算量:
+    - 平均: O(log log n) - 値が一様に分布している場合
+    - 最悪: O(log n) - 2分探索への切り替えによる
+    空間計算量: O(1)
+
+    注意: この関数は、数値（int または float）のソート済みリストを前提としています。
+
+    Args:
+        data (List[Number]): ソート済みの探索対象リスト（昇順）
+        target (Number): 探索する値
+
+    Returns:
+        int: 見つかった場合はそのインデックス、見つからない場合は -1
+    """
+    low = 0
+    high = len(data) - 1
+    bad_probes = 0
+
+    # ターゲットが範囲の値の間にある間だけ、推定を続けられる
+    while low <= high and data[low] <= target <= data[high]:
+        if data[low] == data[high]:
+            # 範囲の値が全て等しい（data[low] == target）
+            return low
+
+        # ステップ1: 値の比率からターゲットの位置を推定する
+        pos = low + int((target - data[low]) * (high - low) // (data[high] - data[low]))
+
+        # ステップ2-3: 推定した位置で比較し、範囲を絞る
+        size = high - low + 1
+        if data[pos] == target:
+            return pos
+        if data[pos] < target:
+            low = pos + 1
+        else:
+            high = pos - 1
+
+        # ステップ4: 範囲を半分以下に絞れなかった推定を数え、多すぎれば2分探索に切り替える
+        if (high - low + 1) * 2 > size:
+            bad_probes += 1
+            if bad_probes >= _MAX_BAD_PROBES:
+                index = lower_bound(data, target, low, high + 1)
+                return index if index <= high and data[index] == target else -1
+
+    return -1
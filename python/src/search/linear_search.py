@@ -3,34 +3,79 @@
 
 このモジュールは、配列の先頭から順番に要素を探索する
 最も基本的な探索アルゴリズムを実装しています。
+- linear_search: ターゲットと等しい最初の要素のインデックスを求める
+- find_all: ターゲットと等しい全ての要素のインデックスを求める
+- find_any: 複数のターゲットのどれかと等しい最初の要素を求める
+- find_if: 条件（述語）を満たす最初の要素を求める
 """
 
-from typing import List, Any, Optional
+import array
+import numbers
+from typing import List, Any, Callable, Container, Iterable, Optional, Sequence
 
+try:
+    import numpy as np
+except ImportError:  # NumPy がない環境では純粋な Python の実装を使う
+    np = None
 
-def linear_search(data: List[Any], target: Any) -> int:
+from sort.numeric_utils import as_numeric_array
+
+
+def linear_search(data: List[Any], target: Any, prefilter: Optional[Container] = None) -> int:
     """
     線形探索（リニアサーチ）を用いてリストからターゲットを探します。
-    
+
     線形探索は最も単純な探索アルゴリズムで、リストの先頭から順番に
     各要素をターゲットと比較していきます。
-    
+
     特徴:
     - ソートされていないリストでも使用可能
     - 実装が簡単
     - 小さなリストでは効率的
     - 大きなリストでは2分探索などの方が効率的
-    
+
     時間計算量: O(n) - 最悪の場合、全要素を確認する必要がある
     空間計算量: O(1) - 追加のメモリをほとんど使用しない
-    
+
+    次の場合は、Python のループの代わりに C で実装された探索を使います（高速パス）。
+    - list / tuple / array.array: index() メソッド
+    - bytes / bytearray: find() メソッド（要素は 0〜255 の int）
+    - numpy.ndarray などの数値バッファ: NumPy で全要素をまとめて比較する
+
+    見つからない探索が多い場合は、data の全要素を追加したブルームフィルタなど
+    （search.membership_filter）を prefilter に渡すと、フィルタが
+    「含まれていない」と判定した target はリストを走査せずに -1 を返します。
+
     Args:
         data (List[Any]): 探索対象のリスト（ソートされていなくてもよい）
         target (Any): 探索する値
-        
+        prefilter (Optional[Container]): data の全要素を含む所属判定フィルタ（省略可）
+
     Returns:
         int: 見つかった場合はそのインデックス（0から始まる）、見つからない場合は -1
     """
+    # フィルタで確実に含まれていないと分かれば、全要素の走査を省ける
+    if prefilter is not None and target not in prefilter:
+        return -1
+
+    # 高速パス: 組み込みのシーケンスは、C で実装された index() / find() で探索する
+    if isinstance(data, (list, tuple, array.array)):
+        try:
+            return data.index(target)
+        except ValueError:
+            return -1
+    if isinstance(data, (bytes, bytearray)):
+        if not isinstance(target, int) or not 0 <= target <= 255:
+            return -1
+        return data.find(target)
+
+    # 高速パス: 数値バッファは NumPy で全要素をまとめて比較する
+    matches = _numeric_matches(data, target)
+    if matches is not None:
+        # argmax は最初の True の位置を返す（True が無い場合は 0）
+        i = int(matches.argmax())
+        return i if matches[i] else -1
+
     # enumerate を使用してインデックスと値を同時に取得しながら探索
     # これにより、Pythonicで読みやすいコードになる
     for i, value in enumerate(data):
@@ -38,7 +83,132 @@ def linear_search(data: List[Any], target: Any) -> int:
         if value == target:
             # 一致した場合、そのインデックスを返して探索終了
             return i
-    
+
     # リストの全要素を確認しても見つからなかった場合は -1 を返す
     # -1 は「見つからなかった」ことを示す慣例的な値
     return -1
+
+
+def _numeric_matches(data: Any, target: Any, many: bool = False) -> Optional["np.ndarray"]:
+    """
+    数値バッファの各要素がターゲットと等しいかどうかを、bool の配列で返す
+
+    Args:
+        data (Any): 探索対象
+        target (Any): 探索する値（many が True の場合は値の集まり）
+        many (bool): True の場合、target のどれかと等しいかどうかを判定する
+
+    Returns:
+        Optional[np.ndarray]: 判定結果（数値バッファでない場合や、
+            ターゲットが数値でない場合は None）
+    """
+    arr = as_numeric_array(data)
+    if arr is None:
+        return None
+    targets = list(target) if many else [target]
+    if not all(isinstance(t, numbers.Real) for t in targets):
+        return None
+    try:
+        if many:
+            return np.isin(arr, targets)
+        return arr == target
+    except (OverflowError, TypeError):
+        # dtype の範囲に収まらない整数などは、Python のループで比較する
+        return None
+
+
+def find_all(data: Sequence[Any], target: Any) -> List[int]:
+    """
+    ターゲットと等しい全ての要素のインデックスを返します。
+
+    list / tuple は index() を、bytes / bytearray は find() を繰り返し呼び、
+    数値バッファは NumPy でまとめて比較します。
+
+    時間計算量: O(n)
+
+    Args:
+        data (Sequence[Any]): 探索対象のシーケンス
+        target (Any): 探索する値
+
+    Returns:
+        List[int]: 見つかった要素のインデックス（昇順、見つからない場合は空のリスト）
+    """
+    if isinstance(data, (list, tuple, bytes, bytearray)):
+        if isinstance(data, (bytes, bytearray)):
+            if not isinstance(target, int) or not 0 <= target <= 255:
+                return []
+            search = data.find
+        else:
+            search = data.index
+        # 前回見つかった位置の次から探し直す（各要素は1回ずつしか比較しない）
+        result = []
+        i = -1
+        try:
+            while True:
+                i = search(target, i + 1)
+                if i < 0:
+                    break
+                result.append(i)
+        except ValueError:
+            pass
+        return result
+
+    matches = _numeric_matches(data, target)
+    if matches is not None:
+        return np.flatnonzero(matches).tolist()
+
+    return [i for i, value in enumerate(data) if value == target]
+
+
+def find_any(data: Sequence[Any], targets: Iterable[Any]) -> int:
+    """
+    複数のターゲットのどれかと等しい、最初の要素のインデックスを返します。
+
+    ターゲットごとに linear_search を呼ぶと、データを m 回走査することになります
+    （O(nm)）。ここではターゲットを set にまとめ、データを1回だけ走査しながら
+    各要素が set に含まれるかを O(1) で確認します（O(n + m)）。
+    ターゲットはハッシュ可能である必要があります。
+
+    時間計算量: O(n + m) - m はターゲットの数
+
+    Args:
+        data (Sequence[Any]): 探索対象のシーケンス
+        targets (Iterable[Any]): 探索する値の集まり
+
+    Returns:
+        int: 最初に見つかった要素のインデックス、見つからない場合は -1
+    """
+    wanted = set(targets)
+    if not wanted:
+        return -1
+
+    matches = _numeric_matches(data, wanted, many=True)
+    if matches is not None:
+        i = int(matches.argmax())
+        return i if matches[i] else -1
+
+    for i, value in enumerate(data):
+        try:
+            if value in wanted:
+                return i
+        except TypeError:
+            # ハッシュできない要素は、どのターゲットとも等しくないものとする
+            continue
+    return -1
+
+
+def find_if(data: Iterable[Any], predicate: Callable[[Any], bool]) -> int:
+    """
+    条件（述語）を満たす最初の要素のインデックスを返します。
+
+    時間計算量: O(n)
+
+    Args:
+        data (Iterable[Any]): 探索対象
+        predicate (Callable[[Any], bool]): 要素を受け取り、条件を満たす場合に
+            True を返す関数
+
+    Returns:
+        int: 最初に条件を満たした要素のインデックス、見つからない場合は -1
+    """
+    return next((i for i, value in enumerate(data) if predicate(value)), -1)
@@ -0,0 +1,445 @@
+"""
+確率的な所属判定フィルタモジュール
+
+このモジュールは、「キーが集合に含まれているかどうか」を少ないメモリで
+高速に判定するフィルタ（ブルームフィルタ / カッコウフィルタ）を実装しています。
+
+どちらのフィルタも次の性質を持ちます。
+- 「含まれていない」と判定したキーは、確実に含まれていない（偽陰性がない）
+- 「含まれている」と判定したキーは、まれに実際には含まれていない（偽陽性がある）
+
+そのため、探索の前にフィルタで確認すれば、見つからない探索の大半を
+ハッシュテーブルのスロットやリストを読む前に打ち切れます。
+HashTable には attach_filter() で取り付けられます。
+
+フィルタは to_bytes() / from_bytes() でバイト列に変換して保存し、
+別のプロセスで読み込んで使い回せます。
+"""
+
+import hashlib
+import math
+import random
+import struct
+from typing import Any, Iterable
+
+
+# シリアライズしたフィルタの先頭のヘッダ: マジックナンバー, 形式のバージョン, 容量, 要素数, パラメータ
+# （パラメータはブルームフィルタではハッシュ関数の数、カッコウフィルタではバケットの大きさ）
+_HEADER = struct.Struct("<4sIQQI")
+_BLOOM_MAGIC = b"BLMF"
+_CUCKOO_MAGIC = b"CKOF"
+_VERSION = 1
+
+_MASK32 = (1 << 32) - 1
+_MASK64 = (1 << 64) - 1
+
+# ハッシュ値の上位ビットに全てのビットを混ぜるためのフィボナッチハッシュの定数
+_FIBONACCI_MULTIPLIER = 0x9E3779B97F4A7C15
+
+# カッコウフィルタのバケットの要素数の上限の割合
+# （バケットの大きさが4なら、95% 程度まで詰めても挿入がほぼ失敗しない）
+_CUCKOO_MAX_LOAD = 0.95
+
+# カッコウフィルタの挿入で、指紋を追い出して移し替える回数の上限
+_MAX_KICKS = 500
+
+
+def _mix64(x: int) -> int:
+    """64ビット整数のビットをよく混ぜる（splitmix64 の最終段）"""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def _key_hash(key: Any) -> int:
+    """
+    キーの64ビットのハッシュ値を返す
+
+    組み込みの hash() は str / bytes に対してプロセスごとに異なる値を返すため
+    （ハッシュのランダム化）、str / bytes は blake2b でハッシュします。
+    それ以外のキーは hash() の値を混ぜて使います。
+    保存したフィルタを別のプロセスで使う場合、キーは str / bytes / int など
+    hash() がプロセスによらず同じ値になる型にしてください。
+    """
+    if isinstance(key, str):
+        data = key.encode("utf-8", "surrogatepass")
+    elif isinstance(key, (bytes, bytearray, memoryview)):
+        data = bytes(key)
+    else:
+        return _mix64(hash(key) & _MASK64)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def _unpack_header(data: bytes, magic: bytes, name: str):
+    """ヘッダを読み、(容量, 要素数, パラメータ, 本体) を返す"""
+    try:
+        found, version, capacity, count, param = _HEADER.unpack_from(data, 0)
+    except struct.error:
+        raise ValueError(f"not a serialized {name}")
+    if found != magic or version != _VERSION:
+        raise ValueError(f"not a serialized {name} (version {_VERSION})")
+    return capacity, count, param, data[_HEADER.size:]
+
+
+class BloomFilter:
+    """
+    ブルームフィルタ
+
+    m ビットのビット列（bytearray）と k 個のハッシュ関数を使います。
+    - add: キーの k 個のハッシュ値の位置のビットを 1 にする
+    - in:  k 個の位置のビットが全て 1 なら「含まれている（かもしれない）」
+
+    容量（capacity）と偽陽性率（error_rate）から、最適なビット数と
+    ハッシュ関数の数を求めます。
+    - m = -n ln(p) / (ln 2)^2
+    - k = (m / n) ln 2
+    k 個のハッシュ値は、1つの64ビットのハッシュ値の上下32ビットから
+    h1 + i * h2 として作ります（ダブルハッシング）。
+
+    キーを削除することはできません（ビットを 0 に戻すと、同じビットを使う
+    他のキーまで「含まれていない」になってしまうため）。
+    容量を超えてキーを追加すると、偽陽性率が上がります。
+
+    時間計算量:
+    - add / in: O(k)
+    空間計算量: O(m) ビット（偽陽性率 1% なら1要素あたり約 9.6 ビット）
+
+    Attributes:
+        capacity (int): 想定する要素数
+        error_rate (float): 容量まで追加したときの偽陽性率
+        bit_count (int): ビット列の長さ（m）
+        hash_count (int): ハッシュ関数の数（k）
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        空のブルームフィルタを作成します。
+
+        Args:
+            capacity (int): 想定する要素数（1以上）
+            error_rate (float): 偽陽性率（0 < error_rate < 1）
+
+        Raises:
+            ValueError: capacity が1未満、または error_rate が範囲外の場合
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bit_count = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self._bits = bytearray((self.bit_count + 7) // 8)
+        self._count = 0
+
+    def _positions(self, key: Any):
+        """キーの k 個のビットの位置を返す"""
+        h = _key_hash(key)
+        h1 = h & _MASK32
+        # h2 を奇数にして、同じ位置ばかりにならないようにする
+        h2 = (h >> 32) | 1
+        m = self.bit_count
+        return [(h1 + i * h2) % m for i in range(self.hash_count)]
+
+    def add(self, key: Any) -> bool:
+        """
+        キーを追加します。
+
+        Args:
+            key (Any): 追加するキー
+
+        Returns:
+            bool: 常に True（カッコウフィルタと同じ使い方ができるようにする）
+        """
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+        return True
+
+    def update(self, keys: Iterable[Any]):
+        """複数のキーを追加します。"""
+        for key in keys:
+            self.add(key)
+
+    def discard(self, key: Any) -> bool:
+        """
+        何もしません（ブルームフィルタはキーを削除できない）。
+
+        削除したキーのビットは残るため、そのキーは偽陽性として
+        「含まれている」と判定され続けます。
+
+        Returns:
+            bool: 常に False
+        """
+        return False
+
+    def __contains__(self, key: Any) -> bool:
+        bits = self._bits
+        for pos in self._positions(key):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        # 追加した回数（同じキーを2回追加すると2と数える）
+        return self._count
+
+    def _with_capacity(self, capacity: int) -> "BloomFilter":
+        """同じ偽陽性率で、容量の異なる空のフィルタを返す"""
+        return BloomFilter(capacity, self.error_rate)
+
+    def to_bytes(self) -> bytes:
+        """
+        フィルタをバイト列に変換します（from_bytes で元に戻せる）。
+
+        Returns:
+            bytes: ヘッダ・偽陽性率・ビット列を並べたバイト列
+        """
+        header = _HEADER.pack(_BLOOM_MAGIC, _VERSION, self.capacity, self._count, self.hash_count)
+        return header + struct.pack("<d", self.error_rate) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """
+        to_bytes で変換したバイト列から、フィルタを復元します。
+
+        Args:
+            data (bytes): to_bytes の結果
+
+        Returns:
+            BloomFilter: 復元したフィルタ
+
+        Raises:
+            ValueError: ブルームフィルタのバイト列でない場合
+        """
+        capacity, count, hash_count, body = _unpack_header(data, _BLOOM_MAGIC, "BloomFilter")
+        (error_rate,) = struct.unpack_from("<d", body, 0)
+        bloom = cls(capacity, error_rate)
+        bits = body[8:]
+        if hash_count != bloom.hash_count or len(bits) != len(bloom._bits):
+            raise ValueError("corrupted BloomFilter data")
+        bloom._bits[:] = bits
+        bloom._count = count
+        return bloom
+
+
+class CuckooFilter:
+    """
+    カッコウフィルタ
+
+    キーそのものではなく、キーの短い指紋（1バイト）をバケットに格納します。
+    各キーには候補のバケットが2つあり、その2つのどちらかに指紋があれば
+    「含まれている（かもしれない）」と判定します。
+    ブルームフィルタと異なり、キーを削除できます。
+
+    - 1つ目のバケット i1 はハッシュ値から、2つ目のバケット i2 は
+      i1 と指紋から i2 = i1 xor hash(指紋) として求める
+      （指紋だけから、もう一方のバケットを求められる）
+    - 両方のバケットが埋まっていたら、どちらかの指紋を追い出して
+      その指紋のもう一方のバケットに移す（カッコウの托卵のように）
+    - 指紋は bytearray に格納する（1バイト、0 は空のスロット）
+
+    偽陽性率は 2 * bucket_size / 255（バケットの大きさが4なら約 3%）です。
+    追い出しを繰り返しても格納できない場合（ほぼ満杯の場合）は、
+    add が False を返します。
+
+    時間計算量:
+    - in / discard: O(bucket_size)
+    - add: 平均 O(1)
+    空間計算量: 1要素あたり約 8.4 ビット
+
+    Attributes:
+        capacity (int): 想定する要素数
+        bucket_size (int): 1つのバケットに格納できる指紋の数
+        bucket_count (int): バケットの数（2のべき乗）
+    """
+
+    def __init__(self, capacity: int, bucket_size: int = 4):
+        """
+        空のカッコウフィルタを作成します。
+
+        Args:
+            capacity (int): 想定する要素数（1以上）
+            bucket_size (int): 1つのバケットに格納できる指紋の数（1以上）
+
+        Raises:
+            ValueError: capacity または bucket_size が1未満の場合
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if bucket_size < 1:
+            raise ValueError("bucket_size must be at least 1")
+        self.capacity = capacity
+        self.bucket_size = bucket_size
+        bucket_count = 1
+        while bucket_count * bucket_size * _CUCKOO_MAX_LOAD < capacity:
+            bucket_count <<= 1
+        self.bucket_count = bucket_count
+        self._mask = bucket_count - 1
+        self._slots = bytearray(bucket_count * bucket_size)
+        self._count = 0
+        # 追い出しの上限に達して格納できなかった指紋（バケット, 指紋）
+        self._victim = None
+        # 追い出す指紋を選ぶ乱数（結果を再現できるよう、固定のシードを使う）
+        self._random = random.Random(0)
+
+    def _fingerprint(self, key: Any):
+        """キーの (1つ目のバケット, 指紋) を返す（指紋は 1〜255）"""
+        h = _key_hash(key)
+        return h & self._mask, (h >> 56) % 255 + 1
+
+    def _alternate(self, i: int, fingerprint: int) -> int:
+        """指紋のもう一方のバケットを返す（2回求めると元のバケットに戻る）"""
+        return (i ^ ((fingerprint * _FIBONACCI_MULTIPLIER) >> 32)) & self._mask
+
+    def _bucket_insert(self, i: int, fingerprint: int) -> bool:
+        """バケットの空いているスロットに指紋を格納する"""
+        start = i * self.bucket_size
+        j = self._slots.find(0, start, start + self.bucket_size)
+        if j < 0:
+            return False
+        self._slots[j] = fingerprint
+        return True
+
+    def _bucket_contains(self, i: int, fingerprint: int) -> bool:
+        start = i * self.bucket_size
+        return self._slots.find(fingerprint, start, start + self.bucket_size) >= 0
+
+    def add(self, key: Any) -> bool:
+        """
+        キーを追加します。
+
+        Args:
+            key (Any): 追加するキー
+
+        Returns:
+            bool: 追加できた場合は True、フィルタが満杯で追加できなかった場合は False
+        """
+        if self._victim is not None:
+            return False
+        i, fingerprint = self._fingerprint(key)
+        self._count += 1
+        return self._place(i, fingerprint)
+
+    def _place(self, i: int, fingerprint: int) -> bool:
+        """
+        指紋をバケット i かもう一方のバケットに格納する
+
+        両方のバケットが埋まっていたら、指紋を追い出しながら空きを探します。
+        格納できなかった場合は、最後に追い出された指紋を _victim に覚えておき
+        （捨てると偽陰性になるため）、False を返します。
+        """
+        if self._bucket_insert(i, fingerprint):
+            return True
+        i = self._alternate(i, fingerprint)
+        if self._bucket_insert(i, fingerprint):
+            return True
+
+        slots = self._slots
+        for _ in range(_MAX_KICKS):
+            j = i * self.bucket_size + self._random.randrange(self.bucket_size)
+            fingerprint, slots[j] = slots[j], fingerprint
+            i = self._alternate(i, fingerprint)
+            if self._bucket_insert(i, fingerprint):
+                return True
+        self._victim = (i, fingerprint)
+        return False
+
+    def update(self, keys: Iterable[Any]) -> bool:
+        """
+        複数のキーを追加します。
+
+        Returns:
+            bool: 全て追加できた場合は True
+        """
+        return all([self.add(key) for key in keys])
+
+    def discard(self, key: Any) -> bool:
+        """
+        キーを削除します。
+
+        追加していないキーを削除すると、同じ指紋を持つ別のキーが
+        削除されてしまう（偽陰性になる）ことがあります。
+        追加したことが分かっているキーだけを削除してください。
+
+        Args:
+            key (Any): 削除するキー
+
+        Returns:
+            bool: キーの指紋を削除した場合は True、見つからなかった場合は False
+        """
+        i1, fingerprint = self._fingerprint(key)
+        i2 = self._alternate(i1, fingerprint)
+        victim = self._victim
+        if victim is not None and victim[1] == fingerprint and victim[0] in (i1, i2):
+            self._victim = None
+            self._count -= 1
+            return True
+        for i in (i1, i2):
+            start = i * self.bucket_size
+            j = self._slots.find(fingerprint, start, start + self.bucket_size)
+            if j >= 0:
+                self._slots[j] = 0
+                self._count -= 1
+                if victim is not None:
+                    # 空きができたので、格納できなかった指紋を入れ直す
+                    self._victim = None
+                    self._place(*victim)
+                return True
+        return False
+
+    def __contains__(self, key: Any) -> bool:
+        i1, fingerprint = self._fingerprint(key)
+        if self._bucket_contains(i1, fingerprint):
+            return True
+        i2 = self._alternate(i1, fingerprint)
+        if self._bucket_contains(i2, fingerprint):
+            return True
+        victim = self._victim
+        return victim is not None and victim[1] == fingerprint and victim[0] in (i1, i2)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _with_capacity(self, capacity: int) -> "CuckooFilter":
+        """同じバケットの大きさで、容量の異なる空のフィルタを返す"""
+        return CuckooFilter(capacity, self.bucket_size)
+
+    def to_bytes(self) -> bytes:
+        """
+        フィルタをバイト列に変換します（from_bytes で元に戻せる）。
+
+        Returns:
+            bytes: ヘッダ・格納できなかった指紋・指紋の配列を並べたバイト列
+        """
+        header = _HEADER.pack(_CUCKOO_MAGIC, _VERSION, self.capacity, self._count, self.bucket_size)
+        victim_bucket, victim_fingerprint = self._victim or (0, 0)
+        return header + struct.pack("<QB", victim_bucket, victim_fingerprint) + bytes(self._slots)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CuckooFilter":
+        """
+        to_bytes で変換したバイト列から、フィルタを復元します。
+
+        Args:
+            data (bytes): to_bytes の結果
+
+        Returns:
+            CuckooFilter: 復元したフィルタ
+
+        Raises:
+            ValueError: カッコウフィルタのバイト列でない場合
+        """
+        capacity, count, bucket_size, body = _unpack_header(data, _CUCKOO_MAGIC, "CuckooFilter")
+        cuckoo = cls(capacity, bucket_size)
+        victim_bucket, victim_fingerprint = struct.unpack_from("<QB", body, 0)
+        slots = body[9:]
+        if len(slots) != len(cuckoo._slots):
+            raise ValueError("corrupted CuckooFilter data")
+        cuckoo._slots[:] = slots
+        cuckoo._count = count
+        if victim_fingerprint:
+            cuckoo._victim = (victim_bucket, victim_fingerprint)
+        return cuckoo
@@ -0,0 +1,373 @@
+"""
+メモリマップによる永続ハッシュインデックスモジュール
+
+このモジュールは、キーと値のペアをファイルに書き出したハッシュインデックスと、
+そのファイルを mmap で開いて検索するクラスを実装しています。
+一度ファイルを作っておけば、各プロセスは起動のたびに HashTable を
+作り直す必要がなく、ファイルを開くだけで（ほぼ一瞬で）検索を始められます。
+
+コマンドラインからインデックスを作成・検索することもできます:
+    python src/search/persistent_hash_index.py build pairs.tsv index.bin
+    python src/search/persistent_hash_index.py get index.bin some-key
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Mapping
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+
+# ファイルの先頭のヘッダ: マジックナンバー, 形式のバージョン, スロット数, 要素数, 値ヒープの開始位置
+_HEADER = struct.Struct("<4sIQQQ")
+_MAGIC = b"PHIX"
+_VERSION = 1
+
+# スロット: キーのハッシュ値, レコードの位置（ファイルの先頭からのバイト数。0 は空のスロット）
+_SLOT = struct.Struct("<QQ")
+
+# レコードのヘッダ: キーの型, 値の型, キーのバイト数, 値のバイト数
+# （レコード本体はヘッダの直後にキー、その直後に値が続く）
+_RECORD = struct.Struct("<BBII")
+
+# キーと値の型を表す番号（str は UTF-8 で格納する）
+_TYPE_BYTES = 0
+_TYPE_STR = 1
+
+# スロット数は要素数のこの倍数以上の2のべき乗にする（負荷率 1/2 以下）
+_SLOTS_PER_ITEM = 2
+
+Key = Union[str, bytes]
+Value = Union[str, bytes]
+
+
+def _encode(obj: Key) -> Tuple[int, bytes]:
+    """str / bytes を (型の番号, バイト列) に変換する"""
+    if isinstance(obj, str):
+        return _TYPE_STR, obj.encode("utf-8")
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return _TYPE_BYTES, bytes(obj)
+    raise TypeError(f"keys and values must be str or bytes, got {type(obj).__name__}")
+
+
+def _decode(kind: int, data: Union[bytes, memoryview]) -> Value:
+    """(型の番号, バイト列) を str / bytes に戻す"""
+    if kind == _TYPE_STR:
+        return str(data, "utf-8")
+    return bytes(data)
+
+
+def _stable_hash(kind: int, data: bytes) -> int:
+    """
+    プロセスをまたいで同じ値になる64ビットのハッシュ値を返す
+
+    組み込みの hash() は str / bytes に対してプロセスごとに異なる値を返すため
+    （ハッシュのランダム化）、ファイルに保存するハッシュ値には使えません。
+    型の番号も含めてハッシュするため、"a" と b"a" は別のキーになります。
+    """
+    digest = hashlib.blake2b(data, digest_size=8, person=bytes([kind]) * 16).digest()
+    return int.from_bytes(digest, "little")
+
+
+def build_hash_index(path: str, items: Union[Mapping, Iterable[Tuple[Key, Value]]]) -> int:
+    """
+    キーと値のペアから、永続ハッシュインデックスのファイルを作成します。
+
+    ファイルの形式（数値は全てリトルエンディアン）:
+    1. ヘッダ（32バイト）
+    2. スロットの配列（スロット数 × 16バイト）
+       各スロットはキーのハッシュ値と、レコードの位置を持つ（線形探査）
+    3. 値ヒープ: レコード（型・長さのヘッダ + キー + 値）を順に並べたもの
+
+    同じキーが複数ある場合は、後のペアの値で上書きされます。
+    書き込みは一時ファイルに行い、完成してから置き換えるため、
+    作成中のファイルを他のプロセスが開いてしまうことはありません。
+
+    Args:
+        path (str): 作成するファイルのパス
+        items (Union[Mapping, Iterable[Tuple[Key, Value]]]):
+            格納するペア（辞書や HashTable、または (キー, 値) のイテラブル）
+            キーと値は str または bytes
+
+    Returns:
+        int: 格納した要素の数
+
+    Raises:
+        TypeError: キーまたは値が str / bytes でない場合
+    """
+    pairs = items.items() if isinstance(items, Mapping) else items
+
+    # 同じキーは後の値で上書きする（キーはエンコード済みの形で比較する）
+    records = {}
+    for key, value in pairs:
+        records[_encode(key)] = _encode(value)
+
+    count = len(records)
+    slot_count = 1
+    while slot_count < max(count * _SLOTS_PER_ITEM, 1):
+        slot_count <<= 1
+    mask = slot_count - 1
+    heap_offset = _HEADER.size + slot_count * _SLOT.size
+
+    # スロットの配列をメモリ上で組み立て、レコードは値ヒープに順に並べる
+    slots = bytearray(slot_count * _SLOT.size)
+    heap = bytearray()
+    for (key_kind, key_data), (value_kind, value_data) in records.items():
+        h = _stable_hash(key_kind, key_data)
+        i = h & mask
+        while _SLOT.unpack_from(slots, i * _SLOT.size)[1] != 0:
+            i = (i + 1) & mask
+        _SLOT.pack_into(slots, i * _SLOT.size, h, heap_offset + len(heap))
+        heap += _RECORD.pack(key_kind, value_kind, len(key_data), len(value_data))
+        heap += key_data
+        heap += value_data
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, slot_count, count, heap_offset))
+            f.write(slots)
+            f.write(heap)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # 書き込みや置き換えに失敗したら、作りかけの一時ファイルを残さない
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return count
+
+
+class PersistentHashIndex(Mapping):
+    """
+    mmap で開いた永続ハッシュインデックス（読み取り専用）
+
+    build_hash_index で作成したファイルを mmap でメモリに対応付けて検索します。
+    - 開くときにファイル全体を読み込まないため、要素数によらずすぐに使い始められる
+      （実際に読んだページだけが、OS によって必要なときに読み込まれる）
+    - 読み取り専用で対応付けるため、同じファイルを開いた複数のプロセスは
+      OS のページキャッシュ上の同じメモリを共有する
+    - スロットやレコードはファイル上の位置から直接読み（struct.unpack_from）、
+      キーの比較も memoryview で行うため、検索のたびにコピーが発生しない
+
+    search() は HashTable.search と同じく、見つかった場合は値、
+    見つからない場合は None を返します。
+    collections.abc.Mapping を実装しているため、ht[key]・key in ht・len(ht)・
+    for key in ht なども使えます。
+
+    時間計算量:
+    - 開く: O(1)
+    - search / in: 平均 O(1)
+
+    使い終わったら close() を呼ぶか、with 文で使ってください。
+    """
+
+    def __init__(self, path: str):
+        """
+        インデックスのファイルを開きます。
+
+        Args:
+            path (str): build_hash_index で作成したファイルのパス
+
+        Raises:
+            ValueError: ファイルの形式が正しくない場合や、ヘッダの内容が
+                ファイルの大きさと合わない場合（途中で切れたファイルなど）
+        """
+        self._path = path
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # 空のファイルは mmap できない
+                raise ValueError(f"{path} is not a hash index file") from None
+        self._view = memoryview(self._mmap)
+        self._size = len(self._mmap)
+        try:
+            magic, version, slot_count, count, heap_offset = _HEADER.unpack_from(self._view, 0)
+        except struct.error:
+            self.close()
+            raise ValueError(f"{path} is not a hash index file")
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a hash index file (version {_VERSION})")
+        # 検索で読む範囲がファイルに収まることを、開くときに確かめておく
+        # （スロット数は2のべき乗で、負荷率は 1/2 以下。値ヒープはスロットの配列の直後から始まる）
+        if (slot_count < 1 or slot_count & (slot_count - 1)
+                or count > slot_count // _SLOTS_PER_ITEM
+                or heap_offset != _HEADER.size + slot_count * _SLOT.size
+                or heap_offset > self._size):
+            self.close()
+            raise ValueError(f"{path} is corrupt or truncated (header does not match file size {self._size})")
+        self._heap_offset = heap_offset
+        self._mask = slot_count - 1
+        self._count = count
+        self.slot_count = slot_count
+
+    def close(self):
+        """ファイルの対応付けを解除します。"""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._mmap.close()
+
+    def __enter__(self) -> "PersistentHashIndex":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _find(self, key: Key) -> int:
+        """
+        キーのレコードの位置を返します（見つからない場合は 0）。
+
+        HashTable と同じく、スロットに保存したハッシュ値が一致した場合だけ
+        レコードのキーを比較します。
+        """
+        kind, data = _encode(key)
+        h = _stable_hash(kind, data)
+        view = self._view
+        mask = self._mask
+        i = h & mask
+        # 壊れたファイルで空きスロットが無くても止まるように、最大でスロット数だけ調べる
+        for _ in range(self.slot_count):
+            slot_hash, offset = _SLOT.unpack_from(view, _HEADER.size + i * _SLOT.size)
+            if offset == 0:
+                return 0
+            if slot_hash == h:
+                key_kind, _, key_len, _ = self._record(offset)
+                start = offset + _RECORD.size
+                if key_kind == kind and view[start:start + key_len] == data:
+                    return offset
+            i = (i + 1) & mask
+        return 0
+
+    def _record(self, offset: int) -> Tuple[int, int, int, int]:
+        """
+        位置 offset のレコードのヘッダ (キーの型, 値の型, キーのバイト数, 値のバイト数) を返します。
+
+        Raises:
+            ValueError: レコードが値ヒープの範囲に収まっていない場合
+        """
+        if offset < self._heap_offset or offset + _RECORD.size > self._size:
+            raise ValueError(f"{self._path} is corrupt (record offset {offset} is out of range)")
+        header = _RECORD.unpack_from(self._view, offset)
+        if offset + _RECORD.size + header[2] + header[3] > self._size:
+            raise ValueError(f"{self._path} is corrupt (record at {offset} runs past the end of the file)")
+        return header
+
+    def search_view(self, key: Key) -> Optional[memoryview]:
+        """
+        キーに対応する値のバイト列を、コピーせずに memoryview で返します。
+
+        返した memoryview を使っている間は close() できません
+        （使い終わったら release() してください）。
+
+        Args:
+            key (Key): 検索するキー
+
+        Returns:
+            Optional[memoryview]: 値のバイト列（str の値は UTF-8）、見つからない場合は None
+        """
+        offset = self._find(key)
+        if offset == 0:
+            return None
+        _, _, key_len, value_len = self._record(offset)
+        start = offset + _RECORD.size + key_len
+        return self._view[start:start + value_len]
+
+    def search(self, key: Key) -> Optional[Value]:
+        """
+        指定されたキーに対応する値を検索します。
+
+        Args:
+            key (Key): 検索するキー
+
+        Returns:
+            Optional[Value]: 見つかった場合は値（格納したときと同じ str / bytes）、
+                見つからない場合は None
+        """
+        offset = self._find(key)
+        if offset == 0:
+            return None
+        _, value_kind, key_len, value_len = self._record(offset)
+        start = offset + _RECORD.size + key_len
+        return _decode(value_kind, self._view[start:start + value_len])
+
+    def __getitem__(self, key: Key) -> Value:
+        value = self.search(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            return self._find(key) != 0
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Key]:
+        # スロットの順にキーを返す
+        view = self._view
+        for i in range(self.slot_count):
+            _, offset = _SLOT.unpack_from(view, _HEADER.size + i * _SLOT.size)
+            if offset:
+                key_kind, _, key_len, _ = self._record(offset)
+                start = offset + _RECORD.size
+                yield _decode(key_kind, view[start:start + key_len])
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    コマンドラインからインデックスを作成・検索する
+
+    build: タブ区切りのテキスト（1行に「キー<TAB>値」）からインデックスを作成する
+    get:   インデックスからキーを検索し、値を表示する
+
+    Returns:
+        int: 終了コード（get で見つからないキーがあった場合は 1）
+    """
+    parser = argparse.ArgumentParser(description="Build or query a persistent hash index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="build an index from a key<TAB>value text file")
+    build.add_argument("input", help="input text file (UTF-8, one key<TAB>value pair per line)")
+    build.add_argument("output", help="index file to create")
+    build.add_argument("--delimiter", default="\t", help="separator between key and value (default: TAB)")
+
+    get = commands.add_parser("get", help="look up keys in an index")
+    get.add_argument("index", help="index file")
+    get.add_argument("keys", nargs="+", help="keys to look up")
+
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        def read_pairs():
+            with open(args.input, encoding="utf-8") as f:
+                for line in f:
+                    key, _, value = line.rstrip("\r\n").partition(args.delimiter)
+                    yield key, value
+
+        count = build_hash_index(args.output, read_pairs())
+        print(f"wrote {count} keys to {args.output}")
+        return 0
+
+    status = 0
+    with PersistentHashIndex(args.index) as index:
+        for key in args.keys:
+            value = index.search(key)
+            if value is None:
+                print(f"{key}: not found", file=sys.stderr)
+                status = 1
+            else:
+                print(f"{key}\t{value}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Eytzinger 配置の探索インデックスモジュール
+
+このモジュールは、ソート済みのデータを Eytzinger 配置（幅優先の順序）に
+並べ直し、同じデータに対する2分探索を繰り返し高速に行うための
+インデックスを実装しています。
+"""
+
+import array
+from typing import Any, List, Sequence
+
+from sort.numeric_utils import packed_typecode
+
+
+class SortedIndex:
+    """
+    Eytzinger 配置を用いた、ソート済みデータの探索インデックス
+
+    通常の2分探索は、探索のたびに配列の中央・1/4・3/4 ... と離れた位置を
+    飛び回るため、大きな配列ではほぼ毎回キャッシュミスが起こります。
+
+    Eytzinger 配置では、2分探索木を幅優先の順序で配列に格納します。
+    - 位置 k の要素の左の子は 2k、右の子は 2k + 1（位置は1始まり）
+    - 探索の最初の数段で読む要素が配列の先頭に集まるため、キャッシュに残りやすい
+    - 次に読む位置が 2k か 2k + 1 のどちらか（隣り合う）なので、先読みが効きやすい
+
+    探索では比較の結果（True = 1 / False = 0）をそのまま位置の計算に使い、
+    条件分岐を使わずに木を下ります（分岐なしの探索）。
+
+    キーが全て int（64ビットに収まる）または float の場合は、
+    キーを array.array に詰めて格納し、メモリを節約します。
+    それ以外のキーは list に格納します。
+
+    時間計算量:
+    - 構築: O(n)
+    - search / lower_bound / in: O(log n)
+    空間計算量: O(n)
+
+    Attributes:
+        typecode (Optional[str]): キーを格納する array.array の型コード
+            （list に格納する場合は None）
+    """
+
+    def __init__(self, data: Sequence[Any]):
+        """
+        ソート済みのデータからインデックスを構築します。
+
+        Args:
+            data (Sequence[Any]): ソート済みのデータ（昇順）
+        """
+        n = len(data)
+        self._n = n
+        self.typecode = packed_typecode(data) if n > 0 else None
+
+        # 位置 0 は使わない（位置を1始まりにすると、子の位置が 2k / 2k+1 になる）
+        keys: Any
+        if self.typecode is not None:
+            keys = array.array(self.typecode, [0]) * (n + 1)
+        else:
+            keys = [None] * (n + 1)
+        # Eytzinger 配置での位置から、元のデータでのインデックスへの対応表
+        positions = array.array('q', [0]) * (n + 1)
+
+        # 木を中間順（左の子 → 自分 → 右の子）にたどり、ソート順にキーを配置する
+        # 中間順でたどる順序は、元のデータのソート順と一致する
+        i = 0
+        k = 1
+        while True:
+            # 左の子をたどれるだけたどる
+            while k <= n:
+                k <<= 1
+            # 左の子から戻ってきた最初の祖先まで上る
+            # （k の下位の連続する1のビット数 + 1 だけ右にシフトする）
+            k >>= ((~k) & (k + 1)).bit_length()
+            if k == 0:
+                break
+            keys[k] = data[i]
+            positions[k] = i
+            i += 1
+            # 右の子に進む
+            k = 2 * k + 1
+
+        self._keys = keys
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __contains__(self, target: Any) -> bool:
+        return self.search(target) != -1
+
+    def _descend(self, target: Any) -> int:
+        """
+        target 以上の最初のキーの、Eytzinger 配置での位置を返す（無い場合は 0）
+
+        根から、キーが target 未満なら右の子へ、そうでなければ左の子へ進み、
+        葉を越えるまで下ります。最後に左の子へ進んだ位置が答えになります。
+        """
+        keys = self._keys
+        n = self._n
+        k = 1
+        while k <= n:
+            # 比較の結果（0 または 1）をそのまま子の選択に使う
+            k = 2 * k + (keys[k] < target)
+        # 最後に左へ進んだ位置まで戻る
+        # （下位の連続する1は「右へ進んだ」記録なので、それらと最後の0を取り除く）
+        return k >> ((~k) & (k + 1)).bit_length()
+
+    def search(self, target: Any) -> int:
+        """
+        target を探し、元のデータでのインデックスを返します。
+        （binary_search と同じ戻り値）
+
+        target と等しいキーが複数ある場合は、その中で最も左のインデックスを返します。
+
+        Args:
+            target (Any): 探索する値
+
+        Returns:
+            int: 見つかった場合はそのインデックス、見つからない場合は -1
+        """
+        k = self._descend(target)
+        if k == 0 or self._keys[k] != target:
+            return -1
+        return self._positions[k]
+
+    def lower_bound(self, target: Any) -> int:
+        """
+        元のデータで、target 以上の最初の要素のインデックスを返します。
+        （search.binary_search.lower_bound と同じ戻り値）
+
+        Args:
+            target (Any): 探索する値
+
+        Returns:
+            int: target 以上の最初の要素のインデックス（無い場合はデータの長さ）
+        """
+        k = self._descend(target)
+        if k == 0:
+            return self._n
+        return self._positions[k]
+
+    def search_many(self, targets: Sequence[Any]) -> List[int]:
+        """
+        複数のターゲットを探し、それぞれのインデックスを返します。
+
+        Args:
+            targets (Sequence[Any]): 探索する値のリスト
+
+        Returns:
+            List[int]: 各ターゲットの search の結果（targets と同じ順序）
+        """
+        search = self.search
+        return [search(target) for target in targets]
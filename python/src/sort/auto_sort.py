@@ -0,0 +1,81 @@
+"""
+ソートアルゴリズム自動選択モジュール
+
+このモジュールは、データ（キー）の種類を調べて、最も適したソート
+アルゴリズムを自動的に選んで実行する関数を実装しています。
+"""
+
+from typing import List, Any, Callable, Optional
+
+from sort.key_utils import keyed_sort
+from sort.numeric_utils import numeric_sort
+from sort.radix_sort import _sort_by_int_keys
+from sort.tim_sort import tim_sort
+
+
+# キーの範囲がこの値（または要素数の COUNTING_RANGE_FACTOR 倍）以下なら計数ソートを使う
+_COUNTING_MIN_RANGE = 256
+_COUNTING_RANGE_FACTOR = 2
+
+# キーの範囲がこのビット数以下の整数なら基数ソートを使う（64ビット = 最大8パス）
+_RADIX_MAX_BITS = 64
+
+
+def auto_sort(
+    data: List[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> List[Any]:
+    """
+    キーの種類に応じてソートアルゴリズムを選び、リストを昇順にソートします。
+    （リスト自体を変更します - 破壊的メソッド）
+
+    選択の規則:
+    1. 全てのキーが整数で、範囲（最大値 - 最小値）が狭い場合: 計数ソート
+       - 範囲が max(256, 2n) 以下のとき
+    2. 全てのキーが整数で、範囲が64ビットに収まる場合: LSD 基数ソート
+    3. それ以外の場合: ティムソート（比較ソート）
+
+    キー関数は、どのアルゴリズムを選ぶ場合も各要素につき1回だけ呼ばれます。
+    どのアルゴリズムも安定なので、結果は sorted(data, key=key, reverse=reverse)
+    と一致します。
+
+    key を指定せずに NumPy の配列などの数値バッファを渡した場合は、
+    上の規則によらず安定な np.sort でその場でソートします。
+
+    Args:
+        data (List[Any]): ソート対象のリスト
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものを比較する）
+        reverse (bool): True の場合は降順にソートする
+
+    Returns:
+        List[Any]: ソートされたリスト（元のリストと同じ参照）
+    """
+    n = len(data)
+    if n < 2:
+        return data
+
+    # NumPy の配列などの数値バッファは、安定な np.sort でその場でソートする
+    if key is None and numeric_sort(data, "stable", reverse):
+        return data
+
+    keys = data if key is None else [key(item) for item in data]
+
+    # bool も int のサブクラスだが、ここでは純粋な int だけを対象とする
+    if all(type(k) is int for k in keys):
+        low = min(keys)
+        high = max(keys)
+        key_range = high - low + 1
+        if key_range <= max(_COUNTING_MIN_RANGE, _COUNTING_RANGE_FACTOR * n):
+            data[:] = _sort_by_int_keys(data, keys, reverse, counting=True)
+            return data
+        if key_range.bit_length() <= _RADIX_MAX_BITS:
+            data[:] = _sort_by_int_keys(data, keys, reverse, counting=False)
+            return data
+
+    # 整数以外のキーは比較ソートで並べる（計算済みのキーを再利用する）
+    if key is None and not reverse:
+        return tim_sort(data)
+    data[:] = keyed_sort(data, tim_sort, reverse=reverse, keys=keys)
+    return data
@@ -5,10 +5,17 @@
 最も基本的なソートアルゴリズムであるバブルソートを実装しています。
 """
 
-from typing import List, Any
+from typing import List, Any, Callable, Optional
 
+from sort.key_utils import keyed_sort
+from sort.numeric_utils import numeric_sort
 
-def bubble_sort(data: List[Any]) -> List[Any]:
+
+def bubble_sort(
+    data: List[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> List[Any]:
     """
     バブルソートを用いてリストを昇順にソートします。
     （リスト自体を変更します - 破壊的メソッド）
@@ -31,10 +38,22 @@ def bubble_sort(data: List[Any]) -> List[Any]:
     
     Args:
         data (List[Any]): ソート対象のリスト
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものを比較する）
+        reverse (bool): True の場合は降順にソートする
         
     Returns:
         List[Any]: ソートされたリスト（元のリストと同じ参照）
     """
+    # NumPy の配列などの数値バッファは、np.sort(kind="stable") でその場でソートする
+    if key is None and numeric_sort(data, "stable", reverse):
+        return data
+
+    # key または reverse が指定された場合は、キーを1回だけ計算してからソートする
+    if key is not None or reverse:
+        data[:] = keyed_sort(data, bubble_sort, key, reverse)
+        return data
+
     # リストの要素数を取得
     n = len(data)
     
@@ -0,0 +1,327 @@
+"""
+外部ソート（External Sort）モジュール
+
+このモジュールは、メモリに載り切らない大きなファイルをソートするための
+外部マージソートを実装しています。
+ファイルをメモリに収まる大きさの塊に分けてソートし、一時ファイルに
+書き出したソート済みの塊（ラン）を k-way マージでまとめます。
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+from operator import itemgetter
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional, Tuple
+
+from sort.heap_sort import _heapify_min
+from sort.merge_sort import merge_sort
+
+
+# レコード1件あたりの、バイト列の中身以外のメモリ使用量の目安
+# （bytes オブジェクトのヘッダとリストのポインタ）
+_RECORD_OVERHEAD = sys.getsizeof(b"") + 8
+
+# (キー, レコード) の組からキーを取り出す関数
+_PAIR_KEY = itemgetter(0)
+
+
+def external_sort(
+    path: str,
+    record_size: Optional[int] = None,
+    memory_limit: int = 64 * 1024 * 1024,
+    fan_in: int = 16,
+    key: Optional[Callable[[bytes], Any]] = None,
+    reverse: bool = False,
+    tmp_dir: Optional[str] = None,
+) -> Iterator[bytes]:
+    """
+    ファイルのレコードを外部マージソートで昇順にソートし、順番に返します。
+    （ジェネレータ - ソート済みのレコードを1件ずつ返す）
+
+    外部ソートは、メモリ（内部記憶）に収まらないデータを、ディスク
+    （外部記憶）を使ってソートする手法です。
+
+    アルゴリズムの手順:
+    1. ファイルから memory_limit に収まるだけのレコードを読み込む
+    2. 読み込んだ塊を merge_sort でソートし、一時ファイル（ラン）に書き出す
+    3. ファイルの末尾まで1-2を繰り返す
+    4. ランが fan_in 個より多い場合は、fan_in 個ずつマージして新しいランにする
+    5. 残ったランを最小ヒープを使った k-way マージでまとめ、1件ずつ返す
+
+    レコードの形式:
+    - record_size が None の場合: 改行区切りのテキスト
+      （返すレコードには、行末の改行コード \n または \r\n の1つだけを含まない。
+      それより前にある \r はレコードの一部として残す）
+    - record_size が整数の場合: 固定長のバイナリレコード
+
+    key を指定した場合、キーは各レコードにつき1回だけ計算します。
+    ランにはレコードとキーの組を pickle で書き出し、何段階マージしても
+    書き出したキーを読み直して比較します（キーは pickle できる必要がある）。
+
+    時間計算量: O(n log n)
+    空間計算量: メモリは O(memory_limit)、ディスクは O(n)
+    安定性: 安定（同じキーのレコードの相対的な順序が保持される）
+
+    Args:
+        path (str): ソート対象のファイルのパス
+        record_size (Optional[int]): 固定長レコードのバイト数（None の場合は改行区切り）
+        memory_limit (int): ソートに使うメモリの目安（バイト）
+        fan_in (int): 1回のマージでまとめるランの最大数（2以上）
+        key (Optional[Callable[[bytes], Any]]): 比較に使うキーを返す関数
+        reverse (bool): True の場合は降順にソートする
+        tmp_dir (Optional[str]): 一時ファイルを作成するディレクトリ
+
+    Returns:
+        Iterator[bytes]: ソート済みのレコードを返すイテレータ
+
+    Raises:
+        ValueError: fan_in が2未満、または record_size が1未満の場合
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    if record_size is not None and record_size < 1:
+        raise ValueError("record_size must be positive")
+
+    # マージ時は fan_in 個の入力と1つの出力でメモリを分け合う
+    buffer_size = max(memory_limit // (fan_in + 1), 4096)
+    # key を指定した場合は、ランに (キー, レコード) の組を書き出す
+    keyed = key is not None
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        # ステップ1-3: ソート済みのランを作る
+        with open(path, "rb") as source:
+            runs = []
+            for chunk, last in _read_chunks(source, record_size, memory_limit):
+                if last and not runs:
+                    # ファイル全体がメモリに収まる場合は、一時ファイルを使わない
+                    yield from merge_sort(chunk, key=key, reverse=reverse)
+                    return
+                if key is None:
+                    run = merge_sort(chunk, reverse=reverse)
+                else:
+                    # キーを1回だけ計算し、(キー, レコード) の組をキーの順に並べる
+                    run = merge_sort([(key(record), record) for record in chunk],
+                                     key=_PAIR_KEY, reverse=reverse)
+                runs.append(_write_run(work_dir, len(runs), run, record_size, buffer_size, keyed))
+                # 次の塊を読み込む前に、書き出し終えた塊を手放す
+                # （メモリに同時に載る塊を1つまでにする）
+                del chunk, run
+
+        # ステップ4: ランの数が fan_in 以下になるまで、多段階でマージする
+        while len(runs) > fan_in:
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                pairs = _merge_runs(group, record_size, buffer_size, keyed, reverse)
+                if not keyed:
+                    pairs = (record for _, record in pairs)
+                merged.append(_write_run(work_dir, len(runs) + len(merged), pairs, record_size, buffer_size, keyed))
+                # マージし終えたランはすぐに削除してディスクを空ける
+                for run_path in group:
+                    os.remove(run_path)
+            runs = merged
+
+        # ステップ5: 最後のマージの結果を1件ずつ返す
+        for _, record in _merge_runs(runs, record_size, buffer_size, keyed, reverse):
+            yield record
+
+
+def _read_records(source: BinaryIO, record_size: Optional[int], crlf: bool = True) -> Iterator[bytes]:
+    """
+    ファイルからレコードを1件ずつ読み込む
+
+    Args:
+        source (BinaryIO): 読み込むファイル
+        record_size (Optional[int]): 固定長レコードのバイト数（None の場合は改行区切り）
+        crlf (bool): True の場合は行末の \r\n も改行コードとして取り除く
+            （ランは \n だけで区切って書き出すため、ランを読むときは False にする）
+
+    Returns:
+        Iterator[bytes]: レコードを返すイテレータ
+    """
+    if record_size is None:
+        for line in source:
+            # 行末の改行コードを1つだけ取り除く（レコードの末尾の \r は残す）
+            if crlf and line.endswith(b"\r\n"):
+                yield line[:-2]
+            elif line.endswith(b"\n"):
+                yield line[:-1]
+            else:
+                yield line
+    else:
+        while True:
+            record = source.read(record_size)
+            if not record:
+                break
+            if len(record) != record_size:
+                raise ValueError("file size is not a multiple of record_size")
+            yield record
+
+
+def _read_chunks(
+    source: BinaryIO, record_size: Optional[int], memory_limit: int
+) -> Iterator[Tuple[List[bytes], bool]]:
+    """
+    memory_limit に収まるだけのレコードをまとめて返す
+
+    塊が最後かどうかは、次のレコードを1件だけ先読みして判定します
+    （次の塊を丸ごと読み込まないので、メモリに載る塊は常に1つまで）。
+
+    Args:
+        source (BinaryIO): 読み込むファイル
+        record_size (Optional[int]): 固定長レコードのバイト数（None の場合は改行区切り）
+        memory_limit (int): 1つの塊のメモリ使用量の目安（バイト）
+
+    Returns:
+        Iterator[Tuple[List[bytes], bool]]: (レコードのリスト, 最後の塊かどうか) を返すイテレータ
+            （空のファイルの場合は何も返さない）
+    """
+    records = _read_records(source, record_size)
+    chunk = []
+    used = 0
+    for record in records:
+        chunk.append(record)
+        used += len(record) + _RECORD_OVERHEAD
+        if used >= memory_limit:
+            following = next(records, None)
+            yield chunk, following is None
+            if following is None:
+                return
+            chunk = [following]
+            used = len(following) + _RECORD_OVERHEAD
+    if chunk:
+        yield chunk, True
+
+
+def _write_run(
+    work_dir: str, number: int, records, record_size: Optional[int], buffer_size: int, keyed: bool = False
+) -> str:
+    """
+    ソート済みのレコードを一時ファイル（ラン）に書き出す
+
+    Args:
+        work_dir (str): 一時ファイルを作成するディレクトリ
+        number (int): ランの番号（ファイル名に使う）
+        records: ソート済みのレコード（keyed が True の場合は (キー, レコード) の組）のイテラブル
+        record_size (Optional[int]): 固定長レコードのバイト数（None の場合は改行区切り）
+        buffer_size (int): 書き込みバッファの大きさ（バイト）
+        keyed (bool): True の場合は (キー, レコード) の組を pickle で書き出す
+
+    Returns:
+        str: 書き出したファイルのパス
+    """
+    run_path = os.path.join(work_dir, f"run_{number:06d}")
+    with open(run_path, "wb", buffering=buffer_size) as run:
+        if keyed:
+            # 組ごとに独立して書き出す（Pickler を使い回すと、書いた全ての組を覚えてしまう）
+            for pair in records:
+                pickle.dump(pair, run, pickle.HIGHEST_PROTOCOL)
+        elif record_size is None:
+            for record in records:
+                run.write(record)
+                run.write(b"\n")
+        else:
+            for record in records:
+                run.write(record)
+    return run_path
+
+
+class _ReverseKey:
+    """大小関係を逆にしたキー（降順のマージで最大の要素から取り出すために使う）"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "_ReverseKey") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ReverseKey) and self.value == other.value
+
+
+def _read_run(source: BinaryIO, record_size: Optional[int], keyed: bool) -> Iterator[Tuple[Any, bytes]]:
+    """
+    ランから (キー, レコード) の組を1件ずつ読み込む
+
+    Args:
+        source (BinaryIO): 読み込むラン
+        record_size (Optional[int]): 固定長レコードのバイト数（None の場合は改行区切り）
+        keyed (bool): True の場合は pickle で書き出した組を読む
+            （False の場合は、レコードそのものをキーとする）
+
+    Returns:
+        Iterator[Tuple[Any, bytes]]: (キー, レコード) の組を返すイテレータ
+    """
+    if keyed:
+        while True:
+            try:
+                yield pickle.load(source)
+            except EOFError:
+                return
+    for record in _read_records(source, record_size, crlf=False):
+        yield record, record
+
+
+def _merge_runs(
+    run_paths: List[str],
+    record_size: Optional[int],
+    buffer_size: int,
+    keyed: bool,
+    reverse: bool,
+) -> Iterator[Tuple[Any, bytes]]:
+    """
+    ソート済みのランを最小ヒープで k-way マージし、(キー, レコード) の組を1件ずつ返す
+
+    各ランの先頭の組を (キー, ランの番号, レコード) にして最小ヒープに入れ、
+    ルート（最小の組）を返しては、同じランの次の組で置き換えて
+    _heapify_min でヒープを整えることを繰り返します。
+    キーはランに書き出したものを読むだけで、計算し直しません。
+    キーが等しい場合はランの番号が小さい方（ファイルの前の方）が先に出るため安定です。
+
+    Args:
+        run_paths (List[str]): ランのファイルパスのリスト（ファイルの前の方から順に）
+        record_size (Optional[int]): 固定長レコードのバイト数（None の場合は改行区切り）
+        buffer_size (int): 読み込みバッファの大きさ（バイト、ランごと）
+        keyed (bool): ランに (キー, レコード) の組を書き出したかどうか
+        reverse (bool): True の場合は降順にマージする
+
+    Returns:
+        Iterator[Tuple[Any, bytes]]: マージされた (キー, レコード) の組を返すイテレータ
+    """
+    files = [open(run_path, "rb", buffering=buffer_size) for run_path in run_paths]
+    try:
+        readers = [_read_run(f, record_size, keyed) for f in files]
+
+        # 各ランの先頭の組でヒープを作る
+        heap: List[Tuple[Any, int, bytes, Any]] = []
+        for number, reader in enumerate(readers):
+            pair = next(reader, None)
+            if pair is not None:
+                key, record = pair
+                heap.append((_ReverseKey(key) if reverse else key, number, record, key))
+        n = len(heap)
+        for i in range(n // 2 - 1, -1, -1):
+            _heapify_min(heap, n, i)
+
+        while n > 0:
+            _, number, record, key = heap[0]
+            yield key, record
+
+            following = next(readers[number], None)
+            if following is not None:
+                # ルートを同じランの次の組で置き換える
+                key, record = following
+                heap[0] = (_ReverseKey(key) if reverse else key, number, record, key)
+            else:
+                # ランを使い切ったので、末尾の要素をルートに移してヒープを縮める
+                n -= 1
+                heap[0] = heap[n]
+                heap.pop()
+            if n > 0:
+                _heapify_min(heap, n, 0)
+    finally:
+        for f in files:
+            f.close()
@@ -0,0 +1,115 @@
+"""
+ギャロッピング（指数探索で挿入位置を求める処理）を共通で提供するモジュール
+
+ソート済みの範囲で、探索を始める位置（hint）の近くにある挿入位置を
+O(log d)（d は hint からの距離）で求めます。
+- gallop_left: 等しい要素の左側の位置（bisect.bisect_left と同じ意味）
+- gallop_right: 等しい要素の右側の位置（bisect.bisect_right と同じ意味）
+
+ティムソートのマージ（sort.tim_sort）と、多数のターゲットのまとめて探索
+（search.binary_search.binary_search_many）で使います。
+"""
+
+from typing import Any, Sequence
+
+
+def gallop_left(key: Any, a: Sequence[Any], base: int, length: int, hint: int) -> int:
+    """
+    ソート済みの範囲 a[base:base+length] で、key を挿入すべき最も左の位置を返す
+
+    a[base + k - 1] < key <= a[base + k] を満たす k を返します。
+    hint の位置から 1, 3, 7, 15, ... と指数的に間隔を広げて範囲を絞り、
+    最後に2分探索を行います（指数探索）。
+
+    Args:
+        key (Any): 挿入する値
+        a (Sequence[Any]): 対象のシーケンス
+        base (int): 範囲の開始インデックス
+        length (int): 範囲の長さ
+        hint (int): 探索を始める位置（0 <= hint < length）
+
+    Returns:
+        int: 挿入位置（base からのオフセット）
+    """
+    last_ofs = 0
+    ofs = 1
+    if a[base + hint] < key:
+        # 右方向に指数探索: a[base+hint+last_ofs] < key <= a[base+hint+ofs]
+        max_ofs = length - hint
+        while ofs < max_ofs and a[base + hint + ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs += hint
+        ofs += hint
+    else:
+        # 左方向に指数探索: a[base+hint-ofs] < key <= a[base+hint-last_ofs]
+        max_ofs = hint + 1
+        while ofs < max_ofs and not a[base + hint - ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+
+    # a[base+last_ofs] < key <= a[base+ofs] の範囲を2分探索で絞り込む
+    last_ofs += 1
+    while last_ofs < ofs:
+        mid = last_ofs + ((ofs - last_ofs) >> 1)
+        if a[base + mid] < key:
+            last_ofs = mid + 1
+        else:
+            ofs = mid
+    return ofs
+
+
+def gallop_right(key: Any, a: Sequence[Any], base: int, length: int, hint: int) -> int:
+    """
+    ソート済みの範囲 a[base:base+length] で、key を挿入すべき最も右の位置を返す
+
+    a[base + k - 1] <= key < a[base + k] を満たす k を返します。
+    等しい要素の右側を返す点が gallop_left との違いで、
+    マージの安定性を保つために使い分けます。
+
+    Args:
+        key (Any): 挿入する値
+        a (Sequence[Any]): 対象のシーケンス
+        base (int): 範囲の開始インデックス
+        length (int): 範囲の長さ
+        hint (int): 探索を始める位置（0 <= hint < length）
+
+    Returns:
+        int: 挿入位置（base からのオフセット）
+    """
+    last_ofs = 0
+    ofs = 1
+    if key < a[base + hint]:
+        # 左方向に指数探索: a[base+hint-ofs] <= key < a[base+hint-last_ofs]
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < a[base + hint - ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+    else:
+        # 右方向に指数探索: a[base+hint+last_ofs] <= key < a[base+hint+ofs]
+        max_ofs = length - hint
+        while ofs < max_ofs and not key < a[base + hint + ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs += hint
+        ofs += hint
+
+    # a[base+last_ofs] <= key < a[base+ofs] の範囲を2分探索で絞り込む
+    last_ofs += 1
+    while last_ofs < ofs:
+        mid = last_ofs + ((ofs - last_ofs) >> 1)
+        if key < a[base + mid]:
+            ofs = mid
+        else:
+            last_ofs = mid + 1
+    return ofs
@@ -5,10 +5,17 @@
 ヒープソートアルゴリズムを実装しています。
 """
 
-from typing import List, Any
+from typing import List, Any, Callable, Optional
 
+from sort.key_utils import keyed_sort
+from sort.numeric_utils import numeric_sort
 
-def heap_sort(data: List[Any]) -> List[Any]:
+
+def heap_sort(
+    data: List[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> List[Any]:
     """
     ヒープソートを用いてリストを昇順にソートします。
     （リスト自体を変更します - 破壊的メソッド）
@@ -37,10 +44,22 @@ def heap_sort(data: List[Any]) -> List[Any]:
     
     Args:
         data (List[Any]): ソート対象のリスト
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものを比較する）
+        reverse (bool): True の場合は降順にソートする
         
     Returns:
         List[Any]: ソートされたリスト（元のリストと同じ参照）
     """
+    # NumPy の配列などの数値バッファは、np.sort(kind="heapsort") でその場でソートする
+    if key is None and numeric_sort(data, "heapsort", reverse):
+        return data
+
+    # key または reverse が指定された場合は、キーを1回だけ計算してからソートする
+    if key is not None or reverse:
+        data[:] = keyed_sort(data, heap_sort, key, reverse)
+        return data
+
     n = len(data)
 
     # ステップ1: リストを最大ヒープに変換（ヒープの構築）
@@ -73,32 +92,121 @@ def _heapify(data: List[Any], n: int, i: int):
     指定されたノード i を根とする部分木を最大ヒープに変換します。
     子ノードは既にヒープ条件を満たしていることを前提とします。
     
+    ボトムアップ方式（Floyd の方法）で、再帰を使わずに処理します。
+    1. 根の値を取り出し、大きい方の子を1段ずつ引き上げながら葉まで下りる
+       （各段の比較は「左右の子どうし」の1回だけ）
+    2. 空いた葉の位置から、取り出した値を入るべき位置まで上に戻す
+    ヒープソートでは根に置かれる値（末尾から来た値）は小さいことが多く、
+    ほぼ葉まで下りるため、親と子を毎段比較する方法より比較回数がほぼ半分になります。
+    
     Args:
         data (List[Any]): 対象のリスト
         n (int): ヒープとして扱う範囲（リストの先頭からn要素）
         i (int): ヒープ化の対象となるノードのインデックス
     """
-    # 最大値のインデックス（初期値は現在のノード）
-    largest = i
+    # 根の値を取り出しておく（この位置は「穴」になる）
+    item = data[i]
+    start = i
+    
+    # ステップ1: 大きい方の子を引き上げながら、穴を葉まで下ろす
+    child = 2 * i + 1
+    while child < n:
+        # 右の子が存在し、左の子より大きければ右の子を選ぶ
+        right = child + 1
+        if right < n and data[child] < data[right]:
+            child = right
+        # 選んだ子を穴に引き上げ、穴を1段下ろす
+        data[i] = data[child]
+        i = child
+        child = 2 * i + 1
     
-    # 左の子のインデックスを計算
-    l = 2 * i + 1
-    # 右の子のインデックスを計算
-    r = 2 * i + 2
+    # ステップ2: 取り出した値を、葉の位置から入るべき位置まで上に戻す
+    while i > start:
+        parent = (i - 1) // 2
+        if data[parent] < item:
+            data[i] = data[parent]
+            i = parent
+        else:
+            break
+    data[i] = item
+
 
-    # 左の子が存在し、かつ親より大きい場合
-    if l < n and data[l] > data[largest]:
-        largest = l
+def _heapify_min(data: List[Any], n: int, i: int, arity: int = 2, track: bool = False):
+    """
+    最小ヒープ版の _heapify（d 分ヒープにも対応）
+    
+    指定されたノード i を根とする部分木を最小ヒープに変換します。
+    _heapify と同じく、子ノードは既にヒープ条件を満たしていることを前提とし、
+    ボトムアップ方式で最も小さい子を引き上げながら葉まで下りてから、
+    取り出した値を上に戻します。
+    
+    d 分ヒープ（各ノードの子が arity 個）の場合、ノード i の子は
+    arity*i + 1 から arity*i + arity まで、親は (i - 1) // arity です。
+    
+    外部ソートの k-way マージや優先度付きキュー（Heap / PriorityQueue）など、
+    「最小の要素を繰り返し取り出す」用途で使います。
+    
+    Args:
+        data (List[Any]): 対象のリスト
+        n (int): ヒープとして扱う範囲（リストの先頭からn要素）
+        i (int): ヒープ化の対象となるノードのインデックス
+        arity (int): 各ノードの子の数（2なら二分ヒープ）
+        track (bool): True の場合、移動した要素の index 属性を新しい位置に更新する
+    """
+    item = data[i]
+    start = i
+    
+    # ステップ1: 最も小さい子を引き上げながら、穴を葉まで下ろす
+    child = arity * i + 1
+    while child < n:
+        smallest = child
+        for c in range(child + 1, min(child + arity, n)):
+            if data[c] < data[smallest]:
+                smallest = c
+        data[i] = data[smallest]
+        if track:
+            data[i].index = i
+        i = smallest
+        child = arity * i + 1
+    
+    # ステップ2: 取り出した値を、葉の位置から入るべき位置まで上に戻す
+    while i > start:
+        parent = (i - 1) // arity
+        if item < data[parent]:
+            data[i] = data[parent]
+            if track:
+                data[i].index = i
+            i = parent
+        else:
+            break
+    data[i] = item
+    if track:
+        item.index = i
 
-    # 右の子が存在し、かつ現在の最大値より大きい場合
-    if r < n and data[r] > data[largest]:
-        largest = r
 
-    # 最大値が親ノードでない場合、交換してヒープ条件を満たす
-    if largest != i:
-        # 親と最大の子を交換
-        data[i], data[largest] = data[largest], data[i]
-        
-        # 交換された子ノードの部分木も再帰的にヒープ化
-        # 交換によりヒープ条件が崩れた可能性があるため
-        _heapify(data, n, largest)
+def _sift_up_min(data: List[Any], i: int, arity: int = 2, track: bool = False):
+    """
+    最小ヒープで、位置 i の要素を入るべき位置まで上に移動する
+    
+    末尾に要素を追加したときや、要素の優先度を小さくしたとき（decrease-key）に
+    ヒープ条件を回復するために使います。
+    
+    Args:
+        data (List[Any]): 対象のリスト（ヒープ）
+        i (int): 移動する要素のインデックス
+        arity (int): 各ノードの子の数（2なら二分ヒープ）
+        track (bool): True の場合、移動した要素の index 属性を新しい位置に更新する
+    """
+    item = data[i]
+    while i > 0:
+        parent = (i - 1) // arity
+        if item < data[parent]:
+            data[i] = data[parent]
+            if track:
+                data[i].index = i
+            i = parent
+        else:
+            break
+    data[i] = item
+    if track:
+        item.index = i
@@ -0,0 +1,65 @@
+"""
+ソート関数の key / reverse 引数を共通で処理するモジュール
+
+このモジュールは、各ソートモジュールが key= と reverse= を受け付けるための
+「デコレート・ソート・アンデコレート」（シュワルツ変換）を実装しています。
+"""
+
+from typing import List, Any, Callable, Optional, Sequence, Tuple
+
+
+def keyed_sort(
+    data: Sequence[Any],
+    sorter: Callable[[List[Tuple[Any, int]]], List[Tuple[Any, int]]],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    keys: Optional[Sequence[Any]] = None,
+) -> List[Any]:
+    """
+    キー関数と降順指定に対応したソートを、任意のソート関数で行います。
+    （新しいリストを返します - 非破壊的メソッド）
+
+    比較のたびにキー関数を呼ぶと、キーの計算が O(n log n) 回（単純なソートでは
+    O(n²) 回）発生します。ここでは「シュワルツ変換」と呼ばれる手法で、
+    キーを要素ごとに1回だけ計算します。
+
+    アルゴリズムの手順:
+    1. 各要素のキーを1回だけ計算し、(キー, 元の位置) の組のリストを作る
+    2. 組のリストを sorter でソートする
+       - キーが等しい場合は元の位置で比較されるため、要素そのものは比較されない
+    3. ソートされた組の「元の位置」を使って、元の要素を並べ直す
+
+    降順の場合は (キー, -元の位置) の組を昇順にソートしてから反転します。
+    これにより、キーが等しい要素は元の順序のまま残ります（sorted() と同じ）。
+
+    時間計算量: キー関数の呼び出しは O(n) 回 + sorter の計算量
+    空間計算量: O(n) - 組のリストと並べ直したリスト
+
+    Args:
+        data (Sequence[Any]): ソート対象のシーケンス（変更されない）
+        sorter: (キー, 位置) の組のリストを昇順にソートして返す関数
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （None の場合は要素そのものをキーとする）
+        reverse (bool): True の場合は降順にソートする
+        keys (Optional[Sequence[Any]]): 計算済みのキーのリスト
+            （指定された場合は key を呼ばずにこちらを使う）
+
+    Returns:
+        List[Any]: ソートされた新しいリスト
+    """
+    # ステップ1: キーを1回だけ計算して、(キー, 元の位置) の組を作る
+    if keys is None:
+        keys = data if key is None else [key(item) for item in data]
+    if reverse:
+        decorated = [(k, -i) for i, k in enumerate(keys)]
+    else:
+        decorated = [(k, i) for i, k in enumerate(keys)]
+
+    # ステップ2: 組のリストをソートする
+    # 破壊的なソート関数も非破壊的なソート関数も、戻り値を使えば同じように扱える
+    decorated = sorter(decorated)
+
+    # ステップ3: 元の位置を使って要素を並べ直す
+    if reverse:
+        return [data[-i] for _, i in reversed(decorated)]
+    return [data[i] for _, i in decorated]
@@ -5,10 +5,18 @@
 マージソートを実装しています。
 """
 
-from typing import List, Any
+import array
+from typing import List, Any, Callable, MutableSequence, Optional
 
+from sort.key_utils import keyed_sort
+from sort.numeric_utils import numeric_sort, numeric_sorted
 
-def merge_sort(data: List[Any]) -> List[Any]:
+
+def merge_sort(
+    data: List[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> List[Any]:
     """
     マージソートを用いてリストを昇順にソートします。
     （新しいリストを返します - 非破壊的メソッド）
@@ -28,10 +36,23 @@ def merge_sort(data: List[Any]) -> List[Any]:
     
     Args:
         data (List[Any]): ソート対象のリスト
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものを比較する）
+        reverse (bool): True の場合は降順にソートする
         
     Returns:
         List[Any]: ソートされた新しいリスト（元のリストは変更されない）
     """
+    # NumPy の配列などの数値バッファは、安定な np.sort でソートした新しいリストを返す
+    if key is None:
+        result = numeric_sorted(data, "stable", reverse)
+        if result is not None:
+            return result
+
+    # key または reverse が指定された場合は、キーを1回だけ計算してからソートする
+    if key is not None or reverse:
+        return keyed_sort(data, merge_sort, key, reverse)
+
     # 基底ケース: 要素が1つ以下のリストは既にソート済み
     if len(data) <= 1:
         return data
@@ -85,3 +106,139 @@ def _merge(left: List[Any], right: List[Any]) -> List[Any]:
     result.extend(right[j:])
     
     return result
+
+
+def merge_sort_bottom_up(
+    data: MutableSequence[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> MutableSequence[Any]:
+    """
+    ボトムアップ（非再帰）のマージソートでシーケンスを昇順にソートします。
+    （シーケンス自体を変更します - 破壊的メソッド）
+    
+    再帰版の merge_sort は分割のたびにスライスで新しいリストを作るため、
+    全体で O(n log n) 個の一時リストが生まれます。
+    この実装では大きさ n の作業用バッファを1つだけ確保し、
+    元のシーケンスとバッファの間で交互に（ピンポン方式で）マージします。
+    
+    アルゴリズムの手順:
+    1. 長さ1の区間を「ソート済みの区間」とみなす
+    2. 隣り合う区間どうしを、もう一方のバッファへマージする
+    3. 区間の長さを2倍にし、読み書きするバッファを入れ替える
+    4. 区間の長さが全体以上になるまで2-3を繰り返す
+    
+    時間計算量: O(n log n) - 常に同じ
+    空間計算量: O(n) - 作業用バッファ1つだけ
+    安定性: 安定（同じ値の要素の相対的な順序が保持される）
+    
+    list のほか、array.array や書き込み可能な memoryview も受け付けます。
+    その場合、作業用バッファも同じ型コードの array.array になります。
+    (memoryview の場合は、その array.array を包んだ memoryview)
+    
+    Args:
+        data (MutableSequence[Any]): ソート対象のシーケンス
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものを比較する）
+        reverse (bool): True の場合は降順にソートする
+        
+    Returns:
+        MutableSequence[Any]: ソートされたシーケンス（元のシーケンスと同じ参照）
+    """
+    # NumPy の配列などの数値バッファは、安定な np.sort でその場でソートする
+    if key is None and numeric_sort(data, "stable", reverse):
+        return data
+
+    # key または reverse が指定された場合は、キーを1回だけ計算してからソートする
+    if key is not None or reverse:
+        for i, item in enumerate(keyed_sort(data, merge_sort_bottom_up, key, reverse)):
+            data[i] = item
+        return data
+
+    n = len(data)
+    if n <= 1:
+        return data
+
+    # 必要なマージのパス数 ceil(log2(n)) が奇数だと、最後の書き込み先が
+    # バッファ側になってしまう。その場合は最初のパス（長さ1の区間どうしの
+    # マージ）を隣り合う2要素の交換としてその場で済ませ、パス数を偶数にする
+    # これにより、書き戻しのための一時的なメモリ確保が不要になる
+    width = 1
+    if (n - 1).bit_length() % 2 == 1:
+        for i in range(0, n - 1, 2):
+            if data[i + 1] < data[i]:
+                data[i], data[i + 1] = data[i + 1], data[i]
+        width = 2
+
+    # 作業用バッファを1つだけ確保する
+    src = data
+    dst = _make_buffer(data)
+
+    # 区間の長さを倍にしながらマージを繰り返す
+    while width < n:
+        _merge_pass(src, dst, width, n)
+        # 次のパスでは読み書きするバッファを入れ替える（ピンポン方式）
+        src, dst = dst, src
+        width *= 2
+
+    # パス数が偶数なので、最後の書き込み先は元のシーケンスになっている
+    return data
+
+
+def _make_buffer(data: MutableSequence[Any]) -> MutableSequence[Any]:
+    """
+    data と同じ長さ・同じ要素型の作業用バッファを作成する
+    
+    Args:
+        data (MutableSequence[Any]): 元のシーケンス
+        
+    Returns:
+        MutableSequence[Any]: data の内容をコピーしたバッファ
+    """
+    if isinstance(data, array.array):
+        # array.array のスライスは同じ型コードの新しい配列になる
+        return data[:]
+    if isinstance(data, memoryview):
+        # memoryview のスライスは同じメモリを参照してしまうため、
+        # 同じ型コードの array.array に要素をコピーする
+        # スライス代入の型を揃えるため、バッファも memoryview で包む
+        return memoryview(array.array(data.format, data))
+    return list(data)
+
+
+def _merge_pass(src: MutableSequence[Any], dst: MutableSequence[Any], width: int, n: int):
+    """
+    長さ width のソート済み区間を2つずつ src から dst へマージする
+    
+    Args:
+        src (MutableSequence[Any]): 読み込み元（長さ width ごとにソート済み）
+        dst (MutableSequence[Any]): 書き込み先
+        width (int): ソート済み区間の長さ
+        n (int): 要素数
+    """
+    for low in range(0, n, 2 * width):
+        mid = min(low + width, n)
+        high = min(low + 2 * width, n)
+        i = low
+        j = mid
+        k = low
+        # 両方の区間に要素が残っている間、小さい方を書き込む
+        # 等しい場合は左側を優先することで安定性を保つ
+        while i < mid and j < high:
+            if src[j] < src[i]:
+                dst[k] = src[j]
+                j += 1
+            else:
+                dst[k] = src[i]
+                i += 1
+            k += 1
+        # 残りの要素を書き込む
+        # スライス代入は一時的なコピーを作るため、1要素ずつ書き込む
+        while i < mid:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+        while j < high:
+            dst[k] = src[j]
+            j += 1
+            k += 1
@@ -0,0 +1,173 @@
+"""
+数値配列のベクトル化ユーティリティモジュール
+
+このモジュールは、numpy.ndarray・array.array・memoryview など、
+バッファプロトコルに対応した数値の配列を NumPy でまとめて処理するための
+共通の関数を実装しています。
+
+Python のループで1要素ずつ比較・交換する代わりに、NumPy の関数
+（np.sort / np.partition / np.searchsorted）に配列全体を渡すことで、
+数十〜数百倍高速になります。
+NumPy がない環境や、list など数値の配列以外が渡された場合は None / False を返し、
+呼び出し側は純粋な Python の実装を使います。
+
+また、複数のプロセスで処理を分担する関数が共通で使う、区間の分割と
+array.array の型コードの判定もここにまとめています。
+"""
+
+import array
+from typing import Any, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy がない環境では純粋な Python の実装を使う
+    np = None
+
+
+# ベクトル化の対象とする dtype の種類（符号付き整数・符号なし整数・浮動小数点数）
+_NUMERIC_KINDS = "iuf"
+
+# 整数キーだけを扱うアルゴリズム（基数ソートなど）の対象とする dtype の種類
+_INTEGER_KINDS = "iu"
+
+# array.array の型コード 'q'（64ビット整数）で格納できる値の範囲
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def as_numeric_array(data: Any, writable: bool = False, kinds: str = _NUMERIC_KINDS) -> Optional["np.ndarray"]:
+    """
+    数値の配列を、同じメモリを参照する1次元の numpy.ndarray として返します。
+
+    numpy.ndarray はそのまま、array.array と memoryview はバッファプロトコルを
+    通して np.asarray で包むため、要素のコピーは発生しません（ゼロコピー）。
+    返した配列をその場でソートすると、元の配列の中身も並べ替わります。
+
+    list や、文字・オブジェクトなど数値以外の dtype の配列は対象外です。
+
+    Args:
+        data (Any): 対象の配列
+        writable (bool): True の場合、書き込みできない配列（読み取り専用の
+            memoryview など）は対象外とする
+        kinds (str): 対象とする dtype の種類（numpy.dtype.kind の文字の集まり）
+
+    Returns:
+        Optional[np.ndarray]: 同じメモリを参照する配列（対象外の場合は None）
+    """
+    if np is None:
+        return None
+    if isinstance(data, np.ndarray):
+        arr = data
+    elif isinstance(data, (array.array, memoryview)):
+        try:
+            arr = np.asarray(data)
+        except (TypeError, ValueError):
+            # NumPy が解釈できない形式のバッファ
+            return None
+    else:
+        return None
+
+    if arr.ndim != 1 or arr.dtype.kind not in kinds:
+        return None
+    if writable and not arr.flags.writeable:
+        return None
+    return arr
+
+
+def numeric_sort(data: Any, kind: str, reverse: bool = False, kinds: str = _NUMERIC_KINDS) -> bool:
+    """
+    数値の配列であれば、NumPy でその場でソートします。
+
+    kind には、呼び出し元のアルゴリズムの性質（安定性）に合わせて
+    "stable"・"quicksort"・"heapsort" のいずれかを指定します。
+    降順の場合は、逆順のビュー（data[::-1]）を昇順にソートするため、
+    追加のメモリを使いません。
+
+    Args:
+        data (Any): ソート対象の配列
+        kind (str): np.sort のアルゴリズムの種類
+        reverse (bool): True の場合は降順にソートする
+        kinds (str): 対象とする dtype の種類
+
+    Returns:
+        bool: ソートした場合は True、対象外で何もしなかった場合は False
+    """
+    arr = as_numeric_array(data, writable=True, kinds=kinds)
+    if arr is None:
+        return False
+    (arr[::-1] if reverse else arr).sort(kind=kind)
+    return True
+
+
+def numeric_sorted(data: Any, kind: str, reverse: bool = False) -> Optional[List[Any]]:
+    """
+    数値の配列であれば、NumPy でソートした新しいリストを返します。
+    （元の配列は変更しません - 非破壊的メソッド）
+
+    Args:
+        data (Any): ソート対象の配列
+        kind (str): np.sort のアルゴリズムの種類
+        reverse (bool): True の場合は降順にソートする
+
+    Returns:
+        Optional[List[Any]]: ソートされた新しいリスト（対象外の場合は None）
+    """
+    arr = as_numeric_array(data)
+    if arr is None:
+        return None
+    result = np.sort(arr, kind=kind)
+    if reverse:
+        result = result[::-1]
+    return result.tolist()
+
+
+def chunk_bounds(n: int, chunks: int) -> List[Tuple[int, int]]:
+    """
+    n 要素をほぼ均等な chunks 個の区間に分割します。
+
+    複数のプロセスで処理を分担する関数（parallel_merge_sort など）が、
+    各プロセスに渡す範囲を決めるために使います。空の区間は含めません。
+
+    Args:
+        n (int): 要素数
+        chunks (int): 区間の数
+
+    Returns:
+        List[Tuple[int, int]]: 各区間の (開始インデックス, 終了インデックス)
+    """
+    # 最初の n % chunks 個の区間は、他より1つだけ長くなる
+    size, extra = divmod(n, chunks)
+    bounds = []
+    start = 0
+    for i in range(chunks):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def packed_typecode(data: Sequence[Any]) -> Optional[str]:
+    """
+    全要素を array.array に詰めて格納できる場合は、その型コードを返します。
+
+    全要素が int（64ビットに収まる）または float の場合に限り、
+    1要素8バイトの配列（共有メモリやインデックスのキー）として扱えます。
+    array.array はそのまま型コードを判定し、それ以外は全要素を1回ずつ調べます。
+
+    Args:
+        data (Sequence[Any]): 判定対象のシーケンス
+
+    Returns:
+        Optional[str]: 'q'（64ビット整数）、'd'（倍精度浮動小数点数）、または None
+    """
+    if isinstance(data, array.array) and data.typecode in ('q', 'd'):
+        return data.typecode
+    # bool は int のサブクラスなので、type() で厳密に判定する
+    if all(type(item) is int for item in data):
+        if _INT64_MIN <= min(data) and max(data) <= _INT64_MAX:
+            return 'q'
+        return None
+    if all(type(item) is float for item in data):
+        return 'd'
+    return None
@@ -0,0 +1,218 @@
+"""
+並列マージソートモジュール
+
+このモジュールは、リストを複数の塊（チャンク）に分けて別々のプロセスで
+ソートし、最後にヒープを使った k-way マージで1つにまとめる
+並列マージソートを実装しています。
+"""
+
+import array
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Any, Callable, Optional, Sequence, Tuple
+
+from sort.key_utils import keyed_sort
+from sort.merge_sort import merge_sort_bottom_up
+from sort.numeric_utils import chunk_bounds, numeric_sorted, packed_typecode
+
+
+# この要素数未満のリストは、プロセスを起動せずにそのままソートする
+# （プロセスの起動やデータの受け渡しのコストの方が大きくなるため）
+_MIN_PARALLEL_SIZE = 10_000
+
+
+def parallel_merge_sort(
+    data: Sequence[Any],
+    workers: Optional[int] = None,
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> List[Any]:
+    """
+    複数のプロセスを使ったマージソートでリストを昇順にソートします。
+    （新しいリストを返します - 非破壊的メソッド）
+
+    Python のスレッドは GIL のため同時に1つしか計算できませんが、
+    プロセスであれば CPU のコアを同時に使えます。
+
+    アルゴリズムの手順:
+    1. リストを workers 個のチャンクに分割する
+    2. 各チャンクを ProcessPoolExecutor で別々のプロセスに渡してソートする
+       - 全要素が int（64ビットに収まる）または float の場合は、
+         multiprocessing.shared_memory 上に配置し、pickle を使わずに共有する
+       - それ以外の場合は、チャンクを pickle してプロセスに渡す
+    3. ソート済みのチャンクを、ヒープを使った k-way マージで1つにまとめる
+
+    時間計算量: O((n / p) log(n / p) + n log p) - p はワーカー数
+    空間計算量: O(n)
+    安定性: 安定（同じ値の要素の相対的な順序が保持される）
+
+    Args:
+        data (Sequence[Any]): ソート対象のシーケンス（変更されない）
+        workers (Optional[int]): ワーカープロセスの数
+            （None の場合は os.cpu_count() の値を使う）
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものを比較する）
+        reverse (bool): True の場合は降順にソートする
+
+    Returns:
+        List[Any]: ソートされた新しいリスト
+    """
+    # NumPy の配列などの数値バッファは、プロセスを起動せずに np.sort でソートする
+    # （ベクトル化されたソートの方が、プロセス間の受け渡しよりも速い）
+    if key is None:
+        result = numeric_sorted(data, "stable", reverse)
+        if result is not None:
+            return result
+
+    # key または reverse が指定された場合は、キーを1回だけ計算してからソートする
+    if key is not None or reverse:
+        return keyed_sort(data, lambda items: parallel_merge_sort(items, workers), key, reverse)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # 小さなリストやワーカーが1つの場合は、プロセスを使わずにソートする
+    n = len(data)
+    if workers <= 1 or n < _MIN_PARALLEL_SIZE:
+        return list(merge_sort_bottom_up(list(data)))
+
+    # ステップ1: チャンクの境界を決める
+    bounds = chunk_bounds(n, workers)
+
+    # ステップ2: 各チャンクを別々のプロセスでソートする
+    typecode = packed_typecode(data)
+    if typecode is not None:
+        runs = _sort_chunks_shared(data, typecode, bounds, workers)
+    else:
+        runs = _sort_chunks_pickled(data, bounds, workers)
+
+    # ステップ3: ソート済みのチャンクを k-way マージする
+    return _kway_merge(runs)
+
+
+def _sort_chunks_shared(
+    data: Sequence[Any],
+    typecode: str,
+    bounds: List[Tuple[int, int]],
+    workers: int,
+) -> List[List[Any]]:
+    """
+    数値データを共有メモリに配置し、各チャンクをワーカープロセスでソートする
+
+    Args:
+        data (Sequence[Any]): ソート対象のシーケンス
+        typecode (str): 要素の型コード
+        bounds (List[Tuple[int, int]]): 各チャンクの範囲
+        workers (int): ワーカープロセスの数
+
+    Returns:
+        List[List[Any]]: ソート済みのチャンクのリスト
+    """
+    n = len(data)
+    itemsize = array.array(typecode).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    try:
+        # 共有メモリに入力データを書き込む
+        with shm.buf.cast(typecode) as view:
+            view[:] = array.array(typecode, data)
+
+        # 各ワーカーは共有メモリの名前と範囲だけを受け取り、その場でソートする
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_sort_shared_chunk, shm.name, typecode, start, end)
+                for start, end in bounds
+            ]
+            for future in futures:
+                # ワーカーで発生した例外をここで再送出する
+                future.result()
+
+        # ソート済みの各チャンクを取り出す
+        with shm.buf.cast(typecode) as view:
+            return [view[start:end].tolist() for start, end in bounds]
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _sort_shared_chunk(name: str, typecode: str, start: int, end: int):
+    """
+    ワーカープロセス側で、共有メモリ上のチャンクをその場でソートする
+
+    Args:
+        name (str): 共有メモリの名前
+        typecode (str): 要素の型コード
+        start (int): チャンクの開始インデックス
+        end (int): チャンクの終了インデックス（この位置は含まない）
+    """
+    # 共有メモリの後片付け（unlink）は親プロセスが行うため、
+    # ワーカー側では close() だけを呼ぶ
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf.cast(typecode) as view:
+            with view[start:end] as chunk:
+                merge_sort_bottom_up(chunk)
+    finally:
+        shm.close()
+
+
+def _sort_chunks_pickled(
+    data: Sequence[Any],
+    bounds: List[Tuple[int, int]],
+    workers: int,
+) -> List[List[Any]]:
+    """
+    各チャンクを pickle してワーカープロセスに渡し、ソートする
+
+    Args:
+        data (Sequence[Any]): ソート対象のシーケンス
+        bounds (List[Tuple[int, int]]): 各チャンクの範囲
+        workers (int): ワーカープロセスの数
+
+    Returns:
+        List[List[Any]]: ソート済みのチャンクのリスト
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = [list(data[start:end]) for start, end in bounds]
+        return list(executor.map(_sort_chunk, chunks))
+
+
+def _sort_chunk(chunk: List[Any]) -> List[Any]:
+    """ワーカープロセス側で、受け取ったチャンクをソートして返す"""
+    return merge_sort_bottom_up(chunk)
+
+
+def _kway_merge(runs: List[List[Any]]) -> List[Any]:
+    """
+    複数のソート済みリストを、ヒープを使って1つのソート済みリストにまとめる
+
+    各ランの先頭要素をヒープ（優先度付きキュー）に入れ、最小の要素を
+    取り出しては同じランの次の要素を入れることを繰り返します。
+    値が等しい場合はランの番号が小さい方を先に取り出すため、安定です。
+
+    時間計算量: O(n log k) - k はランの数
+
+    Args:
+        runs (List[List[Any]]): ソート済みのリストのリスト
+
+    Returns:
+        List[Any]: マージされたソート済みリスト
+    """
+    # ヒープの要素は (値, ランの番号, ラン内の位置)
+    heap = [(run[0], r, 0) for r, run in enumerate(runs) if run]
+    heapq.heapify(heap)
+
+    result = []
+    while heap:
+        value, r, i = heap[0]
+        result.append(value)
+        run = runs[r]
+        i += 1
+        if i < len(run):
+            # 同じランの次の要素と入れ替えて、ヒープを整える
+            heapq.heapreplace(heap, (run[i], r, i))
+        else:
+            # ランを使い切ったので、ヒープから取り除く
+            heapq.heappop(heap)
+    return result
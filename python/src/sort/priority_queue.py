@@ -0,0 +1,351 @@
+"""
+ヒープ・優先度付きキューモジュール
+
+このモジュールは、ヒープソートと同じヒープ操作（sort.heap_sort の
+_heapify_min / _sift_up_min）を使った、再利用可能なヒープと
+優先度付きキューのクラスを実装しています。
+"""
+
+import itertools
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+from sort.heap_sort import _heapify_min, _sift_up_min
+
+
+T = TypeVar("T")
+
+
+class Heap(Generic[T]):
+    """
+    最小ヒープ（d 分ヒープにも対応）
+
+    最小の要素を O(log n) で取り出せるデータ構造です。
+    スケジューラなどで「次に処理するもの」を繰り返し取り出す場合に、
+    毎回リストをソートし直すよりも効率的です。
+
+    key を指定すると key(item) の小さい順に取り出します。
+    キーが等しい要素は、追加した順（先入れ先出し）に取り出します。
+    最大ヒープとして使う場合は、key=lambda x: -x のように指定します。
+
+    時間計算量:
+    - push / pop / pushpop / replace: O(log n)
+    - peek / len: O(1)
+    - 初期化（items を指定した場合）: O(n)
+
+    Attributes:
+        arity (int): 各ノードの子の数（2なら二分ヒープ）
+    """
+
+    def __init__(
+        self,
+        items: Optional[Iterable[T]] = None,
+        key: Optional[Callable[[T], Any]] = None,
+        arity: int = 2,
+    ):
+        """
+        ヒープを初期化します。
+
+        Args:
+            items (Optional[Iterable[T]]): 最初に入れておく要素
+            key (Optional[Callable[[T], Any]]): 比較に使うキーを返す関数
+            arity (int): 各ノードの子の数（2以上）
+
+        Raises:
+            ValueError: arity が2未満の場合
+        """
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self._key = key
+
+        # 追加した順番を記録するカウンタ（キーが等しい場合の順序付けに使う）
+        self._counter = itertools.count()
+
+        # ヒープの本体
+        # key がない場合は要素そのもの、ある場合は (キー, 追加順, 要素) の組を格納する
+        self._heap: List[Any] = [self._wrap(item) for item in items] if items is not None else []
+
+        # 非リーフノードを下から順にヒープ化する（ヒープソートのステップ1と同じ）
+        n = len(self._heap)
+        for i in range((n - 2) // arity, -1, -1):
+            _heapify_min(self._heap, n, i, arity)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def push(self, item: T):
+        """
+        要素を追加します。
+
+        Args:
+            item (T): 追加する要素
+        """
+        # 末尾に追加して、入るべき位置まで上に移動する
+        self._heap.append(self._wrap(item))
+        _sift_up_min(self._heap, len(self._heap) - 1, self.arity)
+
+    def pop(self) -> T:
+        """
+        最小の要素を取り出します。
+
+        Returns:
+            T: 最小の要素
+
+        Raises:
+            IndexError: ヒープが空の場合
+        """
+        heap = self._heap
+        last = heap.pop()
+        if not heap:
+            return self._unwrap(last)
+        # ルートを末尾の要素で置き換えてから、下に移動する
+        top = heap[0]
+        heap[0] = last
+        _heapify_min(heap, len(heap), 0, self.arity)
+        return self._unwrap(top)
+
+    def peek(self) -> T:
+        """
+        最小の要素を取り出さずに返します。
+
+        Raises:
+            IndexError: ヒープが空の場合
+        """
+        return self._unwrap(self._heap[0])
+
+    def pushpop(self, item: T) -> T:
+        """
+        要素を追加してから最小の要素を取り出します。
+
+        push() と pop() を続けて呼ぶよりも効率的です。
+        追加する要素が最小であれば、ヒープを変更せずにそのまま返します。
+
+        Args:
+            item (T): 追加する要素
+
+        Returns:
+            T: 最小の要素（item 自身の場合もある）
+        """
+        entry = self._wrap(item)
+        heap = self._heap
+        if heap and heap[0] < entry:
+            entry, heap[0] = heap[0], entry
+            _heapify_min(heap, len(heap), 0, self.arity)
+        return self._unwrap(entry)
+
+    def replace(self, item: T) -> T:
+        """
+        最小の要素を取り出してから要素を追加します。
+
+        pop() と push() を続けて呼ぶよりも効率的です。
+        item が最小の要素より小さくても、取り出されるのは元の最小の要素です。
+
+        Args:
+            item (T): 追加する要素
+
+        Returns:
+            T: 取り出した（元の）最小の要素
+
+        Raises:
+            IndexError: ヒープが空の場合
+        """
+        heap = self._heap
+        top = heap[0]
+        heap[0] = self._wrap(item)
+        _heapify_min(heap, len(heap), 0, self.arity)
+        return self._unwrap(top)
+
+    def _wrap(self, item: T) -> Any:
+        """要素をヒープに格納する形に変換する"""
+        if self._key is None:
+            return item
+        return (self._key(item), next(self._counter), item)
+
+    def _unwrap(self, entry: Any) -> T:
+        """ヒープに格納した形から要素を取り出す"""
+        if self._key is None:
+            return entry
+        return entry[2]
+
+
+class _Entry:
+    """
+    PriorityQueue の要素
+
+    ヒープ内の位置（index）を自分で覚えておくことで、
+    要素からヒープ内の位置を O(1) で求められるようにします。
+    """
+
+    __slots__ = ("priority", "count", "item", "index")
+
+    def __init__(self, priority: Any, count: int, item: Any):
+        self.priority = priority
+        self.count = count
+        self.item = item
+        self.index = -1
+
+    def __lt__(self, other: "_Entry") -> bool:
+        # 優先度が等しい場合は、先に追加した方を先に取り出す
+        if self.priority == other.priority:
+            return self.count < other.count
+        return self.priority < other.priority
+
+
+class PriorityQueue:
+    """
+    優先度の変更（decrease-key）に対応した優先度付きキュー
+
+    各要素に優先度を付けて格納し、優先度の値が最も小さい要素から取り出します。
+    要素からヒープ内の位置への対応表（インデックスマップ）を持つため、
+    格納済みの要素の優先度を O(log n) で変更・削除できます。
+    ダイクストラ法のように、優先度を後から小さくしたい場合に使います。
+
+    要素はハッシュ可能（辞書のキーにできる）である必要があり、
+    同じ要素を重複して格納することはできません。
+
+    時間計算量:
+    - push / pop / update / remove: O(log n)
+    - peek / len / in / priority: O(1)
+
+    Attributes:
+        arity (int): 各ノードの子の数（2なら二分ヒープ）
+    """
+
+    def __init__(self, arity: int = 2):
+        """
+        空の優先度付きキューを作成します。
+
+        Args:
+            arity (int): 各ノードの子の数（2以上）
+
+        Raises:
+            ValueError: arity が2未満の場合
+        """
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self._heap: List[_Entry] = []
+        # 要素から _Entry への対応表（インデックスマップ）
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._entries
+
+    def push(self, item: Hashable, priority: Any):
+        """
+        要素を指定した優先度で追加します。
+        既に格納されている要素の場合は、優先度を更新します。
+
+        Args:
+            item (Hashable): 追加する要素
+            priority (Any): 優先度（小さいほど先に取り出される）
+        """
+        if item in self._entries:
+            self.update(item, priority)
+            return
+        entry = _Entry(priority, next(self._counter), item)
+        self._entries[item] = entry
+        self._heap.append(entry)
+        _sift_up_min(self._heap, len(self._heap) - 1, self.arity, track=True)
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        """
+        優先度が最も小さい要素を取り出します。
+
+        Returns:
+            Tuple[Hashable, Any]: (要素, 優先度)
+
+        Raises:
+            IndexError: キューが空の場合
+        """
+        if not self._heap:
+            raise IndexError("pop from an empty priority queue")
+        entry = self._remove_at(0)
+        return entry.item, entry.priority
+
+    def peek(self) -> Tuple[Hashable, Any]:
+        """
+        優先度が最も小さい要素を取り出さずに返します。
+
+        Returns:
+            Tuple[Hashable, Any]: (要素, 優先度)
+
+        Raises:
+            IndexError: キューが空の場合
+        """
+        if not self._heap:
+            raise IndexError("peek from an empty priority queue")
+        entry = self._heap[0]
+        return entry.item, entry.priority
+
+    def priority(self, item: Hashable) -> Any:
+        """
+        格納されている要素の優先度を返します。
+
+        Raises:
+            KeyError: 要素が格納されていない場合
+        """
+        return self._entries[item].priority
+
+    def update(self, item: Hashable, priority: Any):
+        """
+        格納されている要素の優先度を変更します。
+
+        優先度を小さくした場合（decrease-key）は上に、
+        大きくした場合は下に移動してヒープ条件を回復します。
+
+        Args:
+            item (Hashable): 優先度を変更する要素
+            priority (Any): 新しい優先度
+
+        Raises:
+            KeyError: 要素が格納されていない場合
+        """
+        entry = self._entries[item]
+        decreased = priority < entry.priority
+        entry.priority = priority
+        if decreased:
+            _sift_up_min(self._heap, entry.index, self.arity, track=True)
+        else:
+            _heapify_min(self._heap, len(self._heap), entry.index, self.arity, track=True)
+
+    def remove(self, item: Hashable):
+        """
+        格納されている要素を削除します。
+
+        Args:
+            item (Hashable): 削除する要素
+
+        Raises:
+            KeyError: 要素が格納されていない場合
+        """
+        self._remove_at(self._entries[item].index)
+
+    def _remove_at(self, index: int) -> _Entry:
+        """
+        ヒープの index 番目の要素を取り除いて返す
+
+        末尾の要素を空いた位置に移し、上または下に移動してヒープ条件を回復します。
+        """
+        heap = self._heap
+        entry = heap[index]
+        del self._entries[entry.item]
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            last.index = index
+            if index > 0 and last < heap[(index - 1) // self.arity]:
+                _sift_up_min(heap, index, self.arity, track=True)
+            else:
+                _heapify_min(heap, len(heap), index, self.arity, track=True)
+        return entry
@@ -5,10 +5,27 @@
 クイックソートを実装しています。
 """
 
-from typing import List, Any
+from typing import List, Any, Callable, Optional, Tuple
 
+from sort.heap_sort import heap_sort
+from sort.insertion_sort import insertion_sort
+from sort.key_utils import keyed_sort
+from sort.numeric_utils import numeric_sort
 
-def quick_sort(data: List[Any]) -> List[Any]:
+
+# この要素数以下の部分リストは挿入ソートに切り替える
+_INSERTION_THRESHOLD = 16
+
+# この要素数より大きい部分リストではナインサー（9要素の中央値）でピボットを選ぶ
+_NINTHER_THRESHOLD = 128
+
+
+def quick_sort(
+    data: List[Any],
+    introsort: bool = True,
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> List[Any]:
     """
     クイックソートを用いてリストを昇順にソートします。
     （リスト自体を変更します - 破壊的メソッド）
@@ -22,24 +39,194 @@ def quick_sort(data: List[Any]) -> List[Any]:
     2. ピボットより小さい要素を左側、大きい要素を右側に分割
     3. ピボットの左側と右側の部分リストに対して再帰的にソート
     
+    デフォルトでは、上記の基本形を改良したイントロソート（introsort）で
+    ソートします。イントロソートは次の工夫で最悪ケースを防ぎます。
+    - ピボットを3要素の中央値（大きな範囲ではナインサー）で選ぶ
+    - 3分割（ダッチフラッグ）パーティションで重複キーをまとめて処理
+    - 再帰の深さが 2·log2(n) を超えたらヒープソートに切り替える
+    - 小さな部分リストは挿入ソートで仕上げる
+    
     時間計算量:
     - 平均: O(n log n)
-    - 最悪: O(n²) - ピボットの選択が悪い場合（既にソート済みなど）
+    - 最悪: O(n²) - 基本形でピボットの選択が悪い場合（既にソート済みなど）
+    - 最悪: O(n log n) - イントロソートの場合
     空間計算量: O(log n) - 再帰呼び出しのスタック
     安定性: 不安定（同じ値の要素の相対的な順序が保持されない場合がある）
     
     Args:
         data (List[Any]): ソート対象のリスト
+        introsort (bool): True の場合はイントロソート、
+            False の場合は基本形（Lomutoのパーティション）でソートする
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものを比較する）
+        reverse (bool): True の場合は降順にソートする
         
     Returns:
         List[Any]: ソートされたリスト（元のリストと同じ参照）
     """
+    # NumPy の配列などの数値バッファは、np.sort(kind="quicksort") でその場でソートする
+    if key is None and numeric_sort(data, "quicksort", reverse):
+        return data
+
+    # key または reverse が指定された場合は、キーを1回だけ計算してからソートする
+    if key is not None or reverse:
+        data[:] = keyed_sort(data, lambda items: quick_sort(items, introsort), key, reverse)
+        return data
+
+    if introsort:
+        # 深さの上限は 2·floor(log2(n))
+        # int.bit_length() - 1 で floor(log2(n)) を整数演算のみで求める
+        depth_limit = 2 * (max(len(data), 1).bit_length() - 1)
+        _introsort_loop(data, 0, len(data) - 1, depth_limit)
+        return data
+
     # 再帰的なクイックソートを実行
     # 初期の範囲はリスト全体（インデックス0からlen(data)-1まで）
     _quick_sort_recursive(data, 0, len(data) - 1)
     return data
 
 
+def _introsort_loop(data: List[Any], low: int, high: int, depth_limit: int):
+    """
+    イントロソートの本体
+    
+    小さい方の部分リストだけを再帰呼び出しし、大きい方はループで処理する
+    ことで、再帰の深さを O(log n) に抑えます。
+    
+    Args:
+        data (List[Any]): ソート対象のリスト
+        low (int): ソート範囲の開始インデックス
+        high (int): ソート範囲の終了インデックス
+        depth_limit (int): ヒープソートに切り替えるまでの残りの深さ
+    """
+    # 挿入ソートに任せられない大きさの間だけ分割を続ける
+    while high - low + 1 > _INSERTION_THRESHOLD:
+        if depth_limit == 0:
+            # 分割が偏り続けている（最悪ケースに近い）ので
+            # O(n log n) が保証されたヒープソートに切り替える
+            _sort_slice(data, low, high, heap_sort)
+            return
+        depth_limit -= 1
+
+        # 3分割: [low, lt) < pivot, [lt, gt] == pivot, (gt, high] > pivot
+        lt, gt = _partition_three_way(data, low, high)
+
+        # 小さい方を再帰、大きい方をループで処理（末尾再帰の除去）
+        if lt - low < high - gt:
+            _introsort_loop(data, low, lt - 1, depth_limit)
+            low = gt + 1
+        else:
+            _introsort_loop(data, gt + 1, high, depth_limit)
+            high = lt - 1
+
+    # 残った小さな範囲は挿入ソートで仕上げる
+    if low < high:
+        _sort_slice(data, low, high, insertion_sort)
+
+
+def _sort_slice(data: List[Any], low: int, high: int, sorter):
+    """
+    data[low..high] の範囲を、リスト全体を対象とするソート関数でソートする
+    
+    Args:
+        data (List[Any]): ソート対象のリスト
+        low (int): ソート範囲の開始インデックス
+        high (int): ソート範囲の終了インデックス
+        sorter: リストを受け取って破壊的にソートする関数
+    """
+    # 範囲をコピーしてソートし、スライス代入で書き戻す
+    part = data[low:high + 1]
+    sorter(part)
+    data[low:high + 1] = part
+
+
+def _median_of_three(data: List[Any], a: int, b: int, c: int) -> int:
+    """
+    3つのインデックスのうち、値が中央値であるもののインデックスを返す
+    
+    Args:
+        data (List[Any]): 対象のリスト
+        a (int): 1つ目のインデックス
+        b (int): 2つ目のインデックス
+        c (int): 3つ目のインデックス
+        
+    Returns:
+        int: 中央値を持つ要素のインデックス
+    """
+    if data[a] < data[b]:
+        if data[b] < data[c]:
+            return b
+        # b が最大なので、a と c の大きい方が中央値
+        return c if data[a] < data[c] else a
+    if data[a] < data[c]:
+        return a
+    # a が最大なので、b と c の大きい方が中央値
+    return c if data[b] < data[c] else b
+
+
+def _choose_pivot(data: List[Any], low: int, high: int) -> int:
+    """
+    ピボットのインデックスを選ぶ
+    
+    範囲の先頭・中央・末尾の3要素の中央値を使います。
+    大きな範囲では、3つの3要素中央値のさらに中央値（ナインサー）を使います。
+    ソート済みや逆順のリストでも、ほぼ真ん中の値がピボットになります。
+    
+    Args:
+        data (List[Any]): 対象のリスト
+        low (int): 範囲の開始インデックス
+        high (int): 範囲の終了インデックス
+        
+    Returns:
+        int: ピボットとして選んだ要素のインデックス
+    """
+    mid = (low + high) // 2
+    if high - low + 1 > _NINTHER_THRESHOLD:
+        step = (high - low + 1) // 8
+        first = _median_of_three(data, low, low + step, low + 2 * step)
+        middle = _median_of_three(data, mid - step, mid, mid + step)
+        last = _median_of_three(data, high - 2 * step, high - step, high)
+        return _median_of_three(data, first, middle, last)
+    return _median_of_three(data, low, mid, high)
+
+
+def _partition_three_way(data: List[Any], low: int, high: int) -> Tuple[int, int]:
+    """
+    ダッチフラッグ問題の要領でリストを3つに分割する
+    
+    ピボットより小さい要素・等しい要素・大きい要素の3つに分けます。
+    等しい要素は以降の再帰から外れるため、重複の多いデータでも
+    処理量が増えません。
+    
+    Args:
+        data (List[Any]): 分割対象のリスト
+        low (int): 分割範囲の開始インデックス
+        high (int): 分割範囲の終了インデックス
+        
+    Returns:
+        Tuple[int, int]: ピボットと等しい区間の開始・終了インデックス (lt, gt)
+    """
+    pivot = data[_choose_pivot(data, low, high)]
+
+    # [low, lt) はピボット未満、[lt, i) はピボットと等しい、
+    # [i, gt] は未確認、(gt, high] はピボットより大きい
+    lt = low
+    i = low
+    gt = high
+    while i <= gt:
+        value = data[i]
+        if value < pivot:
+            data[lt], data[i] = value, data[lt]
+            lt += 1
+            i += 1
+        elif pivot < value:
+            data[gt], data[i] = value, data[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
 def _quick_sort_recursive(data: List[Any], low: int, high: int):
     """
     クイックソートの再帰的な実装部分
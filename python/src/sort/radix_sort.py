@@ -0,0 +1,427 @@
+"""
+基数ソート（Radix Sort）・計数ソート（Counting Sort）モジュール
+
+このモジュールは、要素どうしを比較せずにキーの値（桁）を使って並べる
+分布数え上げ系のソートアルゴリズムを実装しています。
+- 整数キー向けの LSD 基数ソート（負の数にも対応）
+- キーの範囲が狭い整数向けの計数ソート
+- バイト列キー向けの MSD 基数ソート
+
+NumPy がインストールされている場合、LSD 基数ソートの各パスは
+NumPy でベクトル化して実行します。
+また、NumPy の整数配列や array.array が渡された場合は、np.sort でまとめてソートします。
+"""
+
+from typing import List, Any, Callable, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy がない環境では純粋な Python の実装を使う
+    np = None
+
+from sort.numeric_utils import _INTEGER_KINDS, numeric_sort
+
+
+# 1回のパスで処理するビット数（1バイト = 256個のバケット）
+_RADIX_BITS = 8
+_RADIX = 1 << _RADIX_BITS
+_RADIX_MASK = _RADIX - 1
+
+# NumPy の経路に切り替える要素数（小さなリストでは変換のコストの方が大きい）
+_NUMPY_THRESHOLD = 1024
+
+# MSD 基数ソートで、この要素数以下の区間は挿入ソートに切り替える
+_MSD_INSERTION_THRESHOLD = 32
+
+
+def radix_sort(
+    data: List[Any],
+    key: Optional[Callable[[Any], int]] = None,
+    reverse: bool = False,
+) -> List[Any]:
+    """
+    LSD 基数ソートを用いて、整数（または整数のキー）のリストを昇順にソートします。
+    （リスト自体を変更します - 破壊的メソッド）
+
+    LSD（Least Significant Digit）基数ソートは、キーを下位の桁から順に見て、
+    桁ごとに安定なバケット分けを繰り返すアルゴリズムです。
+    この実装では1桁を8ビット（256通り）とします。
+
+    アルゴリズムの手順:
+    1. 最小のキーを引いて、全てのキーを0以上にする（負の数への対応）
+    2. 最下位の8ビットの値で、要素を256個のバケットに振り分ける
+    3. バケットの順に要素を並べ直す
+    4. 次の8ビットについて2-3を繰り返す（最大のキーのビット数まで）
+
+    各パスが安定なので、上位の桁が等しい要素は下位の桁の順に並びます。
+
+    時間計算量: O(d·(n + 256)) - d はパス数（キーの範囲のビット数 / 8）
+    空間計算量: O(n)
+    安定性: 安定（同じキーの要素の相対的な順序が保持される）
+
+    Args:
+        data (List[Any]): ソート対象のリスト
+        key (Optional[Callable[[Any], int]]): 整数のキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものをキーとする）
+        reverse (bool): True の場合は降順にソートする
+
+    Returns:
+        List[Any]: ソートされたリスト（元のリストと同じ参照）
+
+    Raises:
+        TypeError: キーが整数でない場合
+    """
+    # NumPy の整数配列などの数値バッファは、安定な np.sort でその場でソートする
+    if key is None and numeric_sort(data, "stable", reverse, kinds=_INTEGER_KINDS):
+        return data
+
+    keys = data if key is None else [key(item) for item in data]
+    _check_int_keys(keys)
+    data[:] = _sort_by_int_keys(data, keys, reverse, counting=False)
+    return data
+
+
+def counting_sort(
+    data: List[Any],
+    key: Optional[Callable[[Any], int]] = None,
+    reverse: bool = False,
+) -> List[Any]:
+    """
+    計数ソートを用いて、整数（または整数のキー）のリストを昇順にソートします。
+    （リスト自体を変更します - 破壊的メソッド）
+
+    計数ソートは、キーの値ごとの出現回数を数え、その累積和から
+    各要素の最終的な位置を直接求めるアルゴリズムです。
+    キーの範囲（最大値 - 最小値）が要素数と同程度以下のときに高速です。
+
+    アルゴリズムの手順:
+    1. キーの値ごとに出現回数を数える
+    2. 出現回数の累積和から、各キーの値の書き込み開始位置を求める
+    3. 元の順に要素を走査し、キーの書き込み位置に配置する
+
+    時間計算量: O(n + k) - k はキーの範囲（最大値 - 最小値 + 1）
+    空間計算量: O(n + k)
+    安定性: 安定（同じキーの要素の相対的な順序が保持される）
+
+    Args:
+        data (List[Any]): ソート対象のリスト
+        key (Optional[Callable[[Any], int]]): 整数のキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものをキーとする）
+        reverse (bool): True の場合は降順にソートする
+
+    Returns:
+        List[Any]: ソートされたリスト（元のリストと同じ参照）
+
+    Raises:
+        TypeError: キーが整数でない場合
+    """
+    # NumPy の整数配列などの数値バッファは、安定な np.sort でその場でソートする
+    if key is None and numeric_sort(data, "stable", reverse, kinds=_INTEGER_KINDS):
+        return data
+
+    keys = data if key is None else [key(item) for item in data]
+    _check_int_keys(keys)
+    data[:] = _sort_by_int_keys(data, keys, reverse, counting=True)
+    return data
+
+
+def msd_radix_sort(
+    data: List[Any],
+    key: Optional[Callable[[Any], bytes]] = None,
+    reverse: bool = False,
+) -> List[Any]:
+    """
+    MSD 基数ソートを用いて、バイト列（またはバイト列のキー）のリストを昇順にソートします。
+    （リスト自体を変更します - 破壊的メソッド）
+
+    MSD（Most Significant Digit）基数ソートは、キーを先頭のバイトから順に見て
+    バケットに振り分け、各バケットを次のバイトで再び振り分けるアルゴリズムです。
+    可変長のキーを辞書順に並べられます。
+
+    アルゴリズムの手順:
+    1. 区間の要素を、depth 番目のバイトの値で257個のバケットに振り分ける
+       - キーが depth バイトより短い要素は、先頭のバケットに入れる
+         （短いキーの方が辞書順で前に来るため）
+    2. バケットの順に要素を並べ直す
+    3. 2要素以上あるバケットを、depth + 1 番目のバイトで同様に処理する
+    4. 小さな区間は挿入ソートで仕上げる
+
+    再帰の代わりに明示的なスタックで区間を管理するため、
+    長いキーでも再帰の上限に達しません。
+
+    文字列をソートする場合は key=str.encode を指定してください
+    （UTF-8 のバイト列の順序は、コードポイントの順序と一致します）。
+
+    時間計算量: O(n·L) - L はキーの平均的な長さ（区別に必要なバイト数）
+    空間計算量: O(n)
+    安定性: 安定（同じキーの要素の相対的な順序が保持される）
+
+    Args:
+        data (List[Any]): ソート対象のリスト
+        key (Optional[Callable[[Any], bytes]]): バイト列のキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものをキーとする）
+        reverse (bool): True の場合は降順にソートする
+
+    Returns:
+        List[Any]: ソートされたリスト（元のリストと同じ参照）
+
+    Raises:
+        TypeError: キーが bytes / bytearray でない場合
+    """
+    keys = data if key is None else [key(item) for item in data]
+    for k in keys:
+        if not isinstance(k, (bytes, bytearray)):
+            raise TypeError(f"msd_radix_sort requires bytes keys, got {type(k).__name__}")
+
+    # 降順の場合は、逆順の入力を安定に昇順ソートしてから反転する
+    # （キーが等しい要素が元の順序のまま残る）
+    indices = list(range(len(keys)))
+    if reverse:
+        indices.reverse()
+    order = _msd_order(keys, indices)
+    if reverse:
+        order.reverse()
+    data[:] = [data[i] for i in order]
+    return data
+
+
+def _check_int_keys(keys: Sequence[Any]):
+    """
+    全てのキーが整数であることを確認する
+
+    Raises:
+        TypeError: 整数でないキーがある場合
+    """
+    for k in keys:
+        if not isinstance(k, int):
+            raise TypeError(f"integer keys are required, got {type(k).__name__}")
+
+
+def _sort_by_int_keys(data: Sequence[Any], keys: Sequence[int], reverse: bool, counting: bool) -> List[Any]:
+    """
+    整数のキーで data を安定にソートした新しいリストを返す
+
+    Args:
+        data (Sequence[Any]): ソート対象のシーケンス
+        keys (Sequence[int]): 各要素の整数のキー（data と同じ長さ）
+        reverse (bool): True の場合は降順にソートする
+        counting (bool): True の場合は計数ソート、False の場合は LSD 基数ソートを使う
+
+    Returns:
+        List[Any]: ソートされた新しいリスト
+    """
+    n = len(keys)
+    if n < 2:
+        return list(data)
+    low = min(keys)
+    high = max(keys)
+
+    # キーが要素そのもので昇順の場合は、要素を直接バケットに振り分ける
+    if keys is data and not reverse and not counting:
+        return _lsd_values(list(data), low, high)
+
+    # それ以外は要素の位置（インデックス）の並びを求めてから並べ替える
+    # 降順の場合は、逆順の入力を安定に昇順ソートしてから反転する
+    indices = list(range(n))
+    if reverse:
+        indices.reverse()
+    if counting:
+        order = _counting_order(keys, indices, low, high)
+    else:
+        order = _lsd_order(keys, indices, low, high)
+    if reverse:
+        order.reverse()
+    return [data[i] for i in order]
+
+
+def _lsd_values(values: List[int], low: int, high: int) -> List[int]:
+    """
+    整数のリストを LSD 基数ソートした新しいリストを返す
+
+    Args:
+        values (List[int]): ソート対象の整数のリスト
+        low (int): 最小値
+        high (int): 最大値
+
+    Returns:
+        List[int]: ソートされたリスト
+    """
+    if _use_numpy(len(values), low, high):
+        order = _lsd_order_numpy(values, list(range(len(values))), low, high)
+        return [values[i] for i in order]
+
+    bits = (high - low).bit_length()
+    shift = 0
+    while shift < bits:
+        # 8ビットの値ごとのバケットに振り分ける（元の順序を保つので安定）
+        buckets = [[] for _ in range(_RADIX)]
+        appends = [bucket.append for bucket in buckets]
+        for v in values:
+            appends[((v - low) >> shift) & _RADIX_MASK](v)
+        # バケットの順に並べ直す
+        values = [v for bucket in buckets for v in bucket]
+        shift += _RADIX_BITS
+    return values
+
+
+def _lsd_order(keys: Sequence[int], indices: List[int], low: int, high: int) -> List[int]:
+    """
+    インデックスの並びを、キーの LSD 基数ソートで並べ替えて返す
+
+    Args:
+        keys (Sequence[int]): 各要素の整数のキー
+        indices (List[int]): 並べ替える前のインデックスの並び
+        low (int): キーの最小値
+        high (int): キーの最大値
+
+    Returns:
+        List[int]: キーの昇順に並んだインデックス（同じキーは indices の順）
+    """
+    if _use_numpy(len(indices), low, high):
+        return _lsd_order_numpy(keys, indices, low, high)
+
+    bits = (high - low).bit_length()
+    order = indices
+    shift = 0
+    while shift < bits:
+        buckets = [[] for _ in range(_RADIX)]
+        appends = [bucket.append for bucket in buckets]
+        for i in order:
+            appends[((keys[i] - low) >> shift) & _RADIX_MASK](i)
+        order = [i for bucket in buckets for i in bucket]
+        shift += _RADIX_BITS
+    return order
+
+
+def _use_numpy(n: int, low: int, high: int) -> bool:
+    """NumPy の経路を使えるかどうか（キーが int64 に収まり、十分に大きいか）を返す"""
+    return (
+        np is not None
+        and n >= _NUMPY_THRESHOLD
+        and -(1 << 63) <= low
+        and high < (1 << 63)
+        and high - low < (1 << 63)
+    )
+
+
+def _lsd_order_numpy(keys: Sequence[int], indices: List[int], low: int, high: int) -> List[int]:
+    """
+    _lsd_order の NumPy 版
+
+    各パスの「桁の取り出し」と「安定なバケット分け」を配列演算で行います。
+    8ビットの桁に対する安定な argsort は、NumPy 内部でも基数ソートで実行されます。
+
+    Args:
+        keys (Sequence[int]): 各要素の整数のキー
+        indices (List[int]): 並べ替える前のインデックスの並び
+        low (int): キーの最小値
+        high (int): キーの最大値
+
+    Returns:
+        List[int]: キーの昇順に並んだインデックス（同じキーは indices の順）
+    """
+    # 最小値を引いて0以上にしたキー（範囲は int64 に収まることを確認済み）
+    shifted = (np.asarray(keys, dtype=np.int64) - np.int64(low)).astype(np.uint64)
+    order = np.asarray(indices, dtype=np.int64)
+    bits = (high - low).bit_length()
+    for shift in range(0, bits, _RADIX_BITS):
+        digits = ((shifted[order] >> np.uint64(shift)) & np.uint64(_RADIX_MASK)).astype(np.uint8)
+        order = order[np.argsort(digits, kind="stable")]
+    return order.tolist()
+
+
+def _counting_order(keys: Sequence[int], indices: List[int], low: int, high: int) -> List[int]:
+    """
+    インデックスの並びを、キーの計数ソートで並べ替えて返す
+
+    Args:
+        keys (Sequence[int]): 各要素の整数のキー
+        indices (List[int]): 並べ替える前のインデックスの並び
+        low (int): キーの最小値
+        high (int): キーの最大値
+
+    Returns:
+        List[int]: キーの昇順に並んだインデックス（同じキーは indices の順）
+    """
+    # ステップ1: キーの値ごとの出現回数を数える
+    counts = [0] * (high - low + 1)
+    for i in indices:
+        counts[keys[i] - low] += 1
+
+    # ステップ2: 累積和で各キーの値の書き込み開始位置を求める
+    total = 0
+    for value, count in enumerate(counts):
+        counts[value] = total
+        total += count
+
+    # ステップ3: 元の順に走査して配置する（同じキーは元の順序になるので安定）
+    order = [0] * len(indices)
+    for i in indices:
+        slot = keys[i] - low
+        order[counts[slot]] = i
+        counts[slot] += 1
+    return order
+
+
+def _msd_order(keys: Sequence[bytes], indices: List[int]) -> List[int]:
+    """
+    インデックスの並びを、キーの MSD 基数ソートで並べ替えて返す
+
+    Args:
+        keys (Sequence[bytes]): 各要素のバイト列のキー
+        indices (List[int]): 並べ替える前のインデックスの並び
+
+    Returns:
+        List[int]: キーの昇順に並んだインデックス（同じキーは indices の順）
+    """
+    order = list(indices)
+
+    # 処理する区間のスタック: (開始位置, 終了位置, 注目するバイトの位置)
+    stack = [(0, len(order), 0)]
+    while stack:
+        low, high, depth = stack.pop()
+
+        # 小さな区間は挿入ソートで仕上げる
+        if high - low <= _MSD_INSERTION_THRESHOLD:
+            _insertion_sort_order(order, keys, low, high)
+            continue
+
+        # depth 番目のバイトでバケットに振り分ける
+        # バケット0はキーの終わり、バケット b+1 はバイト値 b
+        buckets = [[] for _ in range(_RADIX + 1)]
+        for i in order[low:high]:
+            k = keys[i]
+            buckets[k[depth] + 1 if depth < len(k) else 0].append(i)
+
+        # バケットの順に書き戻し、2要素以上のバケットは次のバイトで処理する
+        position = low
+        for b, bucket in enumerate(buckets):
+            size = len(bucket)
+            if size == 0:
+                continue
+            order[position:position + size] = bucket
+            # バケット0のキーは全て等しいので、これ以上並べ替える必要はない
+            if b > 0 and size > 1:
+                stack.append((position, position + size, depth + 1))
+            position += size
+    return order
+
+
+def _insertion_sort_order(order: List[int], keys: Sequence[Any], low: int, high: int):
+    """
+    order[low:high] のインデックスを、キーの昇順に挿入ソートする（安定）
+
+    Args:
+        order (List[int]): インデックスの並び
+        keys (Sequence[Any]): 各要素のキー
+        low (int): ソート範囲の開始位置
+        high (int): ソート範囲の終了位置（この位置は含まない）
+    """
+    for i in range(low + 1, high):
+        current = order[i]
+        current_key = keys[current]
+        j = i - 1
+        while j >= low and current_key < keys[order[j]]:
+            order[j + 1] = order[j]
+            j -= 1
+        order[j + 1] = current
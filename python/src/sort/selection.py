@@ -0,0 +1,199 @@
+"""
+選択（Selection）アルゴリズムモジュール
+
+このモジュールは、リスト全体をソートせずに「k 番目に小さい要素」や
+「上位 k 件」だけを求めるアルゴリズムを実装しています。
+- select_kth: クイックセレクト（イントロセレクト）で k 番目の要素を求める
+- partial_sort: 小さい方から k 個だけをソートする
+- top_k: 大きさ k のヒープを使い、ストリームから上位 k 件を求める
+
+NumPy の配列などの数値バッファが渡された場合は、np.partition でまとめて処理します。
+"""
+
+from typing import List, Any, Callable, Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy がない環境では純粋な Python の実装を使う
+    np = None
+
+from sort.heap_sort import heap_sort
+from sort.insertion_sort import insertion_sort
+from sort.numeric_utils import as_numeric_array
+from sort.priority_queue import Heap
+from sort.quick_sort import (
+    _INSERTION_THRESHOLD, _choose_pivot, _partition, _partition_three_way, _sort_slice, quick_sort,
+)
+
+
+def select_kth(data: List[Any], k: int) -> Any:
+    """
+    リストの中で k 番目（0始まり）に小さい要素を求めます。
+    （リスト自体を並べ替えます - 破壊的メソッド）
+
+    クイックソートのパーティションを使い、k 番目の要素を含む側だけを
+    処理し続ける「クイックセレクト」です。
+
+    通常は Lomuto のパーティション（_partition、ピボット以下を左に集める）を使います。
+    重複の多いデータでは、ピボットと等しい要素が毎回同じ側に残り、
+    1回の分割でピボット1つ分しか範囲が縮まなくなります。そこで pdqsort と同じく、
+    ピボットが範囲の直後の要素（前回のピボット。範囲の全ての要素はこれ以下）と
+    等しい場合は、3分割パーティション（_partition_three_way）に切り替えます。
+    k がピボットと等しい要素の区間に入った時点で終了するため、
+    重複した値の数だけ範囲が一度に縮みます。
+    実行後のリストは C++ の nth_element と同じ状態になります。
+    - data[k] は、ソートした場合に k 番目に来る要素
+    - data[:k] の要素は全て data[k] 以下、data[k+1:] の要素は全て data[k] 以上
+
+    最悪ケースを防ぐため、イントロソートと同じ工夫をしています（イントロセレクト）。
+    - ピボットを3要素の中央値（大きな範囲ではナインサー）で選ぶ
+    - 分割が 2·log2(n) 回を超えたら、残りの範囲をヒープソートする
+    - 小さな範囲は挿入ソートで仕上げる
+
+    時間計算量:
+    - 平均: O(n)
+    - 最悪: O(n log n) - ヒープソートへの切り替えによる
+    空間計算量: O(1)
+
+    Args:
+        data (List[Any]): 対象のリスト
+        k (int): 求める要素の順位（0始まり、0 <= k < len(data)）
+
+    Returns:
+        Any: k 番目に小さい要素
+
+    Raises:
+        IndexError: k が範囲外の場合
+    """
+    n = len(data)
+    if not 0 <= k < n:
+        raise IndexError("k is out of range")
+
+    # NumPy の配列などの数値バッファは、np.partition と同じ処理をその場で行う
+    arr = as_numeric_array(data, writable=True)
+    if arr is not None:
+        arr.partition(k)
+        return arr[k].item()
+
+    low = 0
+    high = n - 1
+    depth_limit = 2 * (n.bit_length() - 1)
+    while high - low + 1 > _INSERTION_THRESHOLD:
+        if depth_limit == 0:
+            # 分割が偏り続けているので、残りの範囲をヒープソートで確定させる
+            _sort_slice(data, low, high, heap_sort)
+            return data[k]
+        depth_limit -= 1
+
+        pivot_index = _choose_pivot(data, low, high)
+        if high + 1 < n and not data[pivot_index] < data[high + 1]:
+            # ピボットが範囲の最大値（直後の要素と等しい）なので、重複が多い。
+            # ピボット未満・等しい・より大きいの3つに分ける
+            lt, gt = _partition_three_way(data, low, high)
+        else:
+            # 良いピボットを末尾に移してから、Lomuto のパーティションを行う
+            data[pivot_index], data[high] = data[high], data[pivot_index]
+            lt = gt = _partition(data, low, high)
+
+        # k 番目の要素を含む側だけを処理し続ける
+        if lt <= k <= gt:
+            # k がピボットと等しい区間に入ったら、data[k] はピボットで確定
+            return data[k]
+        if k < lt:
+            high = lt - 1
+        else:
+            low = gt + 1
+
+    # 残った小さな範囲は挿入ソートで仕上げる
+    _sort_slice(data, low, high, insertion_sort)
+    return data[k]
+
+
+def partial_sort(data: List[Any], k: int) -> List[Any]:
+    """
+    リストの小さい方から k 個だけを昇順に並べます。
+    （リスト自体を変更します - 破壊的メソッド）
+
+    実行後、data[:k] には小さい方から k 個の要素が昇順に並びます。
+    data[k:] の要素の順序は不定です。
+
+    アルゴリズムの手順:
+    1. select_kth で k-1 番目の要素を求め、小さい k 個を先頭に集める
+    2. 先頭の k 個だけを quick_sort でソートする
+
+    時間計算量: O(n + k log k) - 平均
+    空間計算量: O(k)
+
+    Args:
+        data (List[Any]): 対象のリスト
+        k (int): ソートする要素の数
+
+    Returns:
+        List[Any]: 先頭 k 個がソートされたリスト（元のリストと同じ参照）
+    """
+    n = len(data)
+    if k >= n:
+        return quick_sort(data)
+    if k <= 0:
+        return data
+    arr = as_numeric_array(data, writable=True)
+    if arr is not None:
+        # 数値バッファは、NumPy で小さい k 個を集めてから先頭だけをソートする
+        arr.partition(k - 1)
+        arr[:k].sort()
+        return data
+    select_kth(data, k - 1)
+    _sort_slice(data, 0, k - 1, quick_sort)
+    return data
+
+
+def top_k(iterable: Iterable[Any], k: int, key: Optional[Callable[[Any], Any]] = None) -> List[Any]:
+    """
+    イテラブルの中で大きい方から k 件を、大きい順のリストで返します。
+
+    大きさ k の最小ヒープに「これまでの上位 k 件」を保持し、
+    新しい要素がヒープの最小値より大きければ入れ替えます。
+    入力を1回走査するだけなので、ジェネレータやファイルなど
+    全体をメモリに載せられないストリームにも使えます。
+
+    キーが等しい要素は、先に現れた方を優先します
+    （sorted(iterable, key=key, reverse=True)[:k] と同じ結果になります）。
+
+    時間計算量: O(n log k)
+    空間計算量: O(k)
+
+    Args:
+        iterable (Iterable[Any]): 対象のイテラブル
+        k (int): 求める件数
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （各要素につき1回だけ呼ばれる）
+
+    Returns:
+        List[Any]: 大きい順に並んだ上位 k 件
+    """
+    if k <= 0:
+        return []
+
+    # NumPy の配列などの数値バッファは、np.partition で上位 k 件を集めてから並べる
+    arr = as_numeric_array(iterable) if key is None else None
+    if arr is not None:
+        n = len(arr)
+        if k < n:
+            arr = np.partition(arr, n - k)[n - k:]
+        return np.sort(arr)[::-1].tolist()
+
+    # ヒープの要素は (キー, -出現順, 要素)
+    # キーが等しい場合は後に現れた要素ほど小さくなり、先にヒープから追い出される
+    heap = Heap()
+    for index, item in enumerate(iterable):
+        entry = (item if key is None else key(item), -index, item)
+        if len(heap) < k:
+            heap.push(entry)
+        elif heap.peek() < entry:
+            # ヒープの最小値（上位 k 件の中で最も小さいもの）と入れ替える
+            heap.replace(entry)
+
+    # 小さい順に取り出して反転し、大きい順にする
+    result = [heap.pop()[2] for _ in range(len(heap))]
+    result.reverse()
+    return result
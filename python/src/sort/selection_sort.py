@@ -5,10 +5,17 @@
 リストをソートする選択ソートアルゴリズムを実装しています。
 """
 
-from typing import List, Any
+from typing import List, Any, Callable, Optional
 
+from sort.key_utils import keyed_sort
+from sort.numeric_utils import numeric_sort
 
-def selection_sort(data: List[Any]) -> List[Any]:
+
+def selection_sort(
+    data: List[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> List[Any]:
     """
     選択ソートを用いてリストを昇順にソートします。
     （リスト自体を変更します - 破壊的メソッド）
@@ -28,10 +35,22 @@ def selection_sort(data: List[Any]) -> List[Any]:
     
     Args:
         data (List[Any]): ソート対象のリスト
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものを比較する）
+        reverse (bool): True の場合は降順にソートする
         
     Returns:
         List[Any]: ソートされたリスト（元のリストと同じ参照）
     """
+    # NumPy の配列などの数値バッファは、np.sort(kind="quicksort") でその場でソートする
+    if key is None and numeric_sort(data, "quicksort", reverse):
+        return data
+
+    # key または reverse が指定された場合は、キーを1回だけ計算してからソートする
+    if key is not None or reverse:
+        data[:] = keyed_sort(data, selection_sort, key, reverse)
+        return data
+
     # リストの要素数を取得
     n = len(data)
     
@@ -0,0 +1,530 @@
+"""
+ティムソート（Timsort）モジュール
+
+このモジュールは、マージソートを実データ向けに改良した適応的なソート
+アルゴリズムであるティムソートを実装しています。
+既にソート済みの部分（ラン）を見つけて再利用するため、
+ほぼソート済みのデータに対して非常に高速に動作します。
+"""
+
+from typing import List, Any, Callable, Optional, Tuple
+
+from sort.gallop_utils import gallop_left, gallop_right
+from sort.key_utils import keyed_sort
+from sort.numeric_utils import numeric_sort
+
+
+# この要素数未満のリストは、マージを行わず2分挿入ソートだけでソートする
+_MIN_MERGE = 32
+
+# ギャロッピングモードに入るまでに、片方のランから連続して選ばれる回数の初期値
+_MIN_GALLOP = 7
+
+
+def tim_sort(
+    data: List[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> List[Any]:
+    """
+    ティムソートを用いてリストを昇順にソートします。
+    （リスト自体を変更します - 破壊的メソッド）
+
+    ティムソートは、Python の list.sort() でも採用されている
+    マージソートと挿入ソートを組み合わせたアルゴリズムです。
+    merge_sort のように中央で機械的に分割するのではなく、
+    データの中に最初から存在する昇順・降順の並び（ラン）を利用します。
+
+    アルゴリズムの手順:
+    1. 先頭から自然なラン（昇順、または厳密な降順）を検出する
+       - 降順のランはその場で反転して昇順にする
+    2. ランが最小ラン長より短ければ、2分挿入ソートで延長する
+    3. ランをスタックに積み、長さの不変条件を満たすようにマージする
+       - スタック上のランの長さを A, B, C（C が最も新しい）とすると
+         A > B + C かつ B > C
+    4. 最後にスタックに残ったランを全てマージする
+
+    マージでは、片方のランから連続して要素が選ばれ続けると
+    「ギャロッピングモード」に切り替え、指数探索で一度に多くの要素を
+    まとめて移動します。
+
+    時間計算量:
+    - 最悪/平均: O(n log n)
+    - 最良: O(n) - 既にソート済み（またはほぼソート済み）の場合
+    空間計算量: O(n) - マージ用の一時リスト（短い方のランの長さ）
+    安定性: 安定（同じ値の要素の相対的な順序が保持される）
+
+    Args:
+        data (List[Any]): ソート対象のリスト
+        key (Optional[Callable[[Any], Any]]): 比較に使うキーを返す関数
+            （各要素につき1回だけ呼ばれる。None の場合は要素そのものを比較する）
+        reverse (bool): True の場合は降順にソートする
+
+    Returns:
+        List[Any]: ソートされたリスト（元のリストと同じ参照）
+    """
+    # NumPy の配列などの数値バッファは、np.sort(kind="stable") でその場でソートする
+    if key is None and numeric_sort(data, "stable", reverse):
+        return data
+
+    # key または reverse が指定された場合は、キーを1回だけ計算してからソートする
+    if key is not None or reverse:
+        data[:] = keyed_sort(data, tim_sort, key, reverse)
+        return data
+
+    n = len(data)
+    if n < 2:
+        return data
+
+    # 小さなリストは、最初のランを2分挿入ソートで延長するだけで完了する
+    if n < _MIN_MERGE:
+        initial_run = _count_run_and_make_ascending(data, 0, n)
+        _binary_insertion_sort(data, 0, n, initial_run)
+        return data
+
+    state = _MergeState(data)
+    min_run = _compute_min_run(n)
+    low = 0
+    remaining = n
+    while remaining > 0:
+        # 自然なランを検出する
+        run_len = _count_run_and_make_ascending(data, low, n)
+
+        # ランが短すぎる場合は、min_run（または残り全て）まで延長する
+        if run_len < min_run:
+            forced = min(remaining, min_run)
+            _binary_insertion_sort(data, low, low + forced, low + run_len)
+            run_len = forced
+
+        # ランをスタックに積み、不変条件を満たすまでマージする
+        state.push_run(low, run_len)
+        state.merge_collapse()
+
+        low += run_len
+        remaining -= run_len
+
+    # 残ったランを全てマージする
+    state.merge_force_collapse()
+    return data
+
+
+def _compute_min_run(n: int) -> int:
+    """
+    最小ラン長を計算する
+
+    n / min_run が2のべき乗に近くなるように、
+    _MIN_MERGE / 2 以上 _MIN_MERGE 以下の値を選びます。
+    これにより、最後のマージが均等な長さのランどうしになります。
+
+    Args:
+        n (int): リストの要素数
+
+    Returns:
+        int: 最小ラン長
+    """
+    # n の上位ビットを取り出し、切り捨てたビットに1があれば1を足す
+    r = 0
+    while n >= _MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run_and_make_ascending(data: List[Any], low: int, high: int) -> int:
+    """
+    data[low] から始まる自然なランの長さを返す
+
+    ランは「昇順（等しい値を含む）」または「厳密な降順」の並びです。
+    降順のランは、その場で反転して昇順にします。
+    降順を「厳密」に限るのは、反転しても安定性が崩れないようにするためです。
+
+    Args:
+        data (List[Any]): 対象のリスト
+        low (int): ランの開始インデックス
+        high (int): 探索範囲の終了インデックス（この位置は含まない）
+
+    Returns:
+        int: ランの長さ
+    """
+    run_high = low + 1
+    if run_high == high:
+        return 1
+
+    if data[run_high] < data[low]:
+        # 厳密な降順のランを探し、反転して昇順にする
+        run_high += 1
+        while run_high < high and data[run_high] < data[run_high - 1]:
+            run_high += 1
+        data[low:run_high] = data[low:run_high][::-1]
+    else:
+        # 昇順（等しい値を含む）のランを探す
+        run_high += 1
+        while run_high < high and not data[run_high] < data[run_high - 1]:
+            run_high += 1
+
+    return run_high - low
+
+
+def _binary_insertion_sort(data: List[Any], low: int, high: int, start: int):
+    """
+    2分探索で挿入位置を求める挿入ソート
+
+    data[low:start] が既にソート済みであることを前提に、
+    data[start:high] の要素を1つずつ挿入して data[low:high] をソートします。
+    挿入位置は、等しい要素の右側になるように求めるため安定です。
+
+    Args:
+        data (List[Any]): 対象のリスト
+        low (int): ソート範囲の開始インデックス
+        high (int): ソート範囲の終了インデックス（この位置は含まない）
+        start (int): 未ソート部分の開始インデックス
+    """
+    for i in range(start, high):
+        pivot = data[i]
+
+        # 2分探索で、pivot より大きい最初の要素の位置を求める
+        left = low
+        right = i
+        while left < right:
+            mid = (left + right) >> 1
+            if pivot < data[mid]:
+                right = mid
+            else:
+                left = mid + 1
+
+        # 挿入位置以降の要素を右に1つずらし、pivot を挿入する
+        data[left + 1:i + 1] = data[left:i]
+        data[left] = pivot
+
+
+class _MergeState:
+    """
+    ティムソートのマージ処理の状態を管理するクラス
+
+    Attributes:
+        data (List[Any]): ソート対象のリスト
+        runs (List[Tuple[int, int]]): ランのスタック（開始インデックス, 長さ）
+        min_gallop (int): ギャロッピングモードに入るしきい値
+            （ギャロッピングが有効なデータでは小さく、無効なデータでは大きくなる）
+    """
+
+    def __init__(self, data: List[Any]):
+        self.data = data
+        self.runs: List[Tuple[int, int]] = []
+        self.min_gallop = _MIN_GALLOP
+
+    def push_run(self, base: int, length: int):
+        """ランをスタックに積む"""
+        self.runs.append((base, length))
+
+    def merge_collapse(self):
+        """
+        スタック上のランが不変条件を満たすまでマージする
+
+        スタックの上から4つのランの長さを W, X, Y, Z（Z が最も新しい）として、
+        X > Y + Z かつ W > X + Y かつ Y > Z を保ちます。
+        これによりランの長さがフィボナッチ数列以上の速さで増えるため、
+        スタックの深さは O(log n) に収まり、マージも均等な長さどうしになります。
+        """
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                    (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+                # 短い方の隣とマージする
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                # 不変条件を満たしている
+                break
+            self._merge_at(n)
+
+    def merge_force_collapse(self):
+        """スタックに残ったランを全てマージして1つにする"""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self._merge_at(n)
+
+    def _merge_at(self, i: int):
+        """
+        スタックの i 番目と i+1 番目のランをマージする
+
+        Args:
+            i (int): マージする左側のランのスタック上の位置
+        """
+        data = self.data
+        base1, len1 = self.runs[i]
+        base2, len2 = self.runs[i + 1]
+
+        # マージ後のランを記録する
+        self.runs[i] = (base1, len1 + len2)
+        del self.runs[i + 1]
+
+        # ラン1の先頭のうち、ラン2の先頭以下の要素は既に正しい位置にある
+        k = gallop_right(data[base2], data, base1, len1, 0)
+        base1 += k
+        len1 -= k
+        if len1 == 0:
+            return
+
+        # ラン2の末尾のうち、ラン1の末尾以上の要素も既に正しい位置にある
+        len2 = gallop_left(data[base1 + len1 - 1], data, base2, len2, len2 - 1)
+        if len2 == 0:
+            return
+
+        # 短い方のランを一時リストにコピーしてマージする
+        if len1 <= len2:
+            self._merge_low(base1, len1, base2, len2)
+        else:
+            self._merge_high(base1, len1, base2, len2)
+
+    def _merge_low(self, base1: int, len1: int, base2: int, len2: int):
+        """
+        ラン1の方が短い場合のマージ（左から右へ書き込む）
+
+        前提: data[base1] > data[base2] かつ data[base1+len1-1] > data[base2+len2-1]
+
+        Args:
+            base1 (int): ラン1の開始インデックス
+            len1 (int): ラン1の長さ
+            base2 (int): ラン2の開始インデックス（base1 + len1）
+            len2 (int): ラン2の長さ
+        """
+        data = self.data
+        tmp = data[base1:base1 + len1]
+        cursor1 = 0
+        cursor2 = base2
+        dest = base1
+
+        # 前提から、ラン2の先頭が最初の要素になる
+        data[dest] = data[cursor2]
+        dest += 1
+        cursor2 += 1
+        len2 -= 1
+        if len2 == 0:
+            data[dest:dest + len1] = tmp[cursor1:cursor1 + len1]
+            return
+        if len1 == 1:
+            data[dest:dest + len2] = data[cursor2:cursor2 + len2]
+            data[dest + len2] = tmp[cursor1]
+            return
+
+        min_gallop = self.min_gallop
+        done = False
+        while not done:
+            count1 = 0  # ラン1から連続して選ばれた回数
+            count2 = 0  # ラン2から連続して選ばれた回数
+
+            # 通常のマージ: どちらかが min_gallop 回連続で選ばれるまで続ける
+            while True:
+                if data[cursor2] < tmp[cursor1]:
+                    data[dest] = data[cursor2]
+                    dest += 1
+                    cursor2 += 1
+                    count2 += 1
+                    count1 = 0
+                    len2 -= 1
+                    if len2 == 0:
+                        done = True
+                        break
+                else:
+                    data[dest] = tmp[cursor1]
+                    dest += 1
+                    cursor1 += 1
+                    count1 += 1
+                    count2 = 0
+                    len1 -= 1
+                    if len1 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            # ギャロッピングモード: 指数探索でまとめて移動する
+            while True:
+                count1 = gallop_right(data[cursor2], tmp, cursor1, len1, 0)
+                if count1 != 0:
+                    data[dest:dest + count1] = tmp[cursor1:cursor1 + count1]
+                    dest += count1
+                    cursor1 += count1
+                    len1 -= count1
+                    if len1 <= 1:
+                        done = True
+                        break
+                data[dest] = data[cursor2]
+                dest += 1
+                cursor2 += 1
+                len2 -= 1
+                if len2 == 0:
+                    done = True
+                    break
+
+                count2 = gallop_left(tmp[cursor1], data, cursor2, len2, 0)
+                if count2 != 0:
+                    data[dest:dest + count2] = data[cursor2:cursor2 + count2]
+                    dest += count2
+                    cursor2 += count2
+                    len2 -= count2
+                    if len2 == 0:
+                        done = True
+                        break
+                data[dest] = tmp[cursor1]
+                dest += 1
+                cursor1 += 1
+                len1 -= 1
+                if len1 == 1:
+                    done = True
+                    break
+
+                # ギャロッピングが有効な間はしきい値を下げていく
+                min_gallop -= 1
+                if count1 < _MIN_GALLOP and count2 < _MIN_GALLOP:
+                    break
+            if done:
+                break
+
+            # ギャロッピングが有効でなくなったので、しきい値を上げて通常のマージに戻る
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2
+
+        self.min_gallop = max(min_gallop, 1)
+
+        if len1 == 1:
+            # ラン1の最後の要素は、ラン2の残りより後ろに来る
+            data[dest:dest + len2] = data[cursor2:cursor2 + len2]
+            data[dest + len2] = tmp[cursor1]
+        else:
+            # ラン2を使い切ったので、ラン1の残りを書き込む
+            data[dest:dest + len1] = tmp[cursor1:cursor1 + len1]
+
+    def _merge_high(self, base1: int, len1: int, base2: int, len2: int):
+        """
+        ラン2の方が短い場合のマージ（右から左へ書き込む）
+
+        前提: data[base1] > data[base2] かつ data[base1+len1-1] > data[base2+len2-1]
+
+        Args:
+            base1 (int): ラン1の開始インデックス
+            len1 (int): ラン1の長さ
+            base2 (int): ラン2の開始インデックス（base1 + len1）
+            len2 (int): ラン2の長さ
+        """
+        data = self.data
+        tmp = data[base2:base2 + len2]
+        cursor1 = base1 + len1 - 1
+        cursor2 = len2 - 1
+        dest = base2 + len2 - 1
+
+        # 前提から、ラン1の末尾が最後の要素になる
+        data[dest] = data[cursor1]
+        dest -= 1
+        cursor1 -= 1
+        len1 -= 1
+        if len1 == 0:
+            data[dest - len2 + 1:dest + 1] = tmp[0:len2]
+            return
+        if len2 == 1:
+            dest -= len1
+            cursor1 -= len1
+            data[dest + 1:dest + 1 + len1] = data[cursor1 + 1:cursor1 + 1 + len1]
+            data[dest] = tmp[cursor2]
+            return
+
+        min_gallop = self.min_gallop
+        done = False
+        while not done:
+            count1 = 0  # ラン1から連続して選ばれた回数
+            count2 = 0  # ラン2から連続して選ばれた回数
+
+            # 通常のマージ: どちらかが min_gallop 回連続で選ばれるまで続ける
+            while True:
+                if tmp[cursor2] < data[cursor1]:
+                    data[dest] = data[cursor1]
+                    dest -= 1
+                    cursor1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    len1 -= 1
+                    if len1 == 0:
+                        done = True
+                        break
+                else:
+                    data[dest] = tmp[cursor2]
+                    dest -= 1
+                    cursor2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    len2 -= 1
+                    if len2 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            # ギャロッピングモード: 指数探索でまとめて移動する
+            while True:
+                count1 = len1 - gallop_right(tmp[cursor2], data, base1, len1, len1 - 1)
+                if count1 != 0:
+                    dest -= count1
+                    cursor1 -= count1
+                    len1 -= count1
+                    data[dest + 1:dest + 1 + count1] = data[cursor1 + 1:cursor1 + 1 + count1]
+                    if len1 == 0:
+                        done = True
+                        break
+                data[dest] = tmp[cursor2]
+                dest -= 1
+                cursor2 -= 1
+                len2 -= 1
+                if len2 == 1:
+                    done = True
+                    break
+
+                count2 = len2 - gallop_left(data[cursor1], tmp, 0, len2, len2 - 1)
+                if count2 != 0:
+                    dest -= count2
+                    cursor2 -= count2
+                    len2 -= count2
+                    data[dest + 1:dest + 1 + count2] = tmp[cursor2 + 1:cursor2 + 1 + count2]
+                    if len2 <= 1:
+                        done = True
+                        break
+                data[dest] = data[cursor1]
+                dest -= 1
+                cursor1 -= 1
+                len1 -= 1
+                if len1 == 0:
+                    done = True
+                    break
+
+                # ギャロッピングが有効な間はしきい値を下げていく
+                min_gallop -= 1
+                if count1 < _MIN_GALLOP and count2 < _MIN_GALLOP:
+                    break
+            if done:
+                break
+
+            # ギャロッピングが有効でなくなったので、しきい値を上げて通常のマージに戻る
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2
+
+        self.min_gallop = max(min_gallop, 1)
+
+        if len2 == 1:
+            # ラン2の最初の要素は、ラン1の残りより前に来る
+            dest -= len1
+            cursor1 -= len1
+            data[dest + 1:dest + 1 + len1] = data[cursor1 + 1:cursor1 + 1 + len1]
+            data[dest] = tmp[cursor2]
+        else:
+            # ラン1を使い切ったので、ラン2の残りを書き込む
+            data[dest - len2 + 1:dest + 1] = tmp[0:len2]
@@ -0,0 +1,46 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+import sort.auto_sort as auto
+from sort.auto_sort import auto_sort
+
+def test_auto_sort_small_int_range_uses_counting(monkeypatch):
+    calls = []
+    original = auto._sort_by_int_keys
+
+    def spy(data, keys, reverse, counting):
+        calls.append(counting)
+        return original(data, keys, reverse, counting)
+
+    monkeypatch.setattr(auto, "_sort_by_int_keys", spy)
+    rng = random.Random(0)
+    data = [rng.randint(0, 100) for _ in range(1000)]
+    assert auto_sort(data[:]) == sorted(data)
+    wide = [rng.randint(0, 2**40) for _ in range(1000)]
+    assert auto_sort(wide[:]) == sorted(wide)
+    assert calls == [True, False]
+
+def test_auto_sort_non_int_keys():
+    data = ["pear", "fig", "apple", "kiwi"]
+    assert auto_sort(data[:]) == sorted(data)
+    assert auto_sort(data[:], key=len, reverse=True) == sorted(data, key=len, reverse=True)
+
+def test_auto_sort_key_called_once():
+    calls = []
+
+    def key(value):
+        calls.append(value)
+        return str(value)
+
+    data = list(range(50, 0, -1))
+    assert auto_sort(data[:], key=key) == sorted(data, key=str)
+    assert len(calls) == len(data)
+
+def test_auto_sort_huge_ints_and_bools():
+    data = [2**100, -2**100, 0, 5]
+    assert auto_sort(data[:]) == sorted(data)
+    flags = [True, False, True]
+    assert auto_sort(flags[:]) == [False, True, True]
@@ -2,7 +2,16 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from graph.bfs import bfs
+from graph.bfs import (
+    bfs,
+    bfs_distances,
+    bfs_parents,
+    bidirectional_shortest_path,
+    iter_bfs,
+    multi_source_bfs,
+    shortest_path,
+)
+from graph.csr_graph import CSRGraph
 
 # Graph structure:
 #      A
@@ -39,3 +48,78 @@ def test_bfs_disconnected():
         'G': []
     }
     assert bfs(g, 'A') == ['A', 'B']
+
+def test_bfs_distances_and_parents():
+    assert bfs_distances(graph, 'A') == {'A': 0, 'B': 1, 'C': 1, 'D': 2, 'E': 2, 'F': 2}
+    assert bfs_parents(graph, 'B') == {'B': None, 'D': 'B', 'E': 'B'}
+    assert bfs_distances(CSRGraph.from_adjacency(graph), 'C') == {'C': 0, 'F': 1}
+
+def test_shortest_path():
+    g = {'A': ['B', 'C'], 'B': ['D'], 'C': ['D'], 'D': ['E'], 'E': []}
+    assert shortest_path(g, 'A', 'E') == ['A', 'B', 'D', 'E']
+    assert shortest_path(g, 'A', 'A') == ['A']
+    assert shortest_path(g, 'E', 'A') is None
+    assert shortest_path(graph, 'A', 'Z') is None
+
+def test_shortest_path_stops_early():
+    visited = []
+
+    class Recording(dict):
+        def get(self, node, default=None):
+            visited.append(node)
+            return dict.get(self, node, default)
+
+    g = Recording({i: [i + 1] for i in range(1000)})
+    assert shortest_path(g, 0, 3) == [0, 1, 2, 3]
+    assert visited == [0, 1, 2]
+
+def test_bidirectional_shortest_path_undirected():
+    # 格子状の無向グラフ
+    n = 20
+    g = {}
+    for x in range(n):
+        for y in range(n):
+            g[(x, y)] = [(x + dx, y + dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                         if 0 <= x + dx < n and 0 <= y + dy < n]
+    path = bidirectional_shortest_path(g, (0, 0), (n - 1, n - 1))
+    assert len(path) == len(shortest_path(g, (0, 0), (n - 1, n - 1))) == 2 * n - 1
+    assert path[0] == (0, 0) and path[-1] == (n - 1, n - 1)
+    assert all(b in g[a] for a, b in zip(path, path[1:]))
+    assert bidirectional_shortest_path(g, (3, 3), (3, 3)) == [(3, 3)]
+
+def test_bidirectional_shortest_path_directed():
+    g = {'A': ['B', 'C'], 'B': ['D'], 'C': ['D'], 'D': ['E'], 'E': []}
+    reverse = {}
+    for node, neighbors in g.items():
+        for neighbor in neighbors:
+            reverse.setdefault(neighbor, []).append(node)
+    path = bidirectional_shortest_path(g, 'A', 'E', reverse)
+    assert path in (['A', 'B', 'D', 'E'], ['A', 'C', 'D', 'E'])
+    assert bidirectional_shortest_path(g, 'E', 'A', reverse) is None
+
+def test_multi_source_bfs():
+    g = {0: [1], 1: [0, 2], 2: [1, 3], 3: [2, 4], 4: [3]}
+    assert multi_source_bfs(g, [0, 4]) == {0: 0, 4: 0, 1: 1, 3: 1, 2: 2}
+    assert multi_source_bfs(g, []) == {}
+
+def test_iter_bfs():
+    assert list(iter_bfs(graph, 'A')) == bfs(graph, 'A')
+    assert list(iter_bfs(graph, 'A', max_depth=1)) == ['A', 'B', 'C']
+    assert list(iter_bfs(graph, 'A', neighbor_filter=lambda u, v: v != 'B')) == ['A', 'C', 'F']
+    assert list(iter_bfs(graph, 'A', max_depth=1, details=True)) == [
+        ('A', 0, None), ('B', 1, 'A'), ('C', 1, 'A')]
+    assert list(iter_bfs(CSRGraph.from_adjacency(graph), 'B')) == ['B', 'D', 'E']
+
+def test_iter_bfs_stops_early():
+    expanded = []
+
+    class Recording(dict):
+        def get(self, node, default=None):
+            expanded.append(node)
+            return dict.get(self, node, default)
+
+    # 無限に続く鎖のようなグラフでも、見つけた時点で打ち切れる
+    g = Recording({i: [i + 1, i + 2] for i in range(100_000)})
+    found = next(node for node in iter_bfs(g, 0) if node >= 10)
+    assert found == 10
+    assert len(expanded) < 20
@@ -2,7 +2,10 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from search.binary_search import binary_search
+import bisect
+import random
+
+from search.binary_search import binary_search, lower_bound, upper_bound, equal_range, binary_search_many
 
 def test_binary_search_found():
     data = [10, 20, 30, 40, 50]
@@ -19,3 +22,30 @@ def test_binary_search_not_found():
 def test_binary_search_empty():
     data = []
     assert binary_search(data, 10) == -1
+
+def test_lower_and_upper_bound_match_bisect():
+    rng = random.Random(0)
+    data = sorted(rng.randint(0, 30) for _ in range(100))
+    for target in range(-1, 33):
+        assert lower_bound(data, target) == bisect.bisect_left(data, target)
+        assert upper_bound(data, target) == bisect.bisect_right(data, target)
+    assert lower_bound(data, 10, 50, 60) == bisect.bisect_left(data, 10, 50, 60)
+    assert upper_bound([], 1) == 0
+
+def test_equal_range():
+    data = [1, 2, 2, 2, 3, 5]
+    assert equal_range(data, 2) == (1, 4)
+    assert equal_range(data, 4) == (5, 5)
+    assert equal_range(data, 0) == (0, 0)
+
+def test_binary_search_many():
+    rng = random.Random(1)
+    data = sorted(rng.randint(0, 1000) for _ in range(500))
+    targets = [rng.randint(-10, 1010) for _ in range(300)]
+    expected = [bisect.bisect_left(data, t) if t in data else -1 for t in targets]
+    assert binary_search_many(data, targets) == expected
+    assert binary_search_many([], [1, 2]) == [-1, -1]
+    assert binary_search_many(data, []) == []
+    # ジェネレータなど、位置で参照できないイテラブルも受け付ける
+    assert binary_search_many(data, (t for t in targets)) == expected
+    assert binary_search_many(data, iter([])) == []
@@ -0,0 +1,149 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+
+from search.bounded_cache import BoundedCache
+from search.hash_search import HashTable
+
+class _FakeClock:
+    """テスト用の時計（advance で時刻を進める）"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+def test_lru_eviction():
+    cache = BoundedCache(capacity=2)
+    assert isinstance(cache, HashTable)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1      # a が最近使われた
+    cache.put("c", 3)               # b が追い出される
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert len(cache) == 2
+
+def test_lfu_eviction():
+    cache = BoundedCache(capacity=2, policy="lfu")
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    cache.put("c", 3)               # 参照回数が最も少ない b が追い出される
+    assert "b" not in cache
+    cache.put("d", 4)               # c と d は回数1、古い c が追い出される
+    assert sorted(cache) == ["a", "d"]
+    cache.delete("d")
+    cache.put("e", 5)
+    cache.put("f", 6)
+    assert sorted(cache) == ["a", "f"]
+
+def test_ttl_expiry():
+    clock = _FakeClock()
+    cache = BoundedCache(capacity=10, ttl=5, clock=clock)
+    cache.put("a", 1)
+    clock.advance(3)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    clock.advance(3)
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    cache.put("b", 20)              # 更新すると有効期限も延びる
+    clock.advance(4)
+    assert cache.get("b") == 20
+    clock.advance(2)
+    cache.put("c", 3)               # 期限切れの b は格納時に取り除かれる
+    assert len(cache) == 1
+    assert cache.stats()["expirations"] == 2
+
+def test_ttl_len_and_iteration_skip_expired():
+    clock = _FakeClock()
+    cache = BoundedCache(capacity=10, ttl=5, clock=clock)
+    cache.insert_many([("a", 1), ("b", 2)])
+    clock.advance(3)
+    cache.put("c", 3)
+    clock.advance(3)
+    # a と b は期限切れ。格納や参照をしなくても len() やイテレーションに現れない
+    assert len(cache) == 1
+    assert list(cache) == ["c"]
+    assert dict(cache.items()) == {"c": 3}
+    assert list(cache.values()) == [3]
+    assert cache.stats()["expirations"] == 2
+
+def test_lfu_victim_after_deletes():
+    cache = BoundedCache(capacity=3, policy="lfu")
+    cache.insert_many([("a", 1), ("b", 2), ("c", 3)])
+    for _ in range(3):
+        cache.get("a")              # a: 4回
+    cache.get("b")                  # b: 2回
+    cache.delete("c")               # 回数1のバケットが空になる
+    cache.put("d", 4)               # d: 1回
+    cache.get("d")
+    cache.get("d")                  # d: 3回（b と a の間のバケットに入る）
+    cache.put("e", 5)               # 最小の b（2回）が追い出される
+    assert sorted(cache) == ["a", "d", "e"]
+    cache.put("f", 6)               # 回数1の e が追い出される
+    assert sorted(cache) == ["a", "d", "f"]
+    cache.get("f")
+    cache.get("f")
+    cache.get("f")                  # f: 4回（a と同じ回数で、a より新しい）
+    cache.delete("d")
+    cache.put("g", 7)
+    cache.put("h", 8)               # 回数1の g が追い出される
+    assert sorted(cache) == ["a", "f", "h"]
+    cache.get("h")
+    cache.get("h")
+    cache.get("h")
+    cache.get("h")                  # h: 5回
+    cache.put("i", 9)               # i が入る前に最小の回数4のうち古い a が追い出される
+    assert sorted(cache) == ["f", "h", "i"]
+
+def test_stats():
+    cache = BoundedCache(capacity=1)
+    cache.insert("a", 1)
+    assert cache.search("a") == 1
+    assert cache.search("z") is None
+    with pytest.raises(KeyError):
+        cache["z"]
+    cache["b"] = 2
+    assert cache.stats() == {
+        "hits": 1, "misses": 2, "hit_rate": 1 / 3, "evictions": 1,
+        "expirations": 0, "size": 1, "capacity": 1,
+    }
+
+def test_mapping_views_do_not_touch():
+    cache = BoundedCache(capacity=3)
+    cache.insert_many([("a", 1), ("b", 2), ("c", 3)])
+    assert dict(cache.items()) == {"a": 1, "b": 2, "c": 3}
+    assert sorted(cache.values()) == [1, 2, 3]
+    assert cache.stats()["hits"] == 0
+    cache.put("d", 4)               # 参照されていない a が追い出される
+    assert cache.get_many(["a", "d"]) == [None, 4]
+    assert cache.delete_many(["b", "x"]) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+def test_large_capacity_stays_bounded():
+    cache = BoundedCache(capacity=1000, policy="lfu")
+    for i in range(20_000):
+        cache.put(i, i)
+        cache.get(i // 2)
+    assert len(cache) == 1000
+    assert cache.stats()["evictions"] == 19_000
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        BoundedCache(capacity=0)
+    with pytest.raises(ValueError):
+        BoundedCache(capacity=1, policy="fifo")
+    with pytest.raises(ValueError):
+        BoundedCache(capacity=1, ttl=0)
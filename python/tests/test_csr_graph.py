@@ -0,0 +1,95 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+import pytest
+
+from graph.bfs import bfs
+from graph.csr_graph import CSRGraph
+from graph.dfs import dfs_iterative, dfs_recursive
+
+# Graph structure:
+#      A
+#     / \
+#    B   C
+#   / \   \
+#  D   E   F
+
+graph = {
+    'A': ['B', 'C'],
+    'B': ['D', 'E'],
+    'C': ['F'],
+    'D': [],
+    'E': [],
+    'F': []
+}
+
+def _random_graph(n, m, seed=0):
+    rng = random.Random(seed)
+    g = {i: [] for i in range(n)}
+    for _ in range(m):
+        g[rng.randrange(n)].append(rng.randrange(n))
+    return g
+
+def test_from_adjacency():
+    csr = CSRGraph.from_adjacency(graph)
+    assert len(csr) == 6
+    assert csr.edge_count == 5
+    assert csr.neighbors('A') == ['B', 'C']
+    assert csr.neighbors('Z') == []
+    assert 'F' in csr and 'Z' not in csr
+    assert csr.to_adjacency() == graph
+    assert csr.targets.typecode == 'i'
+
+def test_neighbor_only_nodes():
+    csr = CSRGraph.from_adjacency({'A': ['B', 'C'], 'C': ['D']})
+    assert len(csr) == 4
+    assert csr.neighbors('C') == ['D']
+    assert csr.neighbors('B') == []
+    assert csr.neighbors('D') == []
+
+def test_from_edges_keeps_edge_order():
+    edges = [('A', 'B'), ('B', 'D'), ('A', 'C'), ('B', 'E'), ('C', 'F')]
+    csr = CSRGraph.from_edges(edges)
+    assert csr.neighbors('A') == ['B', 'C']
+    assert csr.neighbors('B') == ['D', 'E']
+    assert bfs(csr, 'A') == bfs(graph, 'A')
+
+def test_integer_nodes_without_names():
+    # 0 -> 1, 0 -> 2, 1 -> 2
+    csr = CSRGraph([0, 2, 3, 3], [1, 2, 2])
+    assert csr.neighbors(0) == [1, 2]
+    assert bfs(csr, 0) == [0, 1, 2]
+    assert dfs_iterative(csr, 0) == [0, 1, 2]
+    assert 3 not in csr
+    with pytest.raises(ValueError):
+        CSRGraph([0, 2], [1])
+
+def test_node_id_and_names():
+    csr = CSRGraph.from_adjacency(graph)
+    assert csr.node_id('A') == 0 and csr.node_id('Z') == -1
+    assert csr.node_names([csr.node_id('F'), 0]) == ['F', 'A']
+    plain = CSRGraph([0, 1, 1], [1])
+    assert plain.node_id(1) == 1 and plain.node_id(2) == -1
+    assert plain.node_names([1, 0]) == [1, 0]
+
+def test_traversals_match_dict_version():
+    assert bfs(CSRGraph.from_adjacency(graph), 'A') == ['A', 'B', 'C', 'D', 'E', 'F']
+    assert dfs_recursive(CSRGraph.from_adjacency(graph), 'A') == ['A', 'B', 'D', 'E', 'C', 'F']
+    g = _random_graph(500, 1500)
+    csr = CSRGraph.from_adjacency(g)
+    for start in (0, 17, 499):
+        assert bfs(csr, start) == bfs(g, start)
+        assert dfs_iterative(csr, start) == dfs_recursive(g, start)
+
+def test_missing_start():
+    csr = CSRGraph.from_adjacency(graph)
+    assert bfs(csr, 'Z') == ['Z']
+    assert dfs_recursive(csr, 'Z') == ['Z']
+
+def test_deep_path_does_not_recurse():
+    n = 100_000
+    csr = CSRGraph(list(range(n)) + [n - 1], list(range(1, n)))
+    assert dfs_recursive(csr, 0) == list(range(n))
@@ -2,7 +2,11 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from graph.dfs import dfs_recursive, dfs_iterative
+import random
+
+from graph.bfs import bfs_distances
+from graph.csr_graph import CSRGraph
+from graph.dfs import DFSEvent, dfs_events, dfs_recursive, dfs_iterative, iter_dfs
 
 # Graph structure:
 #      A
@@ -42,3 +46,80 @@ def test_dfs_disconnected():
     }
     assert dfs_recursive(g, 'A') == ['A', 'B']
     assert dfs_iterative(g, 'A') == ['A', 'B']
+
+def test_iter_dfs():
+    assert list(iter_dfs(graph, 'A')) == ['A', 'B', 'D', 'E', 'C', 'F']
+    assert list(iter_dfs(graph, 'A', max_depth=1)) == ['A', 'B', 'C']
+    assert list(iter_dfs(graph, 'A', neighbor_filter=lambda u, v: v != 'D')) == ['A', 'B', 'E', 'C', 'F']
+    assert list(iter_dfs(graph, 'A', details=True))[:3] == [('A', 0, None), ('B', 1, 'A'), ('D', 2, 'B')]
+    assert list(iter_dfs(CSRGraph.from_adjacency(graph), 'C')) == ['C', 'F']
+
+def test_iter_dfs_max_depth_on_dag():
+    # D は A から辺2本（A → C → D）だが、先に A → B → C の枝で C に深さ2で到達する
+    dag = {'A': ['B', 'C'], 'B': ['C'], 'C': ['D'], 'D': []}
+    assert list(iter_dfs(dag, 'A', max_depth=2)) == ['A', 'B', 'C', 'D']
+    assert list(iter_dfs(dag, 'A', max_depth=1)) == ['A', 'B', 'C']
+    assert list(iter_dfs(dag, 'A', max_depth=2, details=True))[-1] == ('D', 2, 'C')
+    # 深さの上限の内側にある全てのノードを、1回ずつ返す
+    rng = random.Random(3)
+    g = {i: [rng.randrange(200) for _ in range(3)] for i in range(200)}
+    for limit in (1, 2, 4):
+        nodes = list(iter_dfs(g, 0, max_depth=limit))
+        assert len(nodes) == len(set(nodes))
+        assert set(nodes) == {v for v, d in bfs_distances(g, 0).items() if d <= limit}
+
+def test_iter_dfs_deep_path_and_early_stop():
+    n = 100_000
+    path = {i: [i + 1] for i in range(n)}
+    assert sum(1 for _ in iter_dfs(path, 0)) == n + 1
+    it = iter_dfs(path, 0)
+    assert [next(it) for _ in range(3)] == [0, 1, 2]
+
+def test_dfs_iterative_pushes_each_node_once():
+    # 完全グラフでも、スタックの大きさは探索の深さまで
+    n = 300
+    complete = {i: [j for j in range(n) if j != i] for i in range(n)}
+    assert dfs_iterative(complete, 0) == list(range(n))
+    path = {i: [i + 1] for i in range(100_000)}
+    assert len(dfs_iterative(path, 0)) == 100_001
+
+def test_dfs_events_tree():
+    events = list(dfs_events(graph, ['A']))
+    assert events[:4] == [
+        DFSEvent("discover", 'A', None, 0),
+        DFSEvent("tree", 'A', 'B', None),
+        DFSEvent("discover", 'B', 'A', 1),
+        DFSEvent("tree", 'B', 'D', None),
+    ]
+    finishes = [e.node for e in events if e.kind == "finish"]
+    assert finishes == ['D', 'E', 'B', 'F', 'C', 'A']
+    assert events[-1] == DFSEvent("finish", 'A', None, 11)
+
+def test_dfs_events_edge_classification():
+    g = {
+        'A': ['B', 'C'],
+        'B': ['C', 'A'],   # B -> A は後退辺
+        'C': [],
+        'D': ['C'],        # D -> C は別の木への横断辺
+    }
+    g['A'].append('C')     # A -> C（2本目）は前進辺
+    kinds = {(e.node, e.neighbor): e.kind for e in dfs_events(g) if e.time is None}
+    assert kinds == {
+        ('A', 'B'): "tree",
+        ('B', 'C'): "tree",
+        ('B', 'A'): "back",
+        ('A', 'C'): "forward",
+        ('D', 'C'): "cross",
+    }
+
+def test_dfs_events_times_nest():
+    g = {i: [(i * 7 + k) % 50 for k in range(3)] for i in range(50)}
+    discover = {}
+    finish = {}
+    for e in dfs_events(g):
+        if e.kind == "discover":
+            discover[e.node] = e.time
+        elif e.kind == "finish":
+            finish[e.node] = e.time
+    assert sorted(list(discover.values()) + list(finish.values())) == list(range(100))
+    assert all(discover[v] < finish[v] for v in g)
@@ -0,0 +1,96 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+import pytest
+
+from graph.bfs import bfs
+from graph.csr_graph import CSRGraph
+from graph.direction_optimizing_bfs import direction_optimizing_bfs
+
+# Graph structure:
+#      A
+#     / \
+#    B   C
+#   / \   \
+#  D   E   F
+
+graph = {
+    'A': ['B', 'C'],
+    'B': ['D', 'E'],
+    'C': ['F'],
+    'D': [],
+    'E': [],
+    'F': []
+}
+
+def _social_graph(n, degree, seed=0):
+    # 無向グラフ（両方向のエッジ）で、次数が大きく直径の小さいランダムグラフ
+    rng = random.Random(seed)
+    g = {i: [] for i in range(n)}
+    for u in range(n):
+        for _ in range(degree // 2):
+            v = rng.randrange(n)
+            g[u].append(v)
+            g[v].append(u)
+    return g
+
+def _check(g, csr, start, order, depth, parent):
+    expected = bfs(g, start)
+    assert set(order) == set(expected)
+    assert order[0] == start
+    # 深さは順序に沿って増えていき、親は1つ浅い階層にあって、親からのエッジがある
+    depths = [depth[csr.node_id(node)] for node in order]
+    assert depths == sorted(depths)
+    for node in order[1:]:
+        p = parent[csr.node_id(node)]
+        assert depth[p] == depth[csr.node_id(node)] - 1
+        assert node in g[csr.node_names([p])[0]]
+
+def test_tree():
+    csr = CSRGraph.from_adjacency(graph)
+    order, depth, parent = direction_optimizing_bfs(csr, 'A')
+    assert order == ['A', 'B', 'C', 'D', 'E', 'F']
+    assert [depth[csr.node_id(node)] for node in order] == [0, 1, 1, 2, 2, 2]
+    assert csr.node_names([parent[csr.node_id(node)] for node in order]) == ['A', 'A', 'A', 'B', 'B', 'C']
+
+def test_matches_bfs_with_bottom_up_levels():
+    g = _social_graph(2_000, 16)
+    csr = CSRGraph.from_adjacency(g)
+    for start in (0, 999):
+        # alpha を大きくしてボトムアップ型に切り替わりやすくする
+        for alpha in (14, 1_000):
+            _check(g, csr, start, *direction_optimizing_bfs(csr, start, alpha=alpha))
+
+def test_directed_graph():
+    rng = random.Random(1)
+    g = {i: [rng.randrange(500) for _ in range(rng.randrange(8))] for i in range(500)}
+    csr = CSRGraph.from_adjacency(g)
+    _check(g, csr, 0, *direction_optimizing_bfs(csr, 0, alpha=1_000, beta=1_000_000))
+
+def test_csr_arrays():
+    csr = CSRGraph([0, 1, 2, 2, 2], [1, 2])
+    order, depth, parent = direction_optimizing_bfs(csr, 0)
+    assert order == [0, 1, 2]
+    assert depth.tolist() == [0, 1, 2, -1]
+    assert parent.tolist() == [0, 0, 1, -1]
+
+def test_missing_start():
+    order, depth, parent = direction_optimizing_bfs(CSRGraph.from_adjacency(graph), 'Z')
+    assert order == ['Z']
+    assert set(depth) == {-1} and set(parent) == {-1}
+
+def test_requires_csr_graph():
+    # 呼び出しのたびに変換しないよう、隣接リストは受け付けない
+    with pytest.raises(TypeError, match="from_adjacency"):
+        direction_optimizing_bfs(graph, 'A')
+
+def test_transpose():
+    csr = CSRGraph.from_adjacency(graph)
+    reverse = csr.transpose()
+    assert reverse.neighbors('D') == ['B']
+    assert reverse.neighbors('A') == []
+    assert csr.transpose() is reverse
+    assert reverse.transpose() is csr
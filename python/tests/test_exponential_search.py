@@ -0,0 +1,42 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from search.exponential_search import exponential_search
+
+def test_exponential_search_found():
+    data = [10, 20, 30, 40, 50]
+    assert exponential_search(data, 30) == 2
+    assert exponential_search(data, 10) == 0
+    assert exponential_search(data, 50) == 4
+
+def test_exponential_search_not_found():
+    data = [10, 20, 30, 40, 50]
+    assert exponential_search(data, 25) == -1
+    assert exponential_search(data, 5) == -1
+    assert exponential_search(data, 55) == -1
+    assert exponential_search([], 10) == -1
+
+def test_exponential_search_leftmost_duplicate():
+    assert exponential_search([1, 2, 2, 2, 3], 2) == 1
+
+class _LazySquares:
+    """長さを持たず、要求された位置だけを計算するデータ（末尾を越えたら IndexError）"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.accessed = []
+
+    def __getitem__(self, i):
+        if i >= self.limit:
+            raise IndexError(i)
+        self.accessed.append(i)
+        return i * i
+
+def test_exponential_search_lazy_source():
+    source = _LazySquares(1_000_000)
+    assert exponential_search(source, 144) == 12
+    # 先頭近くのターゲットは、先頭近くの要素だけを読んで見つかる
+    assert max(source.accessed) < 32
+    assert exponential_search(source, 145) == -1
+    assert exponential_search(_LazySquares(10), 10 ** 6) == -1
@@ -0,0 +1,79 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import io
+import random
+
+import pytest
+
+from sort.external_sort import _RECORD_OVERHEAD, _read_chunks, external_sort
+
+def _write(path, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+def test_external_sort_lines_in_memory(tmp_path):
+    path = _write(tmp_path / "input.txt", b"cherry\napple\nbanana\n")
+    assert list(external_sort(path)) == [b"apple", b"banana", b"cherry"]
+
+def test_external_sort_empty(tmp_path):
+    path = _write(tmp_path / "input.txt", b"")
+    assert list(external_sort(path)) == []
+
+def test_external_sort_lines_with_spill(tmp_path):
+    rng = random.Random(0)
+    lines = [str(rng.randint(0, 10**6)).encode() for _ in range(2000)]
+    path = _write(tmp_path / "input.txt", b"\n".join(lines) + b"\n")
+    # メモリ上限を小さくして、多数のランと多段階のマージを発生させる
+    result = list(external_sort(path, memory_limit=2000, fan_in=3, tmp_dir=str(tmp_path)))
+    assert result == sorted(lines)
+    # 一時ファイルは全て削除されている
+    assert sorted(os.listdir(tmp_path)) == ["input.txt"]
+
+def test_external_sort_fixed_width_key_reverse(tmp_path):
+    rng = random.Random(1)
+    records = [rng.randint(0, 50).to_bytes(2, "big") + bytes([i % 256, 0]) for i in range(500)]
+    path = _write(tmp_path / "input.bin", b"".join(records))
+    key = lambda record: record[:2]
+    result = list(external_sort(path, record_size=4, memory_limit=1500, fan_in=4, key=key, reverse=True))
+    # 降順でも、キーが等しいレコードは元の順序のまま（安定）
+    assert result == sorted(records, key=key, reverse=True)
+
+def test_external_sort_computes_each_key_once(tmp_path):
+    rng = random.Random(2)
+    lines = [str(rng.randint(0, 10**6)).encode() for _ in range(1000)]
+    path = _write(tmp_path / "input.txt", b"\n".join(lines) + b"\n")
+    calls = []
+    def key(record):
+        calls.append(record)
+        return int(record)
+    # 多段階のマージでも、キーはレコード1件につき1回だけ計算する
+    result = list(external_sort(path, memory_limit=2000, fan_in=3, key=key, reverse=True))
+    assert result == sorted(lines, key=int, reverse=True)
+    assert len(calls) == len(lines)
+
+def test_external_sort_keeps_trailing_carriage_return(tmp_path):
+    # 行末の改行コード（\n または \r\n）の1つだけを取り除き、その前の \r は残す
+    path = _write(tmp_path / "input.txt", b"b\r\r\na\r\nc\r\n")
+    assert list(external_sort(path)) == [b"a", b"b\r", b"c"]
+    lines = [b"x%d\r" % i for i in range(300)]
+    path = _write(tmp_path / "spill.txt", b"".join(line + b"\r\n" for line in lines))
+    assert list(external_sort(path, memory_limit=500, fan_in=2)) == sorted(lines)
+
+def test_external_sort_invalid_arguments(tmp_path):
+    path = _write(tmp_path / "input.bin", b"abc")
+    with pytest.raises(ValueError):
+        list(external_sort(path, fan_in=1))
+    with pytest.raises(ValueError):
+        list(external_sort(path, record_size=2))
+
+def test_read_chunks_peeks_only_one_record():
+    # 1つの塊は2レコード分。次の塊を丸ごと読まず、1レコードだけ先読みして最後かどうかを判定する
+    source = io.BytesIO(b"".join(bytes([i]) * 4 for i in range(5)))
+    chunks = _read_chunks(source, 4, 2 * (4 + _RECORD_OVERHEAD))
+    chunk, last = next(chunks)
+    assert len(chunk) == 2 and not last
+    assert source.tell() == 3 * 4
+    assert [(len(c), last) for c, last in chunks] == [(2, False), (1, True)]
@@ -0,0 +1,23 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import bisect
+import random
+
+from sort.gallop_utils import gallop_left, gallop_right
+
+def test_gallop_matches_bisect():
+    rng = random.Random(0)
+    data = sorted(rng.randint(0, 50) for _ in range(200))
+    base, length = 30, 120
+    window = data[base:base + length]
+    for key in range(-1, 52):
+        for hint in (0, length // 2, length - 1):
+            assert gallop_left(key, data, base, length, hint) == bisect.bisect_left(window, key)
+            assert gallop_right(key, data, base, length, hint) == bisect.bisect_right(window, key)
+
+def test_gallop_on_tuple():
+    data = (1, 3, 3, 3, 5)
+    assert gallop_left(3, data, 0, 5, 4) == 1
+    assert gallop_right(3, data, 0, 5, 0) == 4
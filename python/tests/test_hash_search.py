@@ -2,7 +2,11 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from search.hash_search import HashTable
+import threading
+
+import pytest
+
+from search.hash_search import ConcurrentHashTable, HashTable, _home_slot
 
 def test_hash_table_basic():
     ht = HashTable(size=5)
@@ -40,3 +44,175 @@ def test_hash_table_delete():
     assert ht.delete("apple") is True
     assert ht.search("apple") is None
     assert ht.delete("apple") is False
+
+def test_hash_table_grows_and_shrinks():
+    ht = HashTable()
+    for i in range(100_000):
+        ht.insert(i, i * 2)
+    # 負荷率が 2/3 以下に保たれる
+    assert ht.size >= 100_000 * 3 / 2
+    assert all(ht.search(i) == i * 2 for i in range(0, 100_000, 97))
+
+    for i in range(99_990):
+        assert ht.delete(i) is True
+    assert ht.size <= 64
+    assert ht.search(5) is None
+    assert [ht.search(i) for i in range(99_990, 100_000)] == [i * 2 for i in range(99_990, 100_000)]
+
+class _CollidingKey:
+    """全て同じハッシュ値を持つキー（値で比較する）"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return 7
+
+    def __eq__(self, other):
+        return isinstance(other, _CollidingKey) and self.value == other.value
+
+def test_hash_table_probe_past_tombstone():
+    # 全てのキーが同じ位置から探査を始める（ハッシュ値が同じ）
+    a, b, c, d = (_CollidingKey(v) for v in "abcd")
+    ht = HashTable(size=8)
+    ht.insert(a, "a")
+    ht.insert(b, "b")
+    ht.insert(c, "c")
+    assert ht.delete(_CollidingKey("b")) is True
+    # 墓標を越えて、後ろのキーを見つけられる
+    assert ht.search(_CollidingKey("c")) == "c"
+    # 墓標のスロットが再利用される
+    ht.insert(d, "d")
+    assert ht._keys.count(d) == 1
+    assert ht._filled == 3
+    assert [ht.search(_CollidingKey(v)) for v in "abcd"] == ["a", None, "c", "d"]
+
+def test_hash_table_keys_sharing_low_bits():
+    # 下位ビットが揃ったキーも、探査の開始位置が散らばる（長い探査列ができない）
+    ht = HashTable()
+    keys = [i << 20 for i in range(4000)]
+    ht.insert_many((k, k) for k in keys)
+    assert ht.get_many(keys[::7]) == keys[::7]
+    starts = {_home_slot(hash(k), ht._mask) for k in keys}
+    assert len(starts) > len(keys) // 2
+
+class _CountingKey:
+    """__eq__ の呼び出し回数を数えるキー"""
+
+    calls = 0
+
+    def __init__(self, name, h):
+        self.name = name
+        self.h = h
+
+    def __hash__(self):
+        return self.h
+
+    def __eq__(self, other):
+        _CountingKey.calls += 1
+        return isinstance(other, _CountingKey) and self.name == other.name
+
+def test_hash_table_skips_eq_on_hash_mismatch():
+    ht = HashTable()
+    keys = [_CountingKey(str(i), i) for i in range(5)]
+    for k in keys:
+        ht.insert(k, k.name)
+    _CountingKey.calls = 0
+    assert ht.search(_CountingKey("4", 4)) == "4"
+    assert ht.search(_CountingKey("x", 100)) is None
+    assert _CountingKey.calls == 1
+
+def test_hash_table_none_key():
+    ht = HashTable()
+    ht.insert(None, 1)
+    assert ht.search(None) == 1
+    assert ht.delete(None) is True
+
+def test_hash_table_mapping_protocol():
+    ht = HashTable()
+    ht["a"] = 1
+    ht["b"] = None
+    assert ht["a"] == 1
+    assert "b" in ht and ht["b"] is None
+    assert "c" not in ht
+    with pytest.raises(KeyError):
+        ht["c"]
+    assert len(ht) == 2
+    assert sorted(ht) == ["a", "b"]
+    assert dict(ht.items()) == {"a": 1, "b": None}
+    assert ht.get("c", 0) == 0
+    del ht["a"]
+    with pytest.raises(KeyError):
+        del ht["a"]
+    assert len(ht) == 1
+    ht.update({"x": 10, "y": 20})
+    assert ht == {"b": None, "x": 10, "y": 20}
+    ht.clear()
+    assert len(ht) == 0 and ht.size == 8
+
+def test_hash_table_bulk_operations():
+    ht = HashTable()
+    ht.insert("keep", 0)
+    ht.insert_many((i, str(i)) for i in range(10_000))
+    ht.insert_many({1: "one", "new": 1})
+    assert len(ht) == 10_002
+    assert ht.get_many([1, 2, "new", "missing"], default=-1) == ["one", "2", 1, -1]
+
+    assert ht.delete_many(range(0, 10_000)) == 10_000
+    assert ht.delete_many(["missing"]) == 0
+    assert len(ht) == 2
+    assert ht.size <= 64
+    assert dict(ht.items()) == {"keep": 0, "new": 1}
+
+def test_hash_table_bulk_insert_reuses_tombstones():
+    ht = HashTable(size=8)
+    ht.insert_many([(0, "a"), (8, "b")])
+    ht.delete(0)
+    ht.insert_many([(16, "c"), (8, "B")])
+    assert len(ht) == 2
+    assert ht.get_many([0, 8, 16]) == [None, "B", "c"]
+
+
+def test_concurrent_hash_table_basic():
+    ht = ConcurrentHashTable(stripes=4)
+    ht.insert("apple", 100)
+    ht["banana"] = None
+    assert ht.search("apple") == 100
+    assert "banana" in ht and ht["banana"] is None
+    assert ht.search("durian") is None
+    assert ht.delete("apple") is True
+    assert ht.delete("apple") is False
+    assert len(ht) == 1
+    assert dict(ht.items()) == {"banana": None}
+    assert ConcurrentHashTable(stripes=5).stripes == 8
+
+def test_concurrent_hash_table_threads():
+    ht = ConcurrentHashTable(stripes=8)
+    n = 5000
+    errors = []
+
+    def writer(offset):
+        for i in range(offset, n, 4):
+            ht[i] = i * 2
+        # 半分を削除して、縮小（テーブルの差し替え）も起こす
+        for i in range(offset, n, 8):
+            del ht[i]
+
+    def reader():
+        for _ in range(3):
+            for i in range(n):
+                value = ht.search(i)
+                if value is not None and value != i * 2:
+                    errors.append((i, value))
+
+    threads = [threading.Thread(target=writer, args=(k,)) for k in range(4)]
+    threads += [threading.Thread(target=reader) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    expected = {i: i * 2 for i in range(n) if (i % 4) != (i % 8)}
+    assert dict(ht.items()) == expected
+    assert len(ht) == len(expected)
@@ -28,3 +28,39 @@ def test_heap_sort_empty():
     data = []
     expected = []
     assert heap_sort(data) == expected
+
+def test_heap_sort_random():
+    import random
+    rng = random.Random(0)
+    for n in [2, 3, 10, 100, 1000]:
+        data = [rng.randint(0, n) for _ in range(n)]
+        assert heap_sort(data[:]) == sorted(data)
+
+def test_heapify_comparisons_halved():
+    # ボトムアップ方式では、1段あたりの比較は左右の子どうしの1回だけ
+    import random
+    from sort.heap_sort import _heapify
+
+    class Counted:
+        comparisons = 0
+
+        def __init__(self, value):
+            self.value = value
+
+        def __lt__(self, other):
+            Counted.comparisons += 1
+            return self.value < other.value
+
+        def __gt__(self, other):
+            Counted.comparisons += 1
+            return self.value > other.value
+
+    rng = random.Random(1)
+    n = 1023
+    data = sorted((Counted(rng.random()) for _ in range(n)), key=lambda c: -c.value)
+    # 最大ヒープ（降順のリスト）のルートを最小値に置き換えると、葉まで下りる
+    data[0] = Counted(-1.0)
+    _heapify(data, n, 0)
+    # 高さ9の木: 下りで9回 + 戻りで1回
+    assert Counted.comparisons <= 10
+    assert all(not data[(i - 1) // 2] < data[i] for i in range(1, n))
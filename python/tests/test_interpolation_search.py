@@ -0,0 +1,44 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+from search.interpolation_search import interpolation_search
+
+def test_interpolation_search_found():
+    data = [10, 20, 30, 40, 50]
+    assert interpolation_search(data, 30) == 2
+    assert interpolation_search(data, 10) == 0
+    assert interpolation_search(data, 50) == 4
+
+def test_interpolation_search_not_found():
+    data = [10, 20, 30, 40, 50]
+    assert interpolation_search(data, 25) == -1
+    assert interpolation_search(data, 5) == -1
+    assert interpolation_search(data, 55) == -1
+    assert interpolation_search([], 10) == -1
+
+def test_interpolation_search_duplicates_and_floats():
+    assert interpolation_search([7, 7, 7], 7) == 0
+    data = [0.5, 1.25, 2.0, 3.75]
+    assert interpolation_search(data, 2.0) == 2
+    assert interpolation_search(data, 2.5) == -1
+
+def test_interpolation_search_skewed_data():
+    # 値が指数的に偏ったデータでは推定が外れ続けるため、2分探索に切り替わる
+    data = [2 ** i for i in range(200)] + [2 ** 200 + i for i in range(1000)]
+    for i in range(0, len(data), 7):
+        assert data[interpolation_search(data, data[i])] == data[i]
+    assert interpolation_search(data, 3) == -1
+
+def test_interpolation_search_random():
+    rng = random.Random(0)
+    data = sorted(rng.sample(range(100_000), 5000))
+    present = set(data)
+    for target in rng.sample(range(100_000), 500):
+        index = interpolation_search(data, target)
+        if target in present:
+            assert data[index] == target
+        else:
+            assert index == -1
@@ -0,0 +1,67 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+import pytest
+
+from sort.bubble_sort import bubble_sort
+from sort.heap_sort import heap_sort
+from sort.insertion_sort import insertion_sort
+from sort.key_utils import keyed_sort
+from sort.merge_sort import merge_sort, merge_sort_bottom_up
+from sort.quick_sort import quick_sort
+from sort.selection_sort import selection_sort
+from sort.tim_sort import tim_sort
+
+SORTERS = [
+    bubble_sort,
+    selection_sort,
+    insertion_sort,
+    merge_sort,
+    merge_sort_bottom_up,
+    quick_sort,
+    heap_sort,
+    tim_sort,
+]
+
+records = [
+    {"name": "carol", "age": 35},
+    {"name": "alice", "age": 30},
+    {"name": "bob", "age": 25},
+    {"name": "dave", "age": 30},
+]
+
+def test_keyed_sort():
+    result = keyed_sort(records, merge_sort, key=lambda r: r["age"])
+    assert [r["name"] for r in result] == ["bob", "alice", "dave", "carol"]
+
+@pytest.mark.parametrize("sorter", SORTERS)
+def test_sort_with_key(sorter):
+    data = list(records)
+    result = sorter(data, key=lambda r: r["age"])
+    # キーが等しい要素（alice と dave）は元の順序のまま
+    assert [r["name"] for r in result] == ["bob", "alice", "dave", "carol"]
+
+@pytest.mark.parametrize("sorter", SORTERS)
+def test_sort_with_reverse(sorter):
+    data = list(records)
+    result = sorter(data, key=lambda r: r["age"], reverse=True)
+    # sorted() と同じく、降順でもキーが等しい要素は元の順序のまま
+    assert [r["name"] for r in result] == ["carol", "alice", "dave", "bob"]
+    assert sorter([3, 1, 2], reverse=True) == [3, 2, 1]
+
+@pytest.mark.parametrize("sorter", SORTERS)
+def test_key_called_once_per_element(sorter):
+    calls = []
+
+    def key(value):
+        calls.append(value)
+        return -value
+
+    rng = random.Random(0)
+    data = [rng.randint(0, 100) for _ in range(200)]
+    result = sorter(list(data), key=key)
+    assert len(calls) == len(data)
+    assert result == sorted(data, key=lambda v: -v)
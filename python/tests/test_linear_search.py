@@ -2,7 +2,11 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from search.linear_search import linear_search
+import array
+
+import pytest
+
+from search.linear_search import find_all, find_any, find_if, linear_search
 
 def test_linear_search_found():
     data = [10, 20, 30, 40, 50]
@@ -22,3 +26,43 @@ def test_linear_search_strings():
     data = ["apple", "banana", "cherry"]
     assert linear_search(data, "banana") == 1
     assert linear_search(data, "grape") == -1
+
+def test_linear_search_fast_paths():
+    assert linear_search((3, 1, 4, 1), 1) == 1
+    assert linear_search(array.array('q', [3, 1, 4]), 4) == 2
+    assert linear_search(array.array('q', [3, 1, 4]), "x") == -1
+    assert linear_search(b"hello", ord("l")) == 2
+    assert linear_search(bytearray(b"hello"), 300) == -1
+    assert linear_search(b"hello", "l") == -1
+    assert linear_search(range(10), 7) == 7
+
+def test_linear_search_numpy():
+    np = pytest.importorskip("numpy")
+    arr = np.array([5, 3, 8, 3], dtype=np.int32)
+    assert linear_search(arr, 3) == 1
+    assert linear_search(arr, 9) == -1
+    assert linear_search(arr, 2 ** 70) == -1
+    assert linear_search(memoryview(array.array('d', [1.5, 2.5])), 2.5) == 1
+    assert find_all(arr, 3) == [1, 3]
+    assert find_any(arr, [8, 9]) == 2
+    assert find_any(arr, [9]) == -1
+
+def test_find_all():
+    data = [1, 2, 1, 3, 1]
+    assert find_all(data, 1) == [0, 2, 4]
+    assert find_all(data, 9) == []
+    assert find_all(b"banana", ord("a")) == [1, 3, 5]
+    assert find_all("abca", "a") == [0, 3]
+    assert find_all(range(0, 10, 3), 6) == [2]
+
+def test_find_any():
+    data = ["x", "y", "z", "y"]
+    assert find_any(data, {"z", "y"}) == 1
+    assert find_any(data, ["q"]) == -1
+    assert find_any(data, []) == -1
+    assert find_any([[1], 2], [2]) == 1
+
+def test_find_if():
+    assert find_if([1, 4, 6, 9], lambda x: x % 2 == 0) == 1
+    assert find_if([1, 3], lambda x: x % 2 == 0) == -1
+    assert find_if((x * x for x in range(10)), lambda x: x > 10) == 4
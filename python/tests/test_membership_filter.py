@@ -0,0 +1,107 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+
+from search.hash_search import HashTable
+from search.linear_search import linear_search
+from search.membership_filter import BloomFilter, CuckooFilter
+
+@pytest.mark.parametrize("make", [lambda n: BloomFilter(n), lambda n: CuckooFilter(n)])
+def test_no_false_negatives(make):
+    f = make(10_000)
+    keys = [f"key-{i}" for i in range(5_000)] + list(range(5_000))
+    for key in keys:
+        assert f.add(key)
+    assert len(f) == 10_000
+    assert all(key in f for key in keys)
+
+def test_bloom_false_positive_rate():
+    bloom = BloomFilter(10_000, error_rate=0.01)
+    bloom.update(range(10_000))
+    false_positives = sum(1 for i in range(10_000, 60_000) if i in bloom)
+    assert false_positives / 50_000 < 0.02
+
+def test_cuckoo_false_positive_rate_and_discard():
+    cuckoo = CuckooFilter(10_000)
+    assert cuckoo.update(range(10_000))
+    false_positives = sum(1 for i in range(10_000, 60_000) if i in cuckoo)
+    assert false_positives / 50_000 < 0.05
+    for i in range(0, 10_000, 2):
+        assert cuckoo.discard(i)
+    assert len(cuckoo) == 5_000
+    assert all(i in cuckoo for i in range(1, 10_000, 2))
+    assert sum(1 for i in range(0, 10_000, 2) if i in cuckoo) < 500
+
+def test_cuckoo_full_keeps_victim():
+    cuckoo = CuckooFilter(8, bucket_size=1)
+    added = []
+    for i in range(100):
+        if not cuckoo.add(i):
+            added.append(i)
+            break
+        added.append(i)
+    assert not cuckoo.add("more")
+    # 格納できなかった指紋も含めて、追加したキーは全て含まれている
+    assert all(key in cuckoo for key in added)
+    assert cuckoo.discard(added[0])
+    assert all(key in cuckoo for key in added[1:])
+
+@pytest.mark.parametrize("cls", [BloomFilter, CuckooFilter])
+def test_serialization_round_trip(cls):
+    f = cls(1_000)
+    f.update(f"key-{i}" for i in range(1_000))
+    restored = cls.from_bytes(f.to_bytes())
+    assert restored.to_bytes() == f.to_bytes()
+    assert len(restored) == 1_000
+    assert all(f"key-{i}" in restored for i in range(1_000))
+
+def test_from_bytes_rejects_other_data():
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(CuckooFilter(10).to_bytes())
+    with pytest.raises(ValueError):
+        CuckooFilter.from_bytes(b"short")
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        BloomFilter(0)
+    with pytest.raises(ValueError):
+        BloomFilter(10, error_rate=1.0)
+    with pytest.raises(ValueError):
+        CuckooFilter(10, bucket_size=0)
+
+@pytest.mark.parametrize("cls", [BloomFilter, CuckooFilter])
+def test_hash_table_with_filter(cls):
+    ht = HashTable()
+    ht.insert_many((i, str(i)) for i in range(100))
+    ht.attach_filter(cls(16))
+    for i in range(100, 5_000):
+        ht.insert(i, str(i))
+    assert ht._filter.capacity >= 5_000
+    assert all(ht.search(i) == str(i) for i in range(5_000))
+    assert ht.get_many([1, -1, 4_999]) == ["1", None, "4999"]
+    assert -1 not in ht
+    for i in range(0, 5_000, 2):
+        assert ht.delete(i)
+    assert ht.delete_many(range(1, 100, 2)) == 50
+    assert all(i not in ht for i in range(100))
+    assert all(ht[i] == str(i) for i in range(101, 5_000, 2))
+    ht.clear()
+    ht.insert("a", 1)
+    assert ht.search("a") == 1 and "b" not in ht
+    assert isinstance(ht.detach_filter(), cls)
+    assert ht.search("a") == 1
+
+def test_attach_non_empty_filter():
+    bloom = BloomFilter(10)
+    bloom.add(1)
+    with pytest.raises(ValueError):
+        HashTable().attach_filter(bloom)
+
+def test_linear_search_prefilter():
+    data = [5, 3, 8, 1]
+    bloom = BloomFilter(len(data))
+    bloom.update(data)
+    assert linear_search(data, 8, prefilter=bloom) == 2
+    assert linear_search(data, 7, prefilter=bloom) == -1
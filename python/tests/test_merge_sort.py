@@ -28,3 +28,41 @@ def test_merge_sort_empty():
     data = []
     expected = []
     assert merge_sort(data) == expected
+
+def test_merge_sort_bottom_up():
+    import random
+    from sort.merge_sort import merge_sort_bottom_up
+    rng = random.Random(0)
+    for n in [0, 1, 2, 3, 7, 8, 100, 1025]:
+        data = [rng.randint(-50, 50) for _ in range(n)]
+        expected = sorted(data)
+        result = merge_sort_bottom_up(data)
+        # 破壊的メソッドなので、同じリストが返る
+        assert result is data
+        assert data == expected
+
+def test_merge_sort_bottom_up_stable():
+    from sort.merge_sort import merge_sort_bottom_up
+
+    class Item:
+        def __init__(self, key, label):
+            self.key = key
+            self.label = label
+
+        def __lt__(self, other):
+            return self.key < other.key
+
+    data = [Item(1, "a"), Item(0, "b"), Item(1, "c"), Item(0, "d")]
+    merge_sort_bottom_up(data)
+    assert [item.label for item in data] == ["b", "d", "a", "c"]
+
+def test_merge_sort_bottom_up_array_and_memoryview():
+    import array
+    from sort.merge_sort import merge_sort_bottom_up
+    data = array.array('i', [5, 3, 9, 1, 3, 0, -2])
+    merge_sort_bottom_up(data)
+    assert data.tolist() == [-2, 0, 1, 3, 3, 5, 9]
+
+    data = array.array('d', [2.5, -1.0, 0.5, 7.0, -3.5])
+    merge_sort_bottom_up(memoryview(data))
+    assert data.tolist() == [-3.5, -1.0, 0.5, 2.5, 7.0]
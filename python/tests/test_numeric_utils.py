@@ -0,0 +1,110 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import array
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from search.binary_search import binary_search, binary_search_many
+from sort.auto_sort import auto_sort
+from sort.bubble_sort import bubble_sort
+from sort.heap_sort import heap_sort
+from sort.insertion_sort import insertion_sort
+from sort.merge_sort import merge_sort, merge_sort_bottom_up
+from sort.numeric_utils import as_numeric_array, numeric_sort
+from sort.parallel_merge_sort import parallel_merge_sort
+from sort.quick_sort import quick_sort
+from sort.radix_sort import counting_sort, radix_sort
+from sort.selection import partial_sort, select_kth, top_k
+from sort.selection_sort import selection_sort
+from sort.tim_sort import tim_sort
+
+IN_PLACE_SORTERS = [
+    bubble_sort, selection_sort, insertion_sort, heap_sort, quick_sort,
+    tim_sort, merge_sort_bottom_up, radix_sort, counting_sort, auto_sort,
+]
+
+def _values(n=500):
+    rng = random.Random(0)
+    return [rng.randint(-1000, 1000) for _ in range(n)]
+
+def test_as_numeric_array_is_zero_copy():
+    buf = array.array('i', [3, 1, 2])
+    arr = as_numeric_array(buf)
+    assert np.shares_memory(arr, np.asarray(memoryview(buf)))
+    assert as_numeric_array(memoryview(buf)) is not None
+    nd = np.array([1.0, 2.0])
+    assert as_numeric_array(nd) is nd
+
+def test_as_numeric_array_rejects_generic_input():
+    assert as_numeric_array([1, 2, 3]) is None
+    assert as_numeric_array(np.array(["a", "b"])) is None
+    assert as_numeric_array(np.zeros((2, 2))) is None
+    assert as_numeric_array(memoryview(b"abc"), writable=True) is None
+
+@pytest.mark.parametrize("sorter", IN_PLACE_SORTERS)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_in_place_sorters_on_buffers(sorter, reverse):
+    values = _values()
+    expected = sorted(values, reverse=reverse)
+
+    nd = np.array(values, dtype=np.int64)
+    assert sorter(nd, reverse=reverse) is nd
+    assert nd.tolist() == expected
+
+    buf = array.array('q', values)
+    assert sorter(buf, reverse=reverse) is buf
+    assert buf.tolist() == expected
+
+def test_sorters_on_non_contiguous_view():
+    nd = np.array(_values(), dtype=np.float64)
+    view = nd[::2]
+    expected = sorted(view.tolist())
+    quick_sort(view)
+    assert view.tolist() == expected
+
+@pytest.mark.parametrize("sorter", [merge_sort, parallel_merge_sort])
+def test_non_destructive_sorters_on_buffers(sorter):
+    values = _values()
+    nd = np.array(values, dtype=np.int32)
+    assert sorter(nd) == sorted(values)
+    assert sorter(nd, reverse=True) == sorted(values, reverse=True)
+    assert nd.tolist() == values
+
+def test_radix_sort_rejects_float_buffers():
+    with pytest.raises(TypeError):
+        radix_sort(array.array('d', [1.5, 0.5]))
+
+def test_key_uses_pure_python_path():
+    nd = np.array([3, -1, 2])
+    tim_sort(nd, key=abs)
+    assert nd.tolist() == [-1, 2, 3]
+
+def test_numeric_sort_skips_lists():
+    data = [3, 1, 2]
+    assert numeric_sort(data, "stable") is False
+    assert data == [3, 1, 2]
+
+def test_selection_on_buffers():
+    values = _values(1000)
+    nd = np.array(values)
+    assert select_kth(nd, 10) == sorted(values)[10]
+    nd = np.array(values)
+    partial_sort(nd, 20)
+    assert nd[:20].tolist() == sorted(values)[:20]
+    assert top_k(np.array(values), 5) == sorted(values, reverse=True)[:5]
+
+def test_binary_search_on_buffers():
+    nd = np.array([10, 20, 30, 40, 50])
+    assert binary_search(nd, 30) == 2
+    assert binary_search(nd, 25) == -1
+    assert binary_search(nd, 55) == -1
+    assert binary_search(array.array('d', [0.5, 1.5]), 1.5) == 1
+
+def test_binary_search_many_on_buffers():
+    nd = np.array([10, 20, 20, 30])
+    assert binary_search_many(nd, [30, 5, 20, 99]) == [3, -1, 1, -1]
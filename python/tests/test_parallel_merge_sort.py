@@ -0,0 +1,41 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+import sort.parallel_merge_sort as pms
+from sort.numeric_utils import chunk_bounds
+from sort.parallel_merge_sort import parallel_merge_sort, _kway_merge
+
+def test_parallel_merge_sort_small():
+    data = [12, 11, 13, 5, 6, 7]
+    assert parallel_merge_sort(data, workers=2) == [5, 6, 7, 11, 12, 13]
+    # 元のリストは変更されない
+    assert data == [12, 11, 13, 5, 6, 7]
+
+def test_parallel_merge_sort_empty():
+    assert parallel_merge_sort([], workers=2) == []
+
+def test_parallel_merge_sort_shared_memory(monkeypatch):
+    # しきい値を下げて、小さなデータでもプロセスを使う経路を通す
+    monkeypatch.setattr(pms, "_MIN_PARALLEL_SIZE", 10)
+    rng = random.Random(0)
+    ints = [rng.randint(-10**12, 10**12) for _ in range(1000)]
+    assert parallel_merge_sort(ints, workers=3) == sorted(ints)
+    floats = [rng.random() for _ in range(1000)]
+    assert parallel_merge_sort(floats, workers=3) == sorted(floats)
+
+def test_parallel_merge_sort_pickled(monkeypatch):
+    monkeypatch.setattr(pms, "_MIN_PARALLEL_SIZE", 10)
+    rng = random.Random(1)
+    words = ["".join(rng.choice("abc") for _ in range(3)) for _ in range(500)]
+    assert parallel_merge_sort(words, workers=4) == sorted(words)
+    assert parallel_merge_sort(words, workers=4, key=len, reverse=True) == sorted(words, key=len, reverse=True)
+
+def test_chunk_bounds():
+    assert chunk_bounds(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert chunk_bounds(2, 4) == [(0, 1), (1, 2)]
+
+def test_kway_merge():
+    assert _kway_merge([[1, 4, 7], [], [2, 5], [0, 9]]) == [0, 1, 2, 4, 5, 7, 9]
@@ -0,0 +1,91 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import subprocess
+
+import pytest
+
+from search.hash_search import HashTable
+from search.persistent_hash_index import PersistentHashIndex, build_hash_index, main
+
+def test_build_and_search(tmp_path):
+    path = str(tmp_path / "index.bin")
+    pairs = [(f"key{i}", f"value{i}") for i in range(1000)]
+    assert build_hash_index(path, pairs + [("key5", "updated")]) == 1000
+
+    with PersistentHashIndex(path) as index:
+        assert len(index) == 1000
+        assert index.search("key0") == "value0"
+        assert index.search("key5") == "updated"
+        assert index.search("missing") is None
+        assert "key999" in index and "missing" not in index and 1 not in index
+        with pytest.raises(KeyError):
+            index["missing"]
+        assert sorted(index) == sorted(k for k, _ in pairs)
+
+def test_bytes_and_str_are_distinct(tmp_path):
+    path = str(tmp_path / "index.bin")
+    build_hash_index(path, {"a": b"\x00\x01", b"a": "text", "": ""})
+    with PersistentHashIndex(path) as index:
+        assert index.search("a") == b"\x00\x01"
+        assert index.search(b"a") == "text"
+        assert index.search("") == ""
+        view = index.search_view("a")
+        assert bytes(view) == b"\x00\x01"
+        view.release()
+
+def test_build_from_hash_table(tmp_path):
+    path = str(tmp_path / "index.bin")
+    ht = HashTable()
+    ht.insert_many((str(i), str(i * i)) for i in range(100))
+    build_hash_index(path, ht)
+    with PersistentHashIndex(path) as index:
+        assert dict(index.items()) == dict(ht.items())
+
+def test_index_is_shared_across_processes(tmp_path):
+    path = str(tmp_path / "index.bin")
+    build_hash_index(path, {"shared": "yes"})
+    src = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+    code = (f"import sys; sys.path.insert(0, {src!r}); "
+            "from search.persistent_hash_index import PersistentHashIndex; "
+            f"print(PersistentHashIndex({path!r}).search('shared'))")
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True).stdout.strip() == "yes"
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"not an index at all, just some bytes")
+    with pytest.raises(ValueError):
+        PersistentHashIndex(str(path))
+
+def test_failed_build_removes_temporary_file(tmp_path, monkeypatch):
+    def fail(src, dst):
+        raise OSError("replace failed")
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        build_hash_index(str(tmp_path / "index.bin"), {"a": "1"})
+    assert os.listdir(tmp_path) == []
+
+def test_truncated_file(tmp_path):
+    path = tmp_path / "index.bin"
+    build_hash_index(str(path), {f"key{i}": f"value{i}" for i in range(100)})
+    data = path.read_bytes()
+    # スロットの配列の途中で切れたファイルと、空のファイルは開くときに検出する
+    for size in (40, 0):
+        path.write_bytes(data[:size])
+        with pytest.raises(ValueError, match="index.bin"):
+            PersistentHashIndex(str(path))
+    # 値ヒープの途中で切れたファイルは、切れた部分のレコードを読んだときに検出する
+    path.write_bytes(data[:-20])
+    with PersistentHashIndex(str(path)) as index:
+        with pytest.raises(ValueError, match="index.bin"):
+            dict(index.items())
+
+def test_command_line(tmp_path, capsys):
+    source = tmp_path / "pairs.tsv"
+    source.write_text("apple\t100\nbanana\t200\n", encoding="utf-8")
+    index = str(tmp_path / "index.bin")
+    assert main(["build", str(source), index]) == 0
+    assert main(["get", index, "banana"]) == 0
+    assert "banana\t200" in capsys.readouterr().out
+    assert main(["get", index, "cherry"]) == 1
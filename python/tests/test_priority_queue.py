@@ -0,0 +1,85 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+import pytest
+
+from sort.priority_queue import Heap, PriorityQueue
+
+def test_heap_push_pop():
+    heap = Heap()
+    for value in [5, 3, 8, 1, 9, 2]:
+        heap.push(value)
+    assert len(heap) == 6
+    assert heap.peek() == 1
+    assert [heap.pop() for _ in range(6)] == [1, 2, 3, 5, 8, 9]
+    assert not heap
+    with pytest.raises(IndexError):
+        heap.pop()
+
+@pytest.mark.parametrize("arity", [2, 3, 4, 8])
+def test_heap_arity(arity):
+    rng = random.Random(arity)
+    data = [rng.randint(0, 1000) for _ in range(500)]
+    heap = Heap(data, arity=arity)
+    assert [heap.pop() for _ in range(len(data))] == sorted(data)
+
+def test_heap_key_is_fifo_for_ties():
+    heap = Heap(key=lambda task: task[0])
+    for task in [(2, "b"), (1, "a"), (2, "c"), (1, "d")]:
+        heap.push(task)
+    assert [heap.pop()[1] for _ in range(4)] == ["a", "d", "b", "c"]
+
+def test_heap_pushpop_and_replace():
+    heap = Heap([3, 5, 7])
+    # 追加する値が最小ならそのまま返る
+    assert heap.pushpop(1) == 1
+    assert heap.pushpop(4) == 3
+    assert heap.replace(0) == 4
+    assert [heap.pop() for _ in range(len(heap))] == [0, 5, 7]
+
+def test_priority_queue_basic():
+    pq = PriorityQueue()
+    pq.push("a", 5)
+    pq.push("b", 2)
+    pq.push("c", 9)
+    assert "a" in pq
+    assert len(pq) == 3
+    assert pq.peek() == ("b", 2)
+    assert pq.pop() == ("b", 2)
+    assert "b" not in pq
+
+def test_priority_queue_update_and_remove():
+    pq = PriorityQueue(arity=3)
+    for i, priority in enumerate([50, 40, 30, 20, 10]):
+        pq.push(f"task{i}", priority)
+    pq.update("task0", 1)     # decrease-key
+    pq.update("task4", 100)   # increase-key
+    pq.remove("task2")
+    assert pq.priority("task0") == 1
+    order = [pq.pop()[0] for _ in range(len(pq))]
+    assert order == ["task0", "task3", "task1", "task4"]
+    with pytest.raises(KeyError):
+        pq.update("missing", 1)
+
+def test_priority_queue_random_against_sorted():
+    rng = random.Random(0)
+    pq = PriorityQueue(arity=4)
+    expected = {}
+    for step in range(2000):
+        item = rng.randrange(200)
+        action = rng.random()
+        if action < 0.6:
+            priority = rng.randint(0, 1000)
+            pq.push(item, priority)
+            expected[item] = priority
+        elif action < 0.8 and item in expected:
+            pq.remove(item)
+            del expected[item]
+        elif pq:
+            got_item, got_priority = pq.pop()
+            assert got_priority == min(expected.values())
+            assert expected.pop(got_item) == got_priority
+    assert len(pq) == len(expected)
@@ -28,3 +28,30 @@ def test_quick_sort_empty():
     data = []
     expected = []
     assert quick_sort(data) == expected
+
+def test_quick_sort_large_sorted_and_reversed():
+    # 基本形では再帰上限を超えてしまう大きさでも、イントロソートなら処理できる
+    data = list(range(5000))
+    assert quick_sort(data[:]) == data
+    assert quick_sort(data[::-1]) == data
+
+def test_quick_sort_many_duplicates():
+    data = [i % 3 for i in range(1000)]
+    assert quick_sort(data[:]) == sorted(data)
+
+def test_quick_sort_random():
+    import random
+    rng = random.Random(0)
+    data = [rng.randint(-1000, 1000) for _ in range(2000)]
+    assert quick_sort(data[:]) == sorted(data)
+
+def test_quick_sort_classic():
+    data = [10, 7, 8, 9, 1, 5]
+    assert quick_sort(data, introsort=False) == [1, 5, 7, 8, 9, 10]
+
+def test_introsort_heap_sort_fallback():
+    # 深さの上限を0にすると、すぐにヒープソートへ切り替わる
+    from sort.quick_sort import _introsort_loop
+    data = list(range(100, 0, -1))
+    _introsort_loop(data, 0, len(data) - 1, 0)
+    assert data == list(range(1, 101))
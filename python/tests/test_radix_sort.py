@@ -0,0 +1,57 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+import pytest
+
+import sort.radix_sort as radix
+from sort.radix_sort import radix_sort, counting_sort, msd_radix_sort
+
+def test_radix_sort_basic():
+    data = [170, 45, 75, 90, 802, 24, 2, 66]
+    assert radix_sort(data) == [2, 24, 45, 66, 75, 90, 170, 802]
+
+def test_radix_sort_negative_and_large():
+    rng = random.Random(0)
+    data = [rng.randint(-2**63, 2**63 - 1) for _ in range(500)] + [0, -1, 1]
+    assert radix_sort(data[:]) == sorted(data)
+
+def test_radix_sort_empty():
+    assert radix_sort([]) == []
+
+def test_radix_sort_key_reverse_stable():
+    records = [("a", 3), ("b", 1), ("c", 3), ("d", 2)]
+    assert radix_sort(records[:], key=lambda r: r[1]) == [("b", 1), ("d", 2), ("a", 3), ("c", 3)]
+    assert radix_sort(records[:], key=lambda r: r[1], reverse=True) == [("a", 3), ("c", 3), ("d", 2), ("b", 1)]
+
+def test_radix_sort_rejects_non_int():
+    with pytest.raises(TypeError):
+        radix_sort([1.5, 2.0])
+
+def test_counting_sort():
+    rng = random.Random(1)
+    data = [rng.randint(-5, 5) for _ in range(300)]
+    assert counting_sort(data[:]) == sorted(data)
+    records = [(v, i) for i, v in enumerate(data)]
+    assert counting_sort(records[:], key=lambda r: r[0], reverse=True) == sorted(records, key=lambda r: r[0], reverse=True)
+
+def test_msd_radix_sort():
+    rng = random.Random(2)
+    data = [bytes(rng.randint(97, 100) for _ in range(rng.randint(0, 6))) for _ in range(500)]
+    assert msd_radix_sort(data[:]) == sorted(data)
+    assert msd_radix_sort(data[:], reverse=True) == sorted(data, reverse=True)
+
+def test_msd_radix_sort_strings_with_key():
+    words = ["banana", "apple", "", "app", "cherry", "apple"]
+    assert msd_radix_sort(words[:], key=str.encode) == sorted(words)
+
+def test_radix_sort_numpy_path(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(radix, "_NUMPY_THRESHOLD", 1)
+    rng = random.Random(3)
+    data = [rng.randint(-10**15, 10**15) for _ in range(2000)]
+    assert radix_sort(data[:]) == sorted(data)
+    records = [(v, i) for i, v in enumerate(data)]
+    assert radix_sort(records[:], key=lambda r: r[0] % 100) == sorted(records, key=lambda r: r[0] % 100)
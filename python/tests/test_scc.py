@@ -0,0 +1,56 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+from graph.bfs import bfs
+from graph.csr_graph import CSRGraph
+from graph.scc import strongly_connected_components
+
+def _normalize(components):
+    return sorted(sorted(component) for component in components)
+
+def _reference(g):
+    # 互いに到達できるノードをまとめる（O(V(V + E)) の素朴な方法）
+    reach = {node: set(bfs(g, node)) for node in g}
+    components = []
+    seen = set()
+    for node in g:
+        if node not in seen:
+            component = [other for other in g if other in reach[node] and node in reach[other]]
+            seen.update(component)
+            components.append(component)
+    return components
+
+def test_scc():
+    g = {
+        'a': ['b'],
+        'b': ['c', 'e', 'f'],
+        'c': ['d', 'g'],
+        'd': ['c', 'h'],
+        'e': ['a', 'f'],
+        'f': ['g'],
+        'g': ['f', 'h'],
+        'h': ['h'],
+    }
+    components = strongly_connected_components(g)
+    assert _normalize(components) == [['a', 'b', 'e'], ['c', 'd'], ['f', 'g'], ['h']]
+    # 行き先の成分が先に返る
+    order = [sorted(component)[0] for component in components]
+    assert order.index('h') < order.index('f') < order.index('c') < order.index('a')
+
+def test_scc_random_graphs():
+    rng = random.Random(0)
+    for _ in range(20):
+        n = 30
+        g = {i: [rng.randrange(n) for _ in range(rng.randrange(3))] for i in range(n)}
+        assert _normalize(strongly_connected_components(g)) == _normalize(_reference(g))
+        csr = CSRGraph.from_adjacency(g)
+        assert _normalize(strongly_connected_components(csr)) == _normalize(_reference(g))
+
+def test_scc_long_cycle():
+    n = 200_000
+    cycle = {i: [(i + 1) % n] for i in range(n)}
+    components = strongly_connected_components(cycle)
+    assert len(components) == 1 and len(components[0]) == n
@@ -0,0 +1,65 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+import pytest
+
+import sort.selection as selection
+from sort.selection import select_kth, partial_sort, top_k
+
+def test_select_kth():
+    rng = random.Random(0)
+    for n in [1, 5, 17, 100, 1000]:
+        data = [rng.randint(0, 50) for _ in range(n)]
+        expected = sorted(data)
+        for k in {0, n // 2, n - 1}:
+            work = data[:]
+            assert select_kth(work, k) == expected[k]
+            # k 番目より前は全て以下、後は全て以上
+            assert all(v <= work[k] for v in work[:k])
+            assert all(v >= work[k] for v in work[k + 1:])
+
+def test_select_kth_sorted_and_equal():
+    data = list(range(5000))
+    assert select_kth(data[:], 1234) == 1234
+    assert select_kth([7] * 3000, 1500) == 7
+
+def test_select_kth_many_duplicates(monkeypatch):
+    # 3種類の値だけのデータでも、ヒープソートへの切り替えに頼らずに求まる
+    def fail(*args, **kwargs):
+        raise AssertionError("select_kth fell back to heap_sort")
+    monkeypatch.setattr(selection, "heap_sort", fail)
+    rng = random.Random(5)
+    data = [rng.choice("abc") for _ in range(20_000)]
+    expected = sorted(data)
+    for k in (0, 6_000, 13_333, 19_999):
+        work = data[:]
+        assert select_kth(work, k) == expected[k]
+        assert all(x <= work[k] for x in work[:k])
+        assert all(work[k] <= x for x in work[k + 1:])
+
+def test_select_kth_out_of_range():
+    with pytest.raises(IndexError):
+        select_kth([1, 2, 3], 3)
+
+def test_partial_sort():
+    rng = random.Random(1)
+    data = [rng.randint(0, 10**6) for _ in range(2000)]
+    result = partial_sort(data[:], 100)
+    assert result[:100] == sorted(data)[:100]
+    assert sorted(result) == sorted(data)
+    assert partial_sort([3, 1, 2], 10) == [1, 2, 3]
+
+def test_top_k():
+    rng = random.Random(2)
+    data = [rng.randint(0, 1000) for _ in range(5000)]
+    assert top_k(iter(data), 10) == sorted(data, reverse=True)[:10]
+    assert top_k(data, 0) == []
+    assert top_k([1, 2], 5) == [2, 1]
+
+def test_top_k_key_ties_keep_first_seen():
+    records = [("a", 3), ("b", 5), ("c", 3), ("d", 5), ("e", 1)]
+    key = lambda r: r[1]
+    assert top_k(records, 3, key=key) == sorted(records, key=key, reverse=True)[:3]
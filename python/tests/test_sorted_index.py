@@ -0,0 +1,37 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import bisect
+import random
+
+from search.sorted_index import SortedIndex
+
+def test_search_matches_leftmost_index():
+    rng = random.Random(0)
+    for n in range(40):
+        data = sorted(rng.randint(0, 20) for _ in range(n))
+        index = SortedIndex(data)
+        assert len(index) == n
+        for target in range(-1, 22):
+            left = bisect.bisect_left(data, target)
+            expected = left if left < n and data[left] == target else -1
+            assert index.search(target) == expected
+            assert index.lower_bound(target) == left
+            assert (target in index) == (expected != -1)
+
+def test_storage_type():
+    assert SortedIndex([1, 2, 3]).typecode == 'q'
+    assert SortedIndex([0.5, 1.5]).typecode == 'd'
+    assert SortedIndex([2 ** 70]).typecode is None
+
+def test_string_keys():
+    data = ["apple", "banana", "cherry", "date"]
+    index = SortedIndex(data)
+    assert index.typecode is None
+    assert index.search_many(["cherry", "fig", "apple"]) == [2, -1, 0]
+
+def test_empty():
+    index = SortedIndex([])
+    assert index.search(1) == -1
+    assert index.lower_bound(1) == 0
@@ -0,0 +1,66 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+
+from sort.tim_sort import tim_sort
+
+def test_tim_sort_basic():
+    data = [12, 11, 13, 5, 6, 7]
+    expected = [5, 6, 7, 11, 12, 13]
+    assert tim_sort(data) == expected
+
+def test_tim_sort_sorted():
+    data = [1, 2, 3, 4, 5]
+    expected = [1, 2, 3, 4, 5]
+    assert tim_sort(data) == expected
+
+def test_tim_sort_reverse():
+    data = [5, 4, 3, 2, 1]
+    expected = [1, 2, 3, 4, 5]
+    assert tim_sort(data) == expected
+
+def test_tim_sort_duplicates():
+    data = [4, 2, 4, 2, 1]
+    expected = [1, 2, 2, 4, 4]
+    assert tim_sort(data) == expected
+
+def test_tim_sort_empty():
+    data = []
+    expected = []
+    assert tim_sort(data) == expected
+
+def test_tim_sort_random_sizes():
+    rng = random.Random(0)
+    for n in [31, 32, 33, 64, 100, 1000, 5000]:
+        data = [rng.randint(0, n) for _ in range(n)]
+        assert tim_sort(data[:]) == sorted(data)
+
+def test_tim_sort_concatenated_runs():
+    # ソート済みの塊を連結したデータ（ギャロッピングが効く）
+    rng = random.Random(1)
+    data = []
+    for _ in range(20):
+        start = rng.randint(0, 1000)
+        chunk = list(range(start, start + rng.randint(1, 300)))
+        if rng.random() < 0.5:
+            chunk.reverse()
+        data.extend(chunk)
+    assert tim_sort(data[:]) == sorted(data)
+
+def test_tim_sort_stable():
+    # (キー, 元の位置) の組で、キーだけを比較するクラス
+    class Item:
+        def __init__(self, key, index):
+            self.key = key
+            self.index = index
+
+        def __lt__(self, other):
+            return self.key < other.key
+
+    rng = random.Random(2)
+    keys = [rng.randint(0, 10) for _ in range(2000)]
+    items = [Item(k, i) for i, k in enumerate(keys)]
+    tim_sort(items)
+    assert [(item.key, item.index) for item in items] == sorted((k, i) for i, k in enumerate(keys))
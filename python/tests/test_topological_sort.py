@@ -0,0 +1,45 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+
+from graph.csr_graph import CSRGraph
+from graph.topological_sort import find_cycle, has_cycle, topological_sort
+
+dag = {
+    'shirt': ['tie', 'belt'],
+    'tie': ['jacket'],
+    'pants': ['shoes', 'belt'],
+    'belt': ['jacket'],
+    'socks': ['shoes'],
+}
+
+def _assert_topological(g, order):
+    position = {node: i for i, node in enumerate(order)}
+    for node, neighbors in g.items():
+        for neighbor in neighbors:
+            assert position[node] < position[neighbor]
+
+def test_topological_sort():
+    order = topological_sort(dag)
+    assert sorted(order) == sorted({'shirt', 'tie', 'belt', 'jacket', 'pants', 'shoes', 'socks'})
+    _assert_topological(dag, order)
+    assert topological_sort(CSRGraph.from_adjacency(dag)) == order
+
+def test_topological_sort_cycle():
+    with pytest.raises(ValueError):
+        topological_sort({'A': ['B'], 'B': ['C'], 'C': ['A']})
+
+def test_topological_sort_long_chain():
+    n = 200_000
+    chain = {i: [i + 1] for i in range(n)}
+    assert topological_sort(chain) == list(range(n + 1))
+
+def test_find_cycle():
+    assert find_cycle(dag) is None
+    assert not has_cycle(dag)
+    g = {'A': ['B'], 'B': ['C', 'D'], 'C': [], 'D': ['E'], 'E': ['B']}
+    assert find_cycle(g) == ['B', 'D', 'E']
+    assert has_cycle(g)
+    assert find_cycle({'A': ['A']}) == ['A']